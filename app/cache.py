@@ -0,0 +1,66 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Entries stored before the first sweep of the expired ones
+SWEEP_MIN_ENTRIES = 256
+
+
+class TTLCache:
+    """
+    Process-wide read-through cache, whose entries expire after a time to live. Keys are tuples, so that entries can be
+    invalidated by prefix, e.g. all the entries of an agent.
+
+    A load started before an invalidation does not store its result, which could be stale. Expired entries are swept
+    on write whenever the entries have doubled since the previous sweep, so that the keys of the agents and of the
+    users gone do not pile up for the life of the process, at an amortized constant cost per write.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._generation = 0
+        self._sweep_at = SWEEP_MIN_ENTRIES
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _sweep(self):
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        self._sweep_at = max(SWEEP_MIN_ENTRIES, 2 * len(self._entries))
+
+    def get(self, key: Tuple, loader: Callable[[], T], ttl: float) -> T:
+        if ttl <= 0:
+            return loader()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            generation = self._generation
+
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + ttl, value)
+                if len(self._entries) >= self._sweep_at:
+                    self._sweep()
+        return value
+
+    def invalidate(self, *prefix: Any):
+        """Drop the entries whose key starts with the prefix, or all of them when no prefix is given."""
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[:len(prefix)] == prefix]:
+                del self._entries[key]
+
+
+_cache = TTLCache()
+
+
+def get_cache() -> TTLCache:
+    return _cache
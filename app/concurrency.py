@@ -0,0 +1,158 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Hashable, List, Sequence, TypeVar
+from grinning_cat_python_sdk import GrinningCatClient, Configuration
+
+from app.env import get_env
+from app.utils import build_client_configuration, get_auth_scope, PooledGrinningCatClient
+
+T = TypeVar("T")
+
+SdkCall = Callable[[GrinningCatClient], Any]
+
+# Threads running the blocking SDK calls, shared by all the sessions and reused across the script runs
+_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="grinning-cat-sdk")
+# Threads running the event loops of the coroutines started from synchronous code, kept apart to never starve the above
+_loop_executor = ThreadPoolExecutor(thread_name_prefix="grinning-cat-loop")
+
+
+def gather_reads(*calls: SdkCall, limit: int | None = None) -> Awaitable[List[Any]]:
+    """
+    Run independent SDK reads concurrently on the event loop of the script run, so that the time spent tracks the
+    slowest call instead of the sum of all of them.
+
+    Each call receives a client of its own, since the SDK clients keep per-request state, sharing the process-wide
+    pool of connections. The configuration is built right away, as the session state is not available in other threads.
+
+    Args:
+        calls: Callables receiving a client and returning the result of one or more SDK calls.
+        limit: The maximum number of calls in flight. Defaults to GRINNING_CAT_FANOUT_CONCURRENCY.
+
+    Returns:
+        An awaitable of the results of the calls, in the same order of the calls. The first exception raised by a call
+        is propagated.
+    """
+    return _gather(calls, build_client_configuration(), limit or int(get_env("GRINNING_CAT_FANOUT_CONCURRENCY")))
+
+
+async def _gather(calls: Sequence[SdkCall], configuration: Configuration, limit: int) -> List[Any]:
+    semaphore = asyncio.Semaphore(limit)
+    loop = asyncio.get_running_loop()
+
+    async def run(call: SdkCall) -> Any:
+        async with semaphore:
+            return await loop.run_in_executor(_executor, _run_call, call, configuration)
+
+    return list(await asyncio.gather(*(run(call) for call in calls)))
+
+
+def run_call(call: SdkCall, configuration: Configuration) -> Awaitable[Any]:
+    """
+    Run a blocking SDK call, e.g. a write, in the threads of the SDK calls without blocking the event loop of the script
+    run. The call receives a client of its own, as in gather_reads.
+
+    Args:
+        call: Callable receiving a client and returning the result of one or more SDK calls.
+        configuration: The configuration of the client, built in the script run (see build_client_configuration).
+
+    Returns:
+        An awaitable of the result of the call.
+    """
+    return asyncio.get_running_loop().run_in_executor(_executor, _run_call, call, configuration)
+
+
+def _run_call(call: SdkCall, configuration: Configuration) -> Any:
+    client = PooledGrinningCatClient(configuration)
+    try:
+        return call(client)
+    finally:
+        client.close()
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine from synchronous code, e.g. a dialog. When the event loop of the script run is already running in
+    this thread, it is busy executing the caller, hence the coroutine runs in a loop of its own.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    return _loop_executor.submit(asyncio.run, coroutine).result()
+
+
+class RateLimiter:
+    """
+    Cap of the rate of the calls started from an event loop: each caller waits for its turn, spaced 1 / `rate` seconds
+    from the previous one, before starting its call.
+    """
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next_at = 0.0
+
+    async def wait(self):
+        now = asyncio.get_running_loop().time()
+        start_at = max(now, self._next_at)
+        self._next_at = start_at + self._interval
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+
+class SingleFlight:
+    """
+    Process-wide coalescing of identical calls: while a call is in flight, the callers asking for the same key wait
+    for it and share its result (or exception) instead of issuing their own.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._calls[key] = Future()
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return future.result()
+
+
+_single_flight = SingleFlight()
+
+
+def coalesced(endpoint: str, *args: Hashable, **kwargs: Hashable) -> SdkCall:
+    """
+    Build an SDK read whose concurrent identical calls, from any session, share one request to the backend.
+
+    Calls are identical when they have the same endpoint, the same arguments and the same auth scope, i.e. credentials
+    granting the same view (see get_auth_scope), so that results never cross permission boundaries. The scope is
+    resolved right away, as the session state is not available in other threads.
+
+    Args:
+        endpoint: The SDK method, as "<namespace>.<method>", e.g. "admins.get_available_plugins".
+        args: The positional arguments of the method.
+        kwargs: The keyword arguments of the method.
+
+    Returns:
+        A callable receiving a client, to be run directly or through gather_reads.
+    """
+    namespace, method = endpoint.split(".")
+    key = (endpoint, args, tuple(sorted(kwargs.items())), get_auth_scope())
+
+    def call(client: GrinningCatClient) -> Any:
+        return _single_flight.do(key, lambda: getattr(getattr(client, namespace), method)(*args, **kwargs))
+
+    return call
@@ -11,6 +11,24 @@ def get_supported_env_variables():
         "GRINNING_CAT_CHECK_INTERVAL": "20",
         "GRINNING_CAT_JWT_EXPIRE_MINUTES": str(60 * 24),  # JWT expires after 1 day
         "GRINNING_CAT_ENVIRONMENT": "prod",
+        "GRINNING_CAT_HTTP_POOL_SIZE": "10",  # number of hosts with a pool of connections
+        "GRINNING_CAT_HTTP_POOL_MAXSIZE": "20",  # max connections kept open per host
+        "GRINNING_CAT_HTTP_POOL_IDLE_TIMEOUT": "60",  # seconds before an idle connection is closed
+        "GRINNING_CAT_HTTP_CONNECT_TIMEOUT": "5",  # seconds to wait for a connection to the backend
+        "GRINNING_CAT_HTTP_READ_TIMEOUT": "120",  # seconds to wait for the backend to send data
+        "GRINNING_CAT_FANOUT_CONCURRENCY": "8",  # max concurrent SDK reads of a page
+        "GRINNING_CAT_BREAKER_FAILURE_THRESHOLD": "5",  # consecutive failures opening the circuit breaker
+        "GRINNING_CAT_BREAKER_BACKOFF_BASE": "1",  # seconds before the first probe of an open circuit breaker
+        "GRINNING_CAT_BREAKER_BACKOFF_MAX": "60",  # max seconds between two probes of an open circuit breaker
+        "GRINNING_CAT_CACHE_TTL": "30",  # seconds the cached reads from the backend are reused, 0 to disable the cache
+        "GRINNING_CAT_CHUNK_COUNTS_TTL": "600",  # seconds the chunk counts of the collections are reused
+        "GRINNING_CAT_UPLOAD_SPOOL_THRESHOLD": str(64 * 1024 * 1024),  # bytes of a spooled upload kept in memory
+        "GRINNING_CAT_EXPORT_MAX_POINTS": "100000",  # max points of a memory collection exported to a file
+        "GRINNING_CAT_UPLOAD_CONCURRENCY": "4",  # max files uploaded at the same time
+        "GRINNING_CAT_UPLOAD_MAX_ATTEMPTS": "3",  # attempts to upload a file on transient failures
+        "GRINNING_CAT_BULK_DELETE_CONCURRENCY": "8",  # max files or memory points deleted at the same time
+        "GRINNING_CAT_WEB_INGEST_RATE": "5",  # max URLs submitted per second by the bulk URL upload
+        "GRINNING_CAT_HASH_STORE_PATH": os.path.join("data", "upload_hashes.sqlite3"),  # hashes of the uploaded files
     }
 
 
@@ -0,0 +1,95 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Tuple
+
+from app.env import get_env
+
+
+class HashStore:
+    """
+    SHA-256 hashes of the files uploaded to the Knowledge Base of each agent, persisted in a SQLite database shared by
+    all the sessions, so that files already ingested can be recognized before uploading them again.
+    """
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        with self._lock:
+            if not self._initialized:
+                if directory := os.path.dirname(self._path):
+                    os.makedirs(directory, exist_ok=True)
+                with sqlite3.connect(self._path) as connection:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS file_hashes ("
+                        "agent_id TEXT NOT NULL, name TEXT NOT NULL, size INTEGER NOT NULL, sha256 TEXT NOT NULL, "
+                        "uploaded_at REAL NOT NULL, PRIMARY KEY (agent_id, name))"
+                    )
+                connection.close()
+                self._initialized = True
+
+        return sqlite3.connect(self._path, timeout=10)
+
+    def get(self, agent_id: str) -> Dict[str, Tuple[int, str]]:
+        """Get the size and the hash of the files uploaded to the agent, by name."""
+        connection = self._connect()
+        try:
+            rows = connection.execute("SELECT name, size, sha256 FROM file_hashes WHERE agent_id = ?", (agent_id,))
+            return {name: (size, sha256) for name, size, sha256 in rows}
+        finally:
+            connection.close()
+
+    def put(self, agent_id: str, name: str, size: int, sha256: str):
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO file_hashes (agent_id, name, size, sha256, uploaded_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (agent_id, name, size, sha256, time.time()),
+                )
+        finally:
+            connection.close()
+
+    def delete(self, agent_id: str | None = None, name: str | None = None):
+        """Delete the hash of a file of an agent, of all the files of an agent, or all of them."""
+        conditions = {"agent_id": agent_id, "name": name}
+        where = " AND ".join(f"{column} = ?" for column, value in conditions.items() if value is not None)
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    f"DELETE FROM file_hashes{' WHERE ' + where if where else ''}",
+                    tuple(value for value in conditions.values() if value is not None),
+                )
+        finally:
+            connection.close()
+
+    def delete_files(self, agent_id: str, names: Iterable[str]):
+        """Delete the hashes of some files of an agent, at once."""
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(
+                    "DELETE FROM file_hashes WHERE agent_id = ? AND name = ?", ((agent_id, name) for name in names)
+                )
+        finally:
+            connection.close()
+
+
+_hash_store: HashStore | None = None
+_lock = threading.Lock()
+
+
+def get_hash_store() -> HashStore:
+    """Get the process-wide store of the hashes of the uploaded files, at GRINNING_CAT_HASH_STORE_PATH."""
+    global _hash_store
+
+    if _hash_store is None:
+        with _lock:
+            if _hash_store is None:
+                _hash_store = HashStore(get_env("GRINNING_CAT_HASH_STORE_PATH"))
+    return _hash_store
@@ -4,7 +4,6 @@ import time
 from typing import Dict
 import streamlit as st
 from dotenv import load_dotenv
-from grinning_cat_python_sdk import GrinningCatClient
 from streamlit_js_eval import get_cookie
 
 from app.constants import CHECK_INTERVAL, WELCOME_MESSAGE
@@ -13,6 +12,7 @@ from app.routes.agentic_workflows import agentic_workflows_management
 from app.routes.auth_handlers import auth_handlers_management
 from app.routes.chunkers import chunkers_management
 from app.routes.context_retriever import context_retrievers_management
+from app.routes.diagnostics import diagnostics_management
 from app.routes.embedders import embedders_management
 from app.routes.file_managers import file_managers_management
 from app.routes.llms import llms_management
@@ -26,13 +26,14 @@ from app.routes.users import users_management
 from app.routes.utilities import utilities_management
 from app.routes.vector_databases import vector_databases_management
 from app.utils import (
-    build_client_configuration,
+    get_client,
     clear_auth_cookies,
     has_access,
     is_system_agent_selected,
     build_agents_options_select,
 )
 from app.routes.welcome import welcome
+from app.transport import CircuitBreaker, get_circuit_breaker
 
 
 def _get_cookie_me() -> Dict | None:
@@ -146,15 +147,17 @@ footer {visibility: hidden;}
 def _check_status():
     """Check backend status and display it"""
     current_status = st.session_state.get("status_connection", "Warning")
+    current_circuit_state = st.session_state.get("circuit_state", CircuitBreaker.CLOSED)
     try:
-        client = GrinningCatClient(build_client_configuration())
+        client = get_client()
         client.health_check.liveness()
         status_connection = "Online"
     except Exception:
         status_connection = "Offline"
 
     st.session_state["status_connection"] = status_connection
-    if current_status != status_connection:
+    st.session_state["circuit_state"] = get_circuit_breaker().state
+    if current_status != status_connection or current_circuit_state != st.session_state["circuit_state"]:
         st.rerun()
 
 
@@ -237,6 +240,10 @@ def _render_sidebar_navigation(cookie_me: Dict | None):
                     or has_access("SYSTEM", None, cookie_me, only_admin=True)
                 ),
             },
+            "🩺 Diagnostics": {
+                "page": "diagnostics",
+                "allowed": has_access("SYSTEM", "READ", cookie_me, only_admin=True),
+            },
         },
     }
 
@@ -282,6 +289,16 @@ def _render_sidebar_navigation(cookie_me: Dict | None):
         status_connection = st.session_state.get("status_connection", "Warning")
         st.markdown(f"""
 ### 📡 System Status: <span class="status-indicator status-{status_connection.lower()}"></span> {status_connection}
+""", unsafe_allow_html=True)
+
+        circuit_state = st.session_state.get("circuit_state", CircuitBreaker.CLOSED)
+        circuit_indicator = {
+            CircuitBreaker.CLOSED: "online",
+            CircuitBreaker.HALF_OPEN: "warning",
+            CircuitBreaker.OPEN: "offline",
+        }[circuit_state]
+        st.markdown(f"""
+<span class="status-indicator status-{circuit_indicator}"></span> Circuit breaker: {circuit_state.replace("_", "-")}
 """, unsafe_allow_html=True)
 
         # Add separator
@@ -296,8 +313,8 @@ For security reasons, please consider creating admin users and logging in by cre
         # logout button
         logout_button = st.button("Logout", type="primary", use_container_width=True)
         if logout_button:
-            st.session_state.clear()
             clear_auth_cookies()
+            st.session_state.clear()
 
             st.toast("Logged out successfully.", icon="🚪")
             time.sleep(1)  # Wait for a moment before rerunning
@@ -314,6 +331,8 @@ async def _main():
     if st.session_state["status_connection"] != "Online":
         st.title(WELCOME_MESSAGE)
         st.error("Grinning Cat backend is offline. Please check your connection.")
+        if retry_in := get_circuit_breaker().retry_in:
+            st.info(f"Calls to the backend are suspended: next connection attempt in {retry_in:.0f} seconds.")
         return
 
     # Add a flag to track if we've attempted cookie check
@@ -397,11 +416,11 @@ async def _main():
         return
 
     if current_page == "rag":
-        rabbit_hole_management(cookie_me)
+        await rabbit_hole_management(cookie_me)
         return
 
     if current_page == "plugins":
-        plugins_management(cookie_me)
+        await plugins_management(cookie_me)
         return
 
     if current_page == "users":
@@ -413,13 +432,17 @@ async def _main():
         return
 
     if current_page == "memory":
-        memory_management(cookie_me)
+        await memory_management(cookie_me)
         return
 
     if current_page == "system":
         utilities_management(cookie_me)
         return
 
+    if current_page == "diagnostics":
+        diagnostics_management(cookie_me)
+        return
+
     welcome(cookie_me)
 
 
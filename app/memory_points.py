@@ -0,0 +1,378 @@
+import contextlib
+import json
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Tuple
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from grinning_cat_python_sdk import Configuration, GrinningCatClient
+from grinning_cat_python_sdk.models.dtos import MemoryPoint
+
+from app.utils import PooledGrinningCatClient, iter_point_pages
+
+# Points read at once by the export, i.e. the points held in memory, with their vectors
+EXPORT_PAGE_SIZE = 500
+# Extensions of the files of points accepted by the import
+POINT_FILE_TYPES = ["parquet", "jsonl"]
+# Default points upserted per batch by the import, and batches upserted at the same time
+IMPORT_BATCH_SIZE = 100
+IMPORT_PARALLEL_BATCHES = 4
+# Metadata of the points created by the import, holding the ID of the point in the imported file
+IMPORTED_ID_KEY = "imported_id"
+# Side of the tiles of the similarity matrix computed at once by the duplicate detection, i.e. 16 MB of float32
+DUPLICATES_BLOCK_SIZE = 2048
+
+
+def points_schema(dimension: int) -> pa.Schema:
+    """
+    Schema of the Parquet files of the points of a collection: the fields of the payload are columns, the metadata
+    being JSON-encoded as their keys vary from a point to another, and the vectors are fixed-size lists of float32.
+    Fixed-size lists cannot be null when read back, so the vector of a point without one is zero-filled, and flagged
+    by `has_vector`.
+    """
+    return pa.schema([
+        pa.field("id", pa.string(), nullable=False),
+        pa.field("page_content", pa.string()),
+        pa.field("metadata", pa.string()),
+        pa.field("vector", pa.list_(pa.float32(), dimension), nullable=False),
+        pa.field("has_vector", pa.bool_(), nullable=False),
+    ])
+
+
+def _vector(point: Dict[str, Any]) -> List[float] | None:
+    if point.get("has_vector") is False:
+        # a zero-filled vector, read from a Parquet file (see points_schema)
+        return None
+    vector = point.get("vector")
+    if isinstance(vector, dict):
+        # a collection with a single named vector
+        vector = next(iter(vector.values()), None) if len(vector) == 1 else None
+    return vector or None
+
+
+def _points_table(points: List[Dict[str, Any]], schema: pa.Schema) -> pa.Table:
+    dimension = schema.field("vector").type.list_size
+    vectors = np.zeros((len(points), dimension), dtype=np.float32)
+    has_vector = np.zeros(len(points), dtype=bool)
+    for i, point in enumerate(points):
+        if (vector := _vector(point)) is None:
+            continue
+        if len(vector) != dimension:
+            raise ValueError(f"The vector of point {point['id']} has {len(vector)} dimensions, instead of {dimension}")
+        vectors[i] = vector
+        has_vector[i] = True
+
+    payloads = [point.get("payload") or {} for point in points]
+    return pa.Table.from_arrays(
+        [
+            pa.array([str(point["id"]) for point in points], pa.string()),
+            pa.array([payload.get("page_content") for payload in payloads], pa.string()),
+            pa.array([json.dumps(payload.get("metadata") or {}) for payload in payloads], pa.string()),
+            pa.FixedSizeListArray.from_arrays(pa.array(vectors.ravel()), dimension),
+            pa.array(has_vector),
+        ],
+        schema=schema,
+    )
+
+
+def export_points(configuration: Configuration, agent_id: str, collection: str, destination: BinaryIO) -> int:
+    """
+    Export the points of a memory collection to a Parquet file (see points_schema), streaming them page by page, each
+    one a row group of its own, so that a single page of points is held in memory at a time.
+
+    Args:
+        configuration: The configuration of the client, built in the script run (see build_client_configuration), as
+            the export may run outside of it.
+        agent_id: The ID of the agent.
+        collection: The name of the collection.
+        destination: The file to write to.
+
+    Returns:
+        The number of points exported.
+    """
+    writer: pq.ParquetWriter | None = None
+    exported = 0
+    with contextlib.closing(PooledGrinningCatClient(configuration)) as client:
+        try:
+            for points in iter_point_pages(
+                client, agent_id, collection, {"limit": EXPORT_PAGE_SIZE, "with_vectors": "true"}
+            ):
+                if writer is None:
+                    # the vectors of a collection have the same dimension, that of its first point
+                    dimension = next((len(vector) for point in points if (vector := _vector(point))), 0)
+                    writer = pq.ParquetWriter(destination, points_schema(dimension))
+                writer.write_table(_points_table(points, writer.schema))
+                exported += len(points)
+
+            if writer is None:
+                writer = pq.ParquetWriter(destination, points_schema(0))
+        finally:
+            if writer is not None:
+                writer.close()
+    return exported
+
+
+def collection_dimension(client: GrinningCatClient, agent_id: str, collection: str) -> int | None:
+    """The dimension of the vectors of a collection, read from one of its points, if any."""
+    page = client.custom.get_custom(
+        f"/memory/collections/{collection}/points", agent_id, query={"limit": 1, "with_vectors": "true"}
+    )
+    return next((len(vector) for point in page.get("points") or [] if (vector := _vector(point))), None)
+
+
+def _is_parquet(file_name: str) -> bool:
+    return file_name.lower().endswith(".parquet")
+
+
+def count_point_records(source: BinaryIO, file_name: str) -> int:
+    """The number of points of a Parquet file, read from its footer, or of a JSONL file, counting its lines."""
+    source.seek(0)
+    if _is_parquet(file_name):
+        return pq.ParquetFile(source).metadata.num_rows
+    return sum(1 for line in source if line.strip())
+
+
+def _point_of_record(record: Dict[str, Any], location: str, dimension: int | None) -> Dict[str, Any]:
+    if not isinstance(record, dict):
+        raise ValueError(f"The point at {location} must be an object")
+
+    if record.get("id") in (None, ""):
+        raise ValueError(f"The point at {location} has no id")
+
+    content = record.get("page_content", record.get("content"))
+    if not isinstance(content, str):
+        raise ValueError(f"The point at {location} has no page_content")
+
+    metadata = record.get("metadata") or {}
+    if isinstance(metadata, str):
+        try:
+            metadata = json.loads(metadata)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format in the metadata of the point at {location}: {e}") from e
+    if not isinstance(metadata, dict):
+        raise ValueError(f"The metadata of the point at {location} must be an object")
+
+    if (vector := _vector(record)) is not None and dimension is not None and len(vector) != dimension:
+        raise ValueError(
+            f"The vector of the point at {location} has {len(vector)} dimensions, instead of {dimension}"
+        )
+
+    return {"id": str(record["id"]), "content": content, "metadata": metadata}
+
+
+def _parquet_records(source: BinaryIO, batch_size: int) -> Iterator[Tuple[str, Any]]:
+    try:
+        row = 0
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=batch_size):
+            for record in batch.to_pylist():
+                row += 1
+                yield f"row {row}", record
+    except pa.ArrowException as e:
+        raise ValueError(f"The file is not a valid Parquet file: {e}") from e
+
+
+def _jsonl_records(source: BinaryIO) -> Iterator[Tuple[str, Any]]:
+    for number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield f"line {number}", json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format in line {number}: {e}") from e
+
+
+def read_point_batches(
+    source: BinaryIO, file_name: str, batch_size: int, dimension: int | None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Read the points of a Parquet file, e.g. exported by export_points, or of a JSONL file with an object per line, in
+    batches, so that a single batch is held in memory at a time. A point has an `id`, a `page_content` (or `content`),
+    optional `metadata`, as an object or JSON-encoded, and an optional `vector`.
+
+    Args:
+        source: The file to read.
+        file_name: The name of the file, telling its format by its extension.
+        batch_size: The points of a batch.
+        dimension: The dimension the vectors must have, e.g. the one of the collection the points are imported to. When
+            None, the vectors must have the dimension of the first one.
+
+    Returns:
+        An iterator of the batches of points, each one with its `id`, `content` and `metadata`.
+
+    Raises:
+        ValueError: If a point is malformed, or its vector has a different dimension; the error tells the line of the
+            JSONL file, or the row of the Parquet file, of the point.
+    """
+    source.seek(0)
+    records = _parquet_records(source, batch_size) if _is_parquet(file_name) else _jsonl_records(source)
+
+    batch = []
+    for location, record in records:
+        if dimension is None and isinstance(record, dict) and (vector := _vector(record)) is not None:
+            dimension = len(vector)
+        batch.append(_point_of_record(record, location, dimension))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def imported_point_ids(client: GrinningCatClient, agent_id: str, collection: str) -> Dict[str, str]:
+    """
+    Map the IDs of the points of a file to the IDs of the points of a collection that an import has to edit rather than
+    create: the points of the collection with the same IDs, and the points created by a previous import of the file,
+    whose original ID is in their metadata (see upsert_points).
+
+    Returns:
+        The ID of the point of the collection to edit, by ID of the point of the file.
+    """
+    point_ids: Dict[str, str] = {}
+    query = {"limit": EXPORT_PAGE_SIZE, "with_vectors": "false"}
+    for points in iter_point_pages(client, agent_id, collection, query):
+        for point in points:
+            point_ids[str(point["id"])] = str(point["id"])
+            if (imported_id := ((point.get("payload") or {}).get("metadata") or {}).get(IMPORTED_ID_KEY)) is not None:
+                point_ids.setdefault(str(imported_id), str(point["id"]))
+    return point_ids
+
+
+def upsert_points(
+    client: GrinningCatClient, agent_id: str, collection: str, points: List[Dict[str, Any]], point_ids: Dict[str, str]
+):
+    """
+    Upsert points in a collection: the API only edits the points that exist, and creates the other ones with IDs of its
+    own. The points in `point_ids` (see imported_point_ids) are edited; the other ones are created, with their original
+    ID in the `imported_id` metadata, and added to `point_ids`, so that importing them again, e.g. resuming an import,
+    edits them instead of duplicating them. The API takes no vectors: the backend embeds the content of each point.
+    """
+    for point in points:
+        point_id = point_ids.get(point["id"])
+        metadata = point["metadata"]
+        if point_id != point["id"]:
+            metadata = {**metadata, IMPORTED_ID_KEY: point["id"]}
+        memory_point = MemoryPoint(content=point["content"], metadata=metadata)
+
+        if point_id is not None:
+            client.memory.put_memory_point(collection, agent_id, "", memory_point, point_id)
+        else:
+            point_ids[point["id"]] = client.memory.post_memory_point(collection, agent_id, "", memory_point).id
+
+
+def load_vectors(
+    client: GrinningCatClient,
+    agent_id: str,
+    collection: str,
+    preview_length: int,
+    on_page: Callable[[int], None] | None = None,
+) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+    """
+    Load the vectors of the points of a memory collection, page by page, in a float32 matrix, which takes a quarter of
+    the memory of the decoded JSON. Only a preview of the payload of each point is kept, to describe it.
+
+    Args:
+        client: The client to read the points with.
+        agent_id: The ID of the agent.
+        collection: The name of the collection.
+        preview_length: The characters of the content of each point to keep.
+        on_page: Called with the number of points loaded so far, after each page.
+
+    Returns:
+        The `id`, `page_content` preview and `source` of the points with a vector, and their vectors, row by row.
+    """
+    points: List[Dict[str, Any]] = []
+    pages: List[np.ndarray] = []
+    for page in iter_point_pages(client, agent_id, collection, {"limit": EXPORT_PAGE_SIZE, "with_vectors": "true"}):
+        vectors = []
+        for point in page:
+            if (vector := _vector(point)) is None:
+                continue
+            payload = point.get("payload") or {}
+            points.append({
+                "id": str(point["id"]),
+                "page_content": (payload.get("page_content") or "")[:preview_length],
+                "source": (payload.get("metadata") or {}).get("source"),
+            })
+            vectors.append(vector)
+        if vectors:
+            pages.append(np.asarray(vectors, dtype=np.float32))
+        if on_page:
+            on_page(len(points))
+
+    return points, np.concatenate(pages) if pages else np.zeros((0, 0), dtype=np.float32)
+
+
+def _roots(parent: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    roots = parent[indices]
+    while not np.array_equal(grandparents := parent[roots], roots):
+        roots = grandparents
+    return roots
+
+
+def _union(parent: np.ndarray, first: np.ndarray, second: np.ndarray):
+    """
+    Merge the components of the pairs of a union-find, vectorized: each round links the root of the higher component
+    of every pair to the lowest root it is paired with, until the pairs share their roots. A root always links to a
+    lower one, so that the root of a component is its first vector.
+    """
+    while len(first):
+        first_roots, second_roots = _roots(parent, first), _roots(parent, second)
+        apart = first_roots != second_roots
+        first, second = first[apart], second[apart]
+        if not len(first):
+            return
+        lower = np.minimum(first_roots[apart], second_roots[apart])
+        higher = np.maximum(first_roots[apart], second_roots[apart])
+        np.minimum.at(parent, higher, lower)
+
+
+def cluster_duplicates(
+    vectors: np.ndarray,
+    threshold: float,
+    block_size: int = DUPLICATES_BLOCK_SIZE,
+    on_progress: Callable[[float], None] | None = None,
+) -> List[List[int]]:
+    """
+    Group the vectors whose cosine similarity is at least `threshold` in clusters, i.e. the connected components of the
+    graph of the duplicate pairs. The vectors are normalized in place, then the upper triangle of their similarity
+    matrix is computed a tile of `block_size` × `block_size` at a time, and the pairs of each tile are merged in a
+    union-find right away, so that the memory is bounded by a tile rather than growing with the number of pairs.
+
+    Args:
+        vectors: The float32 matrix of the vectors, row by row, normalized in place.
+        threshold: The minimum cosine similarity of a pair of duplicates.
+        block_size: The side of the tiles of the similarity matrix.
+        on_progress: Called with the fraction of the tiles computed so far, after each row of tiles.
+
+    Returns:
+        The indices of the vectors of each cluster, sorted, so that its first vector, the one to keep, is the first one
+        of the collection.
+    """
+    # unlike np.linalg.norm, einsum does not square a copy of the whole matrix
+    norms = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))[:, np.newaxis]
+    norms[norms == 0] = 1
+    vectors /= norms
+
+    count = len(vectors)
+    parent = np.arange(count)
+    blocks = (count + block_size - 1) // block_size
+    total_tiles = blocks * (blocks + 1) // 2
+    computed_tiles = 0
+    for row_start in range(0, count, block_size):
+        rows = vectors[row_start:row_start + block_size]
+        for column_start in range(row_start, count, block_size):
+            similarities = rows @ vectors[column_start:column_start + block_size].T
+            row_indices, column_indices = np.nonzero(similarities >= threshold)
+            if column_start == row_start:
+                # the tiles on the diagonal hold each pair twice, and each vector paired with itself
+                upper = column_indices > row_indices
+                row_indices, column_indices = row_indices[upper], column_indices[upper]
+            _union(parent, row_indices + row_start, column_indices + column_start)
+            computed_tiles += 1
+        if on_progress:
+            on_progress(computed_tiles / total_tiles)
+
+    roots = _roots(parent, np.arange(count))
+    order = np.argsort(roots, kind="stable")
+    boundaries = np.flatnonzero(np.diff(roots[order])) + 1
+    return [cluster.tolist() for cluster in np.split(order, boundaries) if len(cluster) > 1]
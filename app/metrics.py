@@ -0,0 +1,149 @@
+import bisect
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Dict, List
+
+# Namespaces of GrinningCatClient whose calls are recorded
+SDK_NAMESPACES = frozenset({
+    "admins",
+    "agentic_workflow",
+    "auth",
+    "auth_handler",
+    "chunker",
+    "context_retriever",
+    "conversation",
+    "custom",
+    "embedder",
+    "file_manager",
+    "health_check",
+    "large_language_model",
+    "memory",
+    "message",
+    "plugins",
+    "rabbit_hole",
+    "users",
+    "utils",
+    "vector_database",
+})
+
+# Upper bounds (seconds) of the histogram buckets: 1ms to ~65s, growing by sqrt(2). Latencies above the last bound fall
+# into an overflow bucket.
+BUCKET_BOUNDS = [0.001 * 2 ** (i / 2) for i in range(33)]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram: memory does not grow with the number of recorded calls."""
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def record(self, duration: float, is_error: bool):
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, duration)] += 1
+        self.calls += 1
+        self.errors += is_error
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (0 < q <= 1), capped at the slowest call."""
+        if not self.calls:
+            return 0.0
+
+        threshold = q * self.calls
+        cumulated = 0
+        for i, count in enumerate(self.buckets):
+            cumulated += count
+            if cumulated >= threshold:
+                return min(BUCKET_BOUNDS[i], self.max_time) if i < len(BUCKET_BOUNDS) else self.max_time
+        return self.max_time
+
+
+class MetricsRecorder:
+    """Process-wide recorder of the SDK calls, one histogram per method."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, method: str, duration: float, is_error: bool):
+        with self._lock:
+            if (histogram := self._histograms.get(method)) is None:
+                histogram = self._histograms[method] = LatencyHistogram()
+            histogram.record(duration, is_error)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "method": method,
+                    "calls": h.calls,
+                    "errors": h.errors,
+                    "mean_ms": 1000 * h.total_time / h.calls,
+                    "p50_ms": 1000 * h.percentile(0.5),
+                    "p95_ms": 1000 * h.percentile(0.95),
+                    "p99_ms": 1000 * h.percentile(0.99),
+                    "max_ms": 1000 * h.max_time,
+                    "total_s": h.total_time,
+                }
+                for method, h in sorted(self._histograms.items())
+            ]
+
+    def total_calls(self) -> int:
+        with self._lock:
+            return sum(h.calls for h in self._histograms.values())
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+_recorder = MetricsRecorder()
+
+
+def get_metrics_recorder() -> MetricsRecorder:
+    return _recorder
+
+
+class InstrumentedEndpoint:
+    """Proxy of an SDK endpoint recording count, errors and latency of each public method call."""
+    def __init__(self, namespace: str, endpoint: Any):
+        self._namespace = namespace
+        self._endpoint = endpoint
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._endpoint, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        method = f"{self._namespace}.{name}"
+
+        if inspect.iscoroutinefunction(attribute):
+            @functools.wraps(attribute)
+            async def async_wrapper(*args, **kwargs):
+                started_at = time.perf_counter()
+                is_error = True
+                try:
+                    result = await attribute(*args, **kwargs)
+                    is_error = False
+                    return result
+                finally:
+                    _recorder.record(method, time.perf_counter() - started_at, is_error)
+
+            return async_wrapper
+
+        @functools.wraps(attribute)
+        def wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            is_error = True
+            try:
+                result = attribute(*args, **kwargs)
+                is_error = False
+                return result
+            finally:
+                _recorder.record(method, time.perf_counter() - started_at, is_error)
+
+        return wrapper
@@ -1,14 +1,15 @@
 import json
 from typing import Dict
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 
 from app.utils import (
+    cached_read,
+    invalidate_cached_reads,
     get_factory_settings,
     build_agents_select,
     run_toast,
     show_overlay_spinner,
-    build_client_configuration,
+    get_client,
     render_json_form,
     has_access,
 )
@@ -21,11 +22,15 @@ def _list_agentic_workflows(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have access to view agentic workflows for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Agentic Workflows")
 
     try:
-        settings = client.agentic_workflow.get_agentic_workflows_settings(agent_id)
+        settings = cached_read(
+            agent_id,
+            "agentic_workflow",
+            lambda: client.agentic_workflow.get_agentic_workflows_settings(agent_id),
+        )
 
         st.write("### Available Agentic Workflows")
         if not settings.settings:
@@ -64,7 +69,7 @@ def _edit_agentic_workflow(agent_id: str, handler_name: str, is_selected: bool,
         st.error("You do not have access to edit agentic workflows for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     st.subheader(f"Editing: **{handler_name}**")
     try:
@@ -97,6 +102,7 @@ def _edit_agentic_workflow(agent_id: str, handler_name: str, is_selected: bool,
                 except Exception as e:
                     st.session_state["toast"] = {"message": f"Error updating handler: {e}", "icon": "❌"}
                 finally:
+                    invalidate_cached_reads(agent_id, "agentic_workflow")
                     spinner_container.empty()
 
                 st.rerun()
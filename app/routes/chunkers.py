@@ -1,14 +1,15 @@
 import json
 from typing import Dict
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 
 from app.utils import (
+    cached_read,
+    invalidate_cached_reads,
     get_factory_settings,
     build_agents_select,
     run_toast,
     show_overlay_spinner,
-    build_client_configuration,
+    get_client,
     render_json_form,
     has_access,
 )
@@ -21,11 +22,11 @@ def _list_chunkers(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have access to view chunkers for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Chunkers")
 
     try:
-        settings = client.chunker.get_chunkers_settings(agent_id)
+        settings = cached_read(agent_id, "chunker", lambda: client.chunker.get_chunkers_settings(agent_id))
 
         st.write("### Available Chunkers")
         if not settings.settings:
@@ -64,7 +65,7 @@ def _edit_chunker(agent_id: str, chunker_name: str, is_selected: bool, cookie_me
         st.error("You do not have access to edit chunkers for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     st.subheader(f"Editing: **{chunker_name}**")
     try:
@@ -97,6 +98,7 @@ def _edit_chunker(agent_id: str, chunker_name: str, is_selected: bool, cookie_me
                 except Exception as e:
                     st.session_state["toast"] = {"message": f"Error updating chunker: {e}", "icon": "❌"}
                 finally:
+                    invalidate_cached_reads(agent_id, "chunker")
                     spinner_container.empty()
 
                 st.rerun()
@@ -1,14 +1,15 @@
 import json
 from typing import Dict
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 
 from app.utils import (
+    cached_read,
+    invalidate_cached_reads,
     get_factory_settings,
     build_agents_select,
     run_toast,
     show_overlay_spinner,
-    build_client_configuration,
+    get_client,
     render_json_form,
     has_access,
 )
@@ -21,11 +22,15 @@ def _list_context_retrievers(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have access to view context retrievers for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Context Retrievers")
 
     try:
-        settings = client.context_retriever.get_context_retrievers_settings(agent_id)
+        settings = cached_read(
+            agent_id,
+            "context_retriever",
+            lambda: client.context_retriever.get_context_retrievers_settings(agent_id),
+        )
 
         st.write("### Available Context Retrievers")
         if not settings.settings:
@@ -64,7 +69,7 @@ def _edit_context_retriever(agent_id: str, context_retriever_name: str, is_selec
         st.error("You do not have access to edit context retrievers for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     st.subheader(f"Editing: **{context_retriever_name}**")
     try:
@@ -97,6 +102,7 @@ def _edit_context_retriever(agent_id: str, context_retriever_name: str, is_selec
                 except Exception as e:
                     st.session_state["toast"] = {"message": f"Error updating context retriever: {e}", "icon": "❌"}
                 finally:
+                    invalidate_cached_reads(agent_id, "context_retriever")
                     spinner_container.empty()
 
                 st.rerun()
@@ -0,0 +1,66 @@
+from typing import Dict
+import streamlit as st
+
+from app.metrics import get_metrics_recorder
+from app.transport import get_circuit_breaker, get_pool_stats
+from app.utils import has_access, run_toast
+
+
+def _sdk_calls():
+    st.header("SDK Calls")
+
+    stats = get_metrics_recorder().snapshot()
+    if not stats:
+        st.info("No SDK call recorded yet")
+        return
+
+    st.write(f"Recorded {sum(row['calls'] for row in stats)} calls of {len(stats)} methods, since the server started:")
+    st.dataframe(
+        stats,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "mean_ms": st.column_config.NumberColumn("mean (ms)", format="%.1f"),
+            "p50_ms": st.column_config.NumberColumn("p50 (ms)", format="%.1f"),
+            "p95_ms": st.column_config.NumberColumn("p95 (ms)", format="%.1f"),
+            "p99_ms": st.column_config.NumberColumn("p99 (ms)", format="%.1f"),
+            "max_ms": st.column_config.NumberColumn("max (ms)", format="%.1f"),
+            "total_s": st.column_config.NumberColumn("total (s)", format="%.2f"),
+        },
+    )
+    st.caption("Percentiles are the upper bounds of fixed latency buckets, growing by a factor of √2.")
+
+    if st.button("Reset SDK call metrics"):
+        get_metrics_recorder().reset()
+        st.session_state["toast"] = {"message": "SDK call metrics reset", "icon": "✅"}
+        st.rerun()
+
+
+def _connections():
+    st.header("Backend Connections")
+
+    pool_stats = get_pool_stats()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Pool hits", pool_stats["hits"])
+    col2.metric("Pool misses", pool_stats["misses"])
+    col3.metric("Hit ratio", f"{pool_stats['hit_ratio']:.1%}")
+    col4.metric("Avg wait for a connection", f"{1000 * pool_stats['avg_wait_time']:.1f} ms")
+
+    circuit_breaker = get_circuit_breaker()
+    st.write(f"**Circuit breaker**: {circuit_breaker.state.replace('_', '-')}")
+    if retry_in := circuit_breaker.retry_in:
+        st.write(f"**Next probe in**: {retry_in:.0f} seconds")
+
+
+def diagnostics_management(cookie_me: Dict | None):
+    st.title("Diagnostics Dashboard")
+
+    run_toast()
+
+    if not has_access("SYSTEM", "READ", cookie_me, only_admin=True):
+        st.error("You do not have access to the diagnostics.")
+        return
+
+    _sdk_calls()
+    st.divider()
+    _connections()
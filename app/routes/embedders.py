@@ -1,13 +1,15 @@
 import json
 from typing import Dict
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 
+from app.constants import DEFAULT_SYSTEM_KEY
 from app.utils import (
+    cached_read,
+    invalidate_cached_reads,
     get_factory_settings,
     run_toast,
     show_overlay_spinner,
-    build_client_configuration,
+    get_client,
     render_json_form,
     has_access,
 )
@@ -20,11 +22,11 @@ def _list_embedders(cookie_me: Dict | None):
         st.error("You do not have access to view embedders.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Embedders")
 
     try:
-        settings = client.embedder.get_embedders_settings()
+        settings = cached_read(DEFAULT_SYSTEM_KEY, "embedder", lambda: client.embedder.get_embedders_settings())
 
         st.write("### Available Embedders")
         if not settings.settings:
@@ -63,7 +65,7 @@ def _edit_embedder(embedder_name: str, is_selected: bool, cookie_me: Dict | None
         st.error("You do not have access to edit embedders.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     st.subheader(f"Editing: **{embedder_name}**")
     try:
@@ -95,6 +97,7 @@ def _edit_embedder(embedder_name: str, is_selected: bool, cookie_me: Dict | None
                 except Exception as e:
                     st.session_state["toast"] = {"message": f"Error updating embedder: {e}", "icon": "❌"}
                 finally:
+                    invalidate_cached_reads(DEFAULT_SYSTEM_KEY, "embedder")
                     spinner_container.empty()
 
                 st.rerun()
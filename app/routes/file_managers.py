@@ -1,14 +1,16 @@
 import json
 from typing import Dict
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 
 from app.utils import (
+    cached_read,
+    invalidate_cached_reads,
+    invalidate_uploaded_files,
     get_factory_settings,
     build_agents_select,
     run_toast,
     show_overlay_spinner,
-    build_client_configuration,
+    get_client,
     render_json_form,
     has_access,
 )
@@ -21,11 +23,15 @@ def _list_file_managers(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have access to view file managers for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("File Managers")
 
     try:
-        settings = client.file_manager.get_file_managers_settings(agent_id)
+        settings = cached_read(
+            agent_id,
+            "file_manager",
+            lambda: client.file_manager.get_file_managers_settings(agent_id),
+        )
 
         st.write("### Available File Managers")
         if not settings.settings:
@@ -64,7 +70,7 @@ def _edit_file_manager(agent_id: str, file_manager_name: str, is_selected: bool,
         st.error("You do not have access to edit file managers for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     st.subheader(f"Editing: **{file_manager_name}**")
     try:
@@ -97,6 +103,8 @@ def _edit_file_manager(agent_id: str, file_manager_name: str, is_selected: bool,
                 except Exception as e:
                     st.session_state["toast"] = {"message": f"Error updating file manager: {e}", "icon": "❌"}
                 finally:
+                    invalidate_cached_reads(agent_id, "file_manager")
+                    invalidate_uploaded_files(agent_id)  # the files are stored elsewhere now
                     spinner_container.empty()
 
                 st.rerun()
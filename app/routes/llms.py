@@ -1,14 +1,15 @@
 import json
 from typing import Dict
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 
 from app.utils import (
+    cached_read,
+    invalidate_cached_reads,
     get_factory_settings,
     build_agents_select,
     run_toast,
     show_overlay_spinner,
-    build_client_configuration,
+    get_client,
     render_json_form,
     has_access,
 )
@@ -21,11 +22,15 @@ def _list_llms(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have access to view LLMs for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("LLMs")
 
     try:
-        settings = client.large_language_model.get_large_language_models_settings(agent_id)
+        settings = cached_read(
+            agent_id,
+            "large_language_model",
+            lambda: client.large_language_model.get_large_language_models_settings(agent_id),
+        )
 
         st.write("### Available LLMs")
         if not settings.settings:
@@ -64,7 +69,7 @@ def _edit_llm(agent_id: str, llm_name: str, is_selected: bool, cookie_me: Dict |
         st.error("You do not have access to edit LLMs for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     st.subheader(f"Editing: **{llm_name}**")
     try:
@@ -97,6 +102,7 @@ def _edit_llm(agent_id: str, llm_name: str, is_selected: bool, cookie_me: Dict |
                 except Exception as e:
                     st.session_state["toast"] = {"message": f"Error updating LLM: {e}", "icon": "❌"}
                 finally:
+                    invalidate_cached_reads(agent_id, "large_language_model")
                     spinner_container.empty()
 
                 st.rerun()
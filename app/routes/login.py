@@ -1,10 +1,9 @@
 import time
 import streamlit as st
 from streamlit_js_eval import set_cookie
-from grinning_cat_python_sdk import GrinningCatClient
 
 from app.env import get_env
-from app.utils import show_overlay_spinner, build_client_configuration, clear_auth_cookies, cache_cookie_me
+from app.utils import show_overlay_spinner, get_client, clear_auth_cookies, cache_cookie_me
 
 
 def login_page():
@@ -26,7 +25,7 @@ def login_page():
 
         spinner_container = show_overlay_spinner(f"Authenticating {username}...")
         try:
-            client = GrinningCatClient(build_client_configuration())
+            client = get_client()
             token_response = client.auth.token(username, password)
             token = token_response.access_token
 
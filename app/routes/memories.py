@@ -1,19 +1,68 @@
+import asyncio
 import base64
+import json
+import os
+import tempfile
 import time
-from typing import Dict
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
-
+from grinning_cat_python_sdk import Configuration
+
+from app.concurrency import run_call
+from app.env import get_env
+from app.hash_store import get_hash_store
+from app.memory_points import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_PARALLEL_BATCHES,
+    POINT_FILE_TYPES,
+    cluster_duplicates,
+    collection_dimension,
+    count_point_records,
+    export_points,
+    imported_point_ids,
+    load_vectors,
+    read_point_batches,
+    upsert_points,
+)
 from app.utils import (
     build_agents_select,
     build_client_configuration,
+    fetch_point_page,
+    get_client,
     build_conversations_select,
     build_users_select,
     show_overlay_spinner,
     has_access,
     run_toast,
+    get_chunk_counts,
+    invalidate_chunk_counts,
+    invalidate_cached_reads,
+    render_download_button,
 )
 
+POINTS_PER_PAGE_OPTIONS = [20, 50, 100]
+# Characters of the content of a point shown in the label of its expander
+POINT_PREVIEW_LENGTH = 80
+# Default minimum cosine similarity of two duplicate memory points
+DUPLICATES_THRESHOLD = 0.98
+# Lowest threshold offered: below it, similar points are related rather than duplicates
+DUPLICATES_MIN_THRESHOLD = 0.95
+
+
+def _export_collection(configuration: Configuration, agent_id: str, collection: str) -> BinaryIO:
+    """
+    Export a collection to Parquet (see export_points) into a temporary file on disk, returned open for Streamlit to
+    read, so that the export is not held in memory on top of the copy Streamlit serves.
+    """
+    fd, path = tempfile.mkstemp(suffix=".parquet")
+    try:
+        with os.fdopen(fd, "wb") as destination:
+            export_points(configuration, agent_id, collection, destination)
+        return open(path, "rb")
+    finally:
+        # the open file stays readable once unlinked, and is removed from disk as soon as it is closed
+        os.unlink(path)
+
 
 def _memory_collections(agent_id: str, cookie_me: Dict | None):
     run_toast()
@@ -22,7 +71,7 @@ def _memory_collections(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have access to view memory collections.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Memory Collections")
 
     try:
@@ -33,14 +82,35 @@ def _memory_collections(agent_id: str, cookie_me: Dict | None):
             return
 
         st.write("### Available Memory Collections")
+        configuration = build_client_configuration()
+        export_max_points = int(get_env("GRINNING_CAT_EXPORT_MAX_POINTS"))
         for collection in collections.collections:
-            col1, col2 = st.columns([0.8, 0.2])
+            col1, col2, col3 = st.columns([0.7, 0.15, 0.15])
 
             with col1:
                 st.write(f"**{collection.name}**")
                 st.write(f"Vectors count: {collection.vectors_count}")
 
             with col2:
+                # the points are only exported when the browser asks for the file, which Streamlit then serves from
+                # memory, hence the bound on the size of the collections that can be exported
+                too_large = (collection.vectors_count or 0) > export_max_points
+                st.download_button(
+                    "Export",
+                    data=lambda name=collection.name: _export_collection(configuration, agent_id, name),
+                    file_name=f"{agent_id}_{collection.name}.parquet",
+                    mime="application/vnd.apache.parquet",
+                    key=f"export_{collection.name}",
+                    help=(
+                        f"Collections of more than {export_max_points} points cannot be exported from the admin UI"
+                        if too_large
+                        else "Export the points of this collection, with their vectors, to a Parquet file"
+                    ),
+                    on_click="ignore",
+                    disabled=too_large,
+                )
+
+            with col3:
                 if has_access("MEMORY", "DELETE", cookie_me):
                     if st.button("Delete", key=f"destroy_{collection.name}", help="Permanently destroy this collection"):
                         st.session_state["collection_to_delete"] = collection.name
@@ -64,6 +134,9 @@ def _memory_collections(agent_id: str, cookie_me: Dict | None):
                         spinner_container = show_overlay_spinner(f"Destroying collection {collection}...")
 
                         result = client.memory.delete_all_single_memory_collection_points(collection, agent_id)
+                        if collection == "declarative":
+                            # the uploaded files are no longer in the Knowledge Base, and must be uploaded again
+                            get_hash_store().delete(agent_id)
                         if result.deleted[collection]:
                             st.toast(f"Collection {collection} destroyed successfully!", icon="✅")
                             st.session_state.pop("collection_to_delete", None)
@@ -74,6 +147,8 @@ def _memory_collections(agent_id: str, cookie_me: Dict | None):
                         st.toast(f"Error destroying collection: {e}", icon="❌")
                     finally:
                         spinner_container.empty()
+                        # the chunk counts of every conversation are stale too
+                        invalidate_cached_reads(agent_id)
 
                     st.rerun()
             with col2:
@@ -84,6 +159,438 @@ def _memory_collections(agent_id: str, cookie_me: Dict | None):
         st.error(f"Error fetching memory collections: {e}")
 
 
+def _reset_points_browser():
+    # the cursors depend on the filter and on the size of the pages
+    st.session_state.pop("points_offsets", None)
+
+
+def _fetch_points_page(
+    agent_id: str, collection: str, limit: int, offset: Any, metadata: Dict[str, Any], with_vectors: bool
+) -> Dict[str, Any]:
+    """
+    Fetch a page of the points of a collection, starting at a cursor, through the REST endpoint rather than
+    get_memory_points, so that the vectors are only fetched when asked for.
+    """
+    query: Dict[str, Any] = {"limit": limit, "with_vectors": str(with_vectors).lower()}
+    if offset is not None:
+        query["offset"] = offset
+    if metadata:
+        query["metadata"] = json.dumps(metadata)
+    return fetch_point_page(get_client(), agent_id, collection, query)
+
+
+def _browse_memory_points(agent_id: str, cookie_me: Dict | None):
+    run_toast()
+
+    if not has_access("MEMORY", "READ", cookie_me):
+        st.error("You do not have access to view memory points.")
+        return
+
+    client = get_client()
+    st.header("Memory Points")
+
+    try:
+        collections = [collection.name for collection in client.memory.get_memory_collections(agent_id).collections]
+        if not collections:
+            st.info("No memory collections found for this agent")
+            return
+
+        col1, col2, col3 = st.columns([0.3, 0.5, 0.2])
+        with col1:
+            collection = st.selectbox("Collection", collections, key="points_collection")
+        with col2:
+            metadata_filter = st.text_input(
+                "Filter by metadata (JSON format)",
+                key="points_filter",
+                placeholder='{"source": "document.pdf"}',
+                on_change=_reset_points_browser,
+            )
+        with col3:
+            points_per_page = st.selectbox(
+                "Points per page", POINTS_PER_PAGE_OPTIONS, key="points_per_page", on_change=_reset_points_browser
+            )
+        with_vectors = st.toggle(
+            "Include vectors",
+            key="points_with_vectors",
+            help="Fetch the vectors of the points of the page too, which are much larger than their payloads",
+        )
+
+        try:
+            metadata = json.loads(metadata_filter) if metadata_filter.strip() else {}
+        except json.JSONDecodeError:
+            st.error("Invalid JSON format in the metadata filter")
+            return
+        if not isinstance(metadata, dict):
+            st.error("The metadata filter must be a JSON object")
+            return
+
+        # the cursors of the pages of the collection browsed so far, the last one being the current page
+        offsets = st.session_state.setdefault("points_offsets", {}).setdefault((agent_id, collection), [None])
+        page = _fetch_points_page(agent_id, collection, points_per_page, offsets[-1], metadata, with_vectors)
+        points = page.get("points") or []
+        if not points:
+            st.info("No points found matching your filter")
+            if len(offsets) > 1:
+                st.button("← First page", key="points_first", on_click=_reset_points_browser)
+            return
+
+        first = (len(offsets) - 1) * points_per_page + 1
+        st.write(f"**Points**: {first} - {first + len(points) - 1}")
+        for point in points:
+            payload = point.get("payload") or {}
+            content = payload.get("page_content") or ""
+            with st.expander(f"{point['id']}: {content[:POINT_PREVIEW_LENGTH]}"):
+                st.write(content)
+                st.write("**Metadata**:")
+                st.json(payload.get("metadata") or {})
+                if with_vectors and point.get("vector") is not None:
+                    st.write("**Vector**:")
+                    st.json(point["vector"], expanded=False)
+
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("← Previous", key="points_previous", disabled=len(offsets) == 1, on_click=offsets.pop)
+        with col2:
+            st.write(f"Page {len(offsets)}")
+        with col3:
+            st.button(
+                "Next →",
+                key="points_next",
+                disabled=page.get("next_offset") is None,
+                on_click=offsets.append,
+                args=(page.get("next_offset"),),
+            )
+    except Exception as e:
+        st.error(f"Error fetching memory points: {e}")
+
+
+async def _upsert_point_batches(
+    agent_id: str,
+    collection: str,
+    batches: Iterator[List[Dict[str, Any]]],
+    batch_size: int,
+    parallel_batches: int,
+    total: int,
+    checkpoint: Tuple,
+    point_ids: Dict[str, str],
+) -> Exception | None:
+    """
+    Upsert the batches of points, up to `parallel_batches` at a time, skipping the ones committed by a previous run of
+    the same import. The checkpoint is the number of leading batches committed so far: as the batches complete out of
+    order, it only advances over contiguous ones, so that resuming never skips a batch. After a failure, no more batches
+    are started, while the ones in flight are awaited. The points already in the collection, including the ones created
+    by the batches in flight, are edited rather than created again (see upsert_points).
+
+    Returns:
+        The error that stopped the import, if any.
+    """
+    checkpoints = st.session_state.setdefault("points_import_checkpoints", {})
+    committed = checkpoints.get(checkpoint, 0)
+    configuration = build_client_configuration()
+    semaphore = asyncio.Semaphore(parallel_batches)
+    progress = st.progress(0.0)
+    completed = set()
+    failure = None
+
+    def show_progress():
+        imported = min(committed * batch_size, total)
+        progress.progress(imported / total if total else 1.0, text=f"{imported} of {total} points imported")
+
+    async def upsert(index: int, points: List[Dict[str, Any]]):
+        nonlocal committed, failure
+
+        try:
+            await run_call(
+                lambda client: upsert_points(client, agent_id, collection, points, point_ids), configuration
+            )
+            completed.add(index)
+            while committed in completed:
+                completed.remove(committed)
+                committed += 1
+            checkpoints[checkpoint] = committed
+            show_progress()
+        except Exception as e:
+            failure = failure or e
+        finally:
+            semaphore.release()
+
+    show_progress()
+    tasks = []
+    index = 0
+    while True:
+        await semaphore.acquire()
+        try:
+            # the batches are read off the event loop, as parsing them is as slow as upserting them
+            points = await asyncio.to_thread(next, batches, None) if failure is None else None
+        except ValueError as e:
+            failure = e
+            points = None
+        if points is None:
+            semaphore.release()
+            break
+        if index < committed:
+            semaphore.release()
+        else:
+            tasks.append(asyncio.create_task(upsert(index, points)))
+        index += 1
+
+    await asyncio.gather(*tasks)
+    if failure is None:
+        checkpoints.pop(checkpoint, None)
+    return failure
+
+
+async def _import_memory_points(agent_id: str, cookie_me: Dict | None):
+    run_toast()
+
+    if not has_access("MEMORY", "WRITE", cookie_me):
+        st.error("You do not have access to import memory points.")
+        return
+
+    client = get_client()
+    st.header("Import Memory Points")
+    st.info(
+        "Upload a Parquet file, e.g. exported from a collection, or a JSONL file with a point per line: each point has "
+        "an `id`, a `page_content`, optional `metadata` and an optional `vector`. The points with the id of a point of "
+        "the collection edit it, the other ones are created with their id in the `imported_id` metadata, so that an "
+        "interrupted import can be resumed by uploading the same file again. The backend embeds the content of each "
+        "point: the vectors in the file are only checked against the dimension of the collection."
+    )
+
+    try:
+        collections = [collection.name for collection in client.memory.get_memory_collections(agent_id).collections]
+    except Exception as e:
+        st.error(f"Error fetching memory collections: {e}")
+        return
+    if not collections:
+        st.info("No memory collections found for this agent")
+        return
+
+    with st.form("import_points_form", enter_to_submit=False):
+        collection = st.selectbox("Collection", collections)
+        uploaded_file = st.file_uploader("File of points", type=POINT_FILE_TYPES)
+        col1, col2 = st.columns(2)
+        with col1:
+            batch_size = st.number_input("Points per batch", min_value=1, max_value=10000, value=IMPORT_BATCH_SIZE)
+        with col2:
+            parallel_batches = st.number_input(
+                "Parallel batches", min_value=1, max_value=32, value=IMPORT_PARALLEL_BATCHES
+            )
+
+        if not st.form_submit_button("📥 Import points"):
+            return
+
+    if uploaded_file is None:
+        st.error("Please upload a file of points")
+        return
+
+    # the same file imported to the same collection in batches of the same size resumes from its checkpoint
+    checkpoint = (agent_id, collection, uploaded_file.name, uploaded_file.size, batch_size)
+    committed = st.session_state.get("points_import_checkpoints", {}).get(checkpoint, 0)
+    if committed:
+        st.info(f"Resuming the import after {committed} batches already imported")
+
+    try:
+        total = await asyncio.to_thread(count_point_records, uploaded_file, uploaded_file.name)
+        configuration = build_client_configuration()
+        dimension = await run_call(lambda client: collection_dimension(client, agent_id, collection), configuration)
+        point_ids = await run_call(lambda client: imported_point_ids(client, agent_id, collection), configuration)
+    except Exception as e:
+        st.error(f"Error reading the file of points: {e}")
+        return
+
+    batches = read_point_batches(uploaded_file, uploaded_file.name, batch_size, dimension)
+    if failure := await _upsert_point_batches(
+        agent_id, collection, batches, batch_size, parallel_batches, total, checkpoint, point_ids
+    ):
+        committed = st.session_state["points_import_checkpoints"].get(checkpoint, 0)
+        st.error(
+            f"Import stopped after {min(committed * batch_size, total)} points: {failure}. "
+            "Import the same file again to resume it."
+        )
+        return
+
+    invalidate_chunk_counts(agent_id, collection)
+    st.session_state["toast"] = {"message": f"{total} points imported into {collection}", "icon": "✅"}
+    run_toast()
+
+
+def _find_duplicates(agent_id: str, collection: str, threshold: float) -> Dict[str, Any]:
+    """
+    Find the clusters of near-duplicate points of a collection, rendering the progress of the loading of the vectors
+    and of their comparison. The first point of each cluster is the one to keep.
+    """
+    progress = st.progress(0.0, text="Loading the vectors...")
+    points, vectors = load_vectors(
+        get_client(),
+        agent_id,
+        collection,
+        POINT_PREVIEW_LENGTH,
+        on_page=lambda loaded: progress.progress(0.0, text=f"{loaded} vectors loaded"),
+    )
+    clusters = cluster_duplicates(
+        vectors,
+        threshold,
+        on_progress=lambda done: progress.progress(done, text=f"Comparing {len(points)} vectors..."),
+    )
+    progress.empty()
+
+    return {
+        "agent_id": agent_id,
+        "collection": collection,
+        "threshold": threshold,
+        "points": len(points),
+        "clusters": [[points[index] for index in cluster] for cluster in clusters],
+    }
+
+
+async def _delete_points(agent_id: str, collection: str, point_ids: List[str]) -> Dict[str, str]:
+    """
+    Delete points of a collection concurrently, up to GRINNING_CAT_BULK_DELETE_CONCURRENCY at a time, rendering the
+    progress of the deletes.
+
+    Returns:
+        The error of each point that failed to be deleted, by ID.
+    """
+    configuration = build_client_configuration()
+    semaphore = asyncio.Semaphore(int(get_env("GRINNING_CAT_BULK_DELETE_CONCURRENCY")))
+    progress = st.progress(0.0, text=f"0 of {len(point_ids)} points deleted")
+    failures: Dict[str, str] = {}
+    processed = 0
+
+    async def delete(point_id: str):
+        nonlocal processed
+
+        async with semaphore:
+            try:
+                await run_call(
+                    lambda client: client.memory.delete_memory_point(collection, agent_id, point_id), configuration
+                )
+            except Exception as e:
+                failures[point_id] = str(e)
+            finally:
+                processed += 1
+                progress.progress(
+                    processed / len(point_ids), text=f"{processed - len(failures)} of {len(point_ids)} points deleted"
+                )
+
+    await asyncio.gather(*(delete(point_id) for point_id in point_ids))
+    return failures
+
+
+async def _find_duplicate_points(agent_id: str, cookie_me: Dict | None):
+    run_toast()
+
+    if not has_access("MEMORY", "READ", cookie_me):
+        st.error("You do not have access to view memory points.")
+        return
+
+    client = get_client()
+    st.header("Duplicate Memory Points")
+    st.info(
+        "Find the points of a collection whose vectors are nearly identical, e.g. the chunks of a file uploaded more "
+        "than once, grouped in clusters. Deleting the duplicates keeps the first point of each cluster."
+    )
+
+    try:
+        collections = [collection.name for collection in client.memory.get_memory_collections(agent_id).collections]
+    except Exception as e:
+        st.error(f"Error fetching memory collections: {e}")
+        return
+    if not collections:
+        st.info("No memory collections found for this agent")
+        return
+
+    col1, col2 = st.columns([0.6, 0.4])
+    with col1:
+        collection = st.selectbox("Collection", collections, key="duplicates_collection")
+    with col2:
+        threshold = st.slider(
+            "Similarity threshold",
+            min_value=DUPLICATES_MIN_THRESHOLD,
+            max_value=1.0,
+            value=DUPLICATES_THRESHOLD,
+            step=0.005,
+            format="%.3f",
+            key="duplicates_threshold",
+            help="The minimum cosine similarity of the vectors of two duplicate points",
+        )
+
+    if st.button("🔍 Find duplicates"):
+        st.session_state.pop("duplicates_delete", None)
+        try:
+            st.session_state["duplicates"] = _find_duplicates(agent_id, collection, threshold)
+        except Exception as e:
+            st.error(f"Error finding duplicate memory points: {e}")
+            return
+
+    duplicates = st.session_state.get("duplicates")
+    # the point IDs of the clusters only belong to the agent and the collection they were found in
+    if not duplicates or (duplicates["agent_id"], duplicates["collection"], duplicates["threshold"]) != (
+        agent_id, collection, threshold
+    ):
+        return
+
+    clusters = duplicates["clusters"]
+    to_delete = [point["id"] for cluster in clusters for point in cluster[1:]]
+    st.write(
+        f"**Points compared**: {duplicates['points']} - **Clusters**: {len(clusters)} - "
+        f"**Duplicates**: {len(to_delete)}"
+    )
+    if not clusters:
+        st.success("No duplicate points found")
+        return
+
+    st.dataframe(
+        [
+            {
+                "Cluster": number,
+                "Kept point": cluster[0]["id"],
+                "Duplicates": len(cluster) - 1,
+                "Source": cluster[0]["source"],
+                "Content": cluster[0]["page_content"],
+            }
+            for number, cluster in enumerate(clusters, start=1)
+        ],
+        hide_index=True,
+        width="stretch",
+    )
+
+    if not has_access("MEMORY", "DELETE", cookie_me):
+        return
+
+    if st.button(f"🗑️ Delete {len(to_delete)} duplicates", type="primary"):
+        st.session_state["duplicates_delete"] = True
+    if not st.session_state.get("duplicates_delete"):
+        return
+
+    st.warning(f"⚠️ Are you sure you want to permanently delete {len(to_delete)} points from `{collection}`?")
+    col1, col2 = st.columns(2)
+    with col1:
+        confirmed = st.button(f"Yes, Delete {len(to_delete)} Points", type="primary")
+    with col2:
+        if st.button("Cancel", key="cancel_duplicates_delete"):
+            st.session_state.pop("duplicates_delete", None)
+            st.rerun()
+    if not confirmed:
+        return
+
+    try:
+        failures = await _delete_points(agent_id, collection, to_delete)
+    finally:
+        invalidate_chunk_counts(agent_id, collection)
+
+    st.session_state.pop("duplicates_delete", None)
+    st.session_state.pop("duplicates", None)
+    if failures:
+        st.session_state["toast"] = {
+            "message": f"{len(failures)} of {len(to_delete)} points failed to be deleted", "icon": "❌",
+        }
+    else:
+        st.session_state["toast"] = {"message": f"{len(to_delete)} duplicate points deleted!", "icon": "✅"}
+    st.rerun()
+
+
 def _view_conversation_history(agent_id: str, user_id: str, conversation_id: str, cookie_me: Dict | None):
     def pop_state_keys():
         for key in ["conversation_to_change_name", "conversation_to_delete"]:
@@ -96,7 +603,7 @@ def _view_conversation_history(agent_id: str, user_id: str, conversation_id: str
         st.error("You do not have access to view conversation history.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Conversation History")
 
     try:
@@ -234,63 +741,31 @@ def _view_conversation_history(agent_id: str, user_id: str, conversation_id: str
 
 @st.dialog(title="Edit Vector Database", width="large")
 def _edit_chat_files(agent_id: str, conversation_id: str, cookie_me: Dict | None):
-    def download_file(file_name):
-        try:
-            response = client.file_manager.get_file(agent_id, file_name)
-            return response.content
-        except Exception as ex:
-            st.toast(f"Error downloading file: {ex}", icon="❌")
-            return None
-
     if not has_access("MEMORY", "READ", cookie_me):
         st.error("You do not have access to list the files in this conversation.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     try:
         files = client.file_manager.get_file_manager_attributes(agent_id, conversation_id)
         if not files.files:
             st.info("No files found in this conversation.")
             return
 
+        chunk_counts = get_chunk_counts(agent_id, "episodic", conversation_id)
+
         for file in files.files:
             col1, col2, col3 = st.columns([0.7, 0.15, 0.15])
 
             with col1:
-                chunks = client.memory.get_memory_points(
-                    agent_id=agent_id,
-                    collection="episodic",
-                    metadata={"source": file.name, "chat_id": conversation_id},
-                )
-
                 with st.expander(f"{file.name} ({file.size} bytes)"):
                     st.write(f"**Name**: {file.name}")
                     st.write(f"**Size**: {file.size}")
                     st.write(f"**Last modified**: {file.last_modified}")
-                    st.write(f"**Chunks**: {len(chunks.points)}")
+                    st.write(f"**Chunks**: {chunk_counts.get(file.name, 0)}")
 
             with col2:
-                # Use a regular button instead of download_button
-                if st.button("Download", key=f"download_{file.name}"):
-                    # Only fetch the file content when button is clicked
-                    file_content = download_file(file.name)
-                    if file_content:
-                        # Store in session state to trigger download
-                        st.session_state[f"download_content_{file.name}"] = file_content
-                        st.toast("Download started!", icon="✅")
-                        st.rerun()
-
-                # Check if we have content ready to download
-                if f"download_content_{file.name}" in st.session_state:
-                    # Create the actual download button with the fetched content
-                    st.download_button(
-                        label="Click to save",
-                        data=st.session_state[f"download_content_{file.name}"],
-                        file_name=file.name,
-                        key=f"save_{file.name}"
-                    )
-                    # Clear the session state after download
-                    st.session_state.pop(f"download_content_{file.name}", None)
+                render_download_button(agent_id, file.name, key=f"download_{file.name}", chat_id=conversation_id)
 
             with col3:
                 if has_access("MEMORY", "DELETE", cookie_me):
@@ -324,6 +799,7 @@ def _edit_chat_files(agent_id: str, conversation_id: str, cookie_me: Dict | None
                     st.error(f"Error deleting admin: {e}", icon="❌")
                 finally:
                     spinner_container.empty()
+                    invalidate_chunk_counts(agent_id, "episodic", conversation_id)
 
                 st.rerun()
         with col2:
@@ -335,7 +811,7 @@ def _edit_chat_files(agent_id: str, conversation_id: str, cookie_me: Dict | None
 
 
 # Streamlit UI
-def memory_management(cookie_me: Dict | None):
+async def memory_management(cookie_me: Dict | None):
     st.title("Memory Management Dashboard")
 
     build_agents_select("memory", cookie_me)
@@ -352,6 +828,18 @@ def memory_management(cookie_me: Dict | None):
             "page": "list_collections",
             "permission": has_access("MEMORY", "READ", cookie_me),
         },
+        "Browse Memory Points": {
+            "page": "browse_points",
+            "permission": has_access("MEMORY", "READ", cookie_me),
+        },
+        "Find Duplicate Memory Points": {
+            "page": "find_duplicates",
+            "permission": has_access("MEMORY", "READ", cookie_me),
+        },
+        "Import Memory Points": {
+            "page": "import_points",
+            "permission": has_access("MEMORY", "WRITE", cookie_me),
+        },
         "View Conversation History": {
             "page": "view_conversation_history",
             "permission": has_access("MEMORY", "READ", cookie_me),
@@ -375,6 +863,18 @@ def memory_management(cookie_me: Dict | None):
         _memory_collections(agent_id, cookie_me)
         return
 
+    if menu_options[choice]["page"] == "browse_points":
+        _browse_memory_points(agent_id, cookie_me)
+        return
+
+    if menu_options[choice]["page"] == "find_duplicates":
+        await _find_duplicate_points(agent_id, cookie_me)
+        return
+
+    if menu_options[choice]["page"] == "import_points":
+        await _import_memory_points(agent_id, cookie_me)
+        return
+
     if menu_options[choice]["page"] == "view_conversation_history":
         build_users_select("memory", agent_id, cookie_me)
         if not (user_id := st.session_state.get("user_id")):
@@ -1,11 +1,10 @@
 from typing import Dict
 
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 from grinning_cat_python_sdk.models.dtos import Message
 
 from app.constants import INTRO_MESSAGE
-from app.utils import build_agents_select, build_users_select, build_client_configuration, has_access, run_toast
+from app.utils import build_agents_select, build_users_select, get_client, has_access, run_toast
 
 
 async def chat(cookie_me: Dict | None):
@@ -37,7 +36,7 @@ async def chat(cookie_me: Dict | None):
             "content": INTRO_MESSAGE,
         })
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     user_message = st.chat_input(placeholder="Type your message here...")
     if user_message:
@@ -84,6 +83,9 @@ async def chat(cookie_me: Dict | None):
             st.session_state[chat_id_key] = response.chat_id
         except Exception as e:
             st.toast(f"Error sending message: {e}", icon="❌")
+        finally:
+            # the client outlives this run of the event loop, so its websocket must not outlive it: close it here
+            await client.ws_client.close()
 
         return
 
@@ -8,15 +8,19 @@ import streamlit as st
 from grinning_cat_python_sdk import GrinningCatClient
 from grinning_cat_python_sdk.models.api.plugins import PluginCollectionOutput
 
+from app.concurrency import coalesced, gather_reads
 from app.constants import ASSETS_PATH, DEFAULT_SYSTEM_KEY
 from app.utils import (
     get_settings,
+    invalidate_cached_reads,
     run_toast,
     show_overlay_spinner,
-    build_client_configuration,
+    get_client,
     render_json_form,
     has_access,
     build_agents_select,
+    paginate_items,
+    render_pagination_controls,
 )
 
 # Pagination settings
@@ -33,59 +37,6 @@ def _image_to_base64(img_path: str) -> str:
     return b64_string
 
 
-def _render_pagination_controls(section_key: str, current_page: int, total_pages: int):
-    """Render pagination controls for a section."""
-    col0, col1, col2, col3, col4, col5 = st.columns([0.15, 0.08, 0.09, 0.23, 0.15, 0.3])
-
-    with col1:
-        if st.button("← Previous", key=f"{section_key}_prev", disabled=current_page == 0):
-            st.session_state[f"{section_key}_page"] -= 1
-            st.rerun()
-
-    with col2:
-        st.markdown(
-            f"<div style='text-align: center; margin-top: 0.5em;'>Page {current_page + 1} of {total_pages}</div>",
-            unsafe_allow_html=True
-        )
-
-    with col3:
-        page_input = st.number_input(
-            "Go to page",
-            min_value=1,
-            max_value=total_pages,
-            value=current_page + 1,
-            step=1,
-            key=f"{section_key}_page_input",
-            label_visibility="collapsed"
-        )
-        if page_input != current_page + 1:
-            st.session_state[f"{section_key}_page"] = page_input - 1
-            st.rerun()
-
-    with col4:
-        if st.button("Next →", key=f"{section_key}_next", disabled=current_page >= total_pages - 1):
-            st.session_state[f"{section_key}_page"] += 1
-            st.rerun()
-
-
-def _paginate_items(items: List, section_key: str, items_per_page: int):
-    """Paginate a list of items and return the current page items."""
-    # Initialize session state for pagination
-    if f"{section_key}_page" not in st.session_state:
-        st.session_state[f"{section_key}_page"] = 0
-
-    total_items = len(items)
-    total_pages = (total_items - 1) // items_per_page + 1 if total_items > 0 else 1
-    current_page = st.session_state[f"{section_key}_page"]
-
-    # Calculate pagination range
-    start_idx = current_page * items_per_page
-    end_idx = min(start_idx + items_per_page, total_items)
-    paginated_items = items[start_idx:end_idx]
-
-    return paginated_items, current_page, total_pages
-
-
 def _render_installed_plugin_common_parts(col0, col1, p):
     """Render common parts of an installed plugin row."""
     with col0:
@@ -166,7 +117,7 @@ def _render_installed_plugin_admins(
                     st.session_state["plugin_to_uninstall"] = p.id
 
 
-def _list_plugins(cookie_me: Dict | None):
+async def _list_plugins(cookie_me: Dict | None):
     run_toast()
 
     if not has_access("PLUGIN", "READ", cookie_me):
@@ -183,33 +134,39 @@ def _list_plugins(cookie_me: Dict | None):
     # Search functionality
     search_query = st.text_input("Search plugins", "")
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     if st.session_state.get("agent_id") == DEFAULT_SYSTEM_KEY:
-        _list_plugins_admins(client, search_query, cookie_me)
+        await _list_plugins_admins(client, search_query, cookie_me)
         if force_system:
             st.session_state.pop("agent_id", None)
         return
 
-    _list_plugins_agents(client, search_query, cookie_me)
+    await _list_plugins_agents(client, search_query, cookie_me)
 
 
-def _list_plugins_agents(client: GrinningCatClient, search_query: str, cookie_me: Dict | None):
+async def _list_plugins_agents(client: GrinningCatClient, search_query: str, cookie_me: Dict | None):
     if not (agent_id := st.session_state.get("agent_id")):
         return
 
     try:
-        plugins = client.plugins.get_available_plugins(agent_id, plugin_name=search_query)
-        _list_plugins_installed(client, plugins, cookie_me)
+        plugins, untoggling_plugins_ids = await gather_reads(
+            coalesced("plugins.get_available_plugins", agent_id, plugin_name=search_query),
+            coalesced("custom.get_custom", "/admins/core_plugins/untoggling", DEFAULT_SYSTEM_KEY),
+        )
+        _list_plugins_installed(client, plugins, untoggling_plugins_ids, cookie_me)
     except Exception as e:
         st.error(f"Error fetching plugins: {e}")
 
 
-def _list_plugins_admins(client: GrinningCatClient, search_query: str, cookie_me: Dict | None):
+async def _list_plugins_admins(client: GrinningCatClient, search_query: str, cookie_me: Dict | None):
     try:
-        plugins = client.admins.get_available_plugins(plugin_name=search_query)
-        core_plugins_ids = client.custom.get_custom("/admins/core_plugins", DEFAULT_SYSTEM_KEY)
-        _list_plugins_installed(client, plugins, cookie_me, core_plugins_ids)
+        plugins, core_plugins_ids, untoggling_plugins_ids = await gather_reads(
+            coalesced("admins.get_available_plugins", plugin_name=search_query),
+            coalesced("custom.get_custom", "/admins/core_plugins", DEFAULT_SYSTEM_KEY),
+            coalesced("custom.get_custom", "/admins/core_plugins/untoggling", DEFAULT_SYSTEM_KEY),
+        )
+        _list_plugins_installed(client, plugins, untoggling_plugins_ids, cookie_me, core_plugins_ids)
 
         # Uninstall confirmation
         if (
@@ -245,7 +202,7 @@ def _list_plugins_admins(client: GrinningCatClient, search_query: str, cookie_me
 
         if plugins.registry:
             sorted_registry = sorted(plugins.registry, key=lambda x: x.name)
-            paginated_registry, current_page, total_pages = _paginate_items(
+            paginated_registry, current_page, total_pages = paginate_items(
                 sorted_registry, "registry", ITEMS_PER_PAGE
             )
 
@@ -292,7 +249,7 @@ def _list_plugins_admins(client: GrinningCatClient, search_query: str, cookie_me
 
             # Pagination controls for registry plugins
             if total_pages > 1:
-                _render_pagination_controls("registry", current_page, total_pages)
+                render_pagination_controls("registry", current_page, total_pages)
     except Exception as e:
         st.error(f"Error fetching plugins: {e}")
 
@@ -300,6 +257,7 @@ def _list_plugins_admins(client: GrinningCatClient, search_query: str, cookie_me
 def _list_plugins_installed(
     client: GrinningCatClient,
     plugins: PluginCollectionOutput,
+    untoggling_plugins_ids: List[str],
     cookie_me: Dict | None,
     core_plugins_ids: List[str] | None = None,
 ):
@@ -312,9 +270,7 @@ def _list_plugins_installed(
     st.markdown(f"Plugins (found {len(plugins.installed)} plugins):")
 
     if plugins.installed:
-        untoggling_plugins_ids = client.custom.get_custom("/admins/core_plugins/untoggling", DEFAULT_SYSTEM_KEY)
-
-        paginated_installed, current_page, total_pages = _paginate_items(
+        paginated_installed, current_page, total_pages = paginate_items(
             plugins.installed, "installed", ITEMS_PER_PAGE
         )
 
@@ -327,12 +283,12 @@ def _list_plugins_installed(
 
         # Pagination controls for installed plugins
         if total_pages > 1:
-            _render_pagination_controls("installed", current_page, total_pages)
+            render_pagination_controls("installed", current_page, total_pages)
 
 
 @st.dialog(title="Plugin Details", width="large")
 def view_plugin_details(plugin_id: str):
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     try:
         plugin_details = client.admins.get_plugin_details(plugin_id).data
 
@@ -388,7 +344,7 @@ def manage_plugin(plugin_id: str, untoggling_plugins_ids: List[str]):
     if not (agent_id := st.session_state.get("agent_id")):
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     # fetch the plugin
     try:
@@ -451,6 +407,7 @@ You have to activate the plugin before managing its settings.""")
             spinner_container = show_overlay_spinner(f"{'Untoggling' if is_plugin_active else 'Toggling'} plugin...")
             try:
                 client.plugins.put_toggle_plugin(plugin_id, agent_id)
+                invalidate_cached_reads(agent_id, "allowed_mime_types")  # file handlers may have been toggled
                 st.session_state["toast"] = {
                     "message": f"Plugin {plugin_id} {'untoggled' if is_plugin_active else 'toggled'} successfully!",
                     "icon": "✅",
@@ -488,7 +445,7 @@ You have to activate the plugin before managing its settings.""")
 
 
 def _install_plugin_from_file():
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Install Plugin from File")
 
     with st.form("upload_plugin_form", clear_on_submit=True, enter_to_submit=False):
@@ -524,7 +481,7 @@ def _install_plugin_from_file():
             st.toast("Please select a file to upload", icon="⚠️")
 
 
-def plugins_management(cookie_me: Dict | None):
+async def plugins_management(cookie_me: Dict | None):
     st.title("Plugins Management Dashboard")
 
     # Navigation
@@ -557,7 +514,7 @@ def plugins_management(cookie_me: Dict | None):
         return
 
     if menu_options[choice]["page"] == "browse_plugins":
-        _list_plugins(cookie_me)
+        await _list_plugins(cookie_me)
         return
 
     if menu_options[choice]["page"] == "install_from_file":
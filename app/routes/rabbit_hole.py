@@ -1,16 +1,561 @@
+import asyncio
+import fnmatch
+import hashlib
+import io
 import os
-import tempfile
 import time
-from typing import Dict
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Tuple
+import requests
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 import json
 import base64
+from grinning_cat_python_sdk import GrinningCatClient
+from grinning_cat_python_sdk.models.api.file_managers import FileResponse
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
+
+from app.concurrency import RateLimiter, run_call
+from app.env import get_env
+from app.hash_store import get_hash_store
+from app.transport import CircuitBreaker, get_circuit_breaker
+from app.uploads import (
+    MIME_SNIFF_SIZE,
+    ArchiveReader,
+    detect_mime_type,
+    hash_upload,
+    normalize_url,
+    open_upload,
+    parse_url_list,
+    read_sitemap,
+    sniff_mime_type,
+    spool,
+)
+from app.utils import (
+    CHUNK_COUNTS_PAGE_SIZE,
+    build_agents_select,
+    build_client_configuration,
+    get_allowed_mime_types,
+    show_overlay_spinner,
+    get_client,
+    has_access,
+    run_toast,
+    get_chunk_counts,
+    get_uploaded_files,
+    invalidate_uploaded_files,
+    iter_point_pages,
+    paginate_items,
+    render_download_button,
+    render_pagination_controls,
+)
+
+# Sorting keys of the uploaded files, by label
+FILES_SORT_KEYS = {
+    "Name": lambda file: file.name.lower(),
+    "Size": lambda file: file.size,
+    "Last modified": lambda file: file.last_modified,
+}
+FILES_PER_PAGE_OPTIONS = [20, 50, 100]
+# Extensions of the archives accepted by the archive upload
+ARCHIVE_FILE_TYPES = ["zip", "tar", "gz", "tgz", "bz2", "tbz2", "xz", "txz"]
+# Extensions of the sitemaps accepted by the bulk URL upload
+SITEMAP_FILE_TYPES = ["xml", "gz"]
+# Seconds between two refreshes of the progress of the uploads
+UPLOAD_PROGRESS_INTERVAL = 0.25
+# Files whose progress is shown in full, above which the progress rows scroll in a box of the given height in pixels
+UPLOAD_ROWS_VISIBLE = 10
+UPLOAD_ROWS_HEIGHT = 400
+UPLOAD_STATUS_ICONS = {
+    "queued": "⏳",
+    "uploading": "📤",
+    "retrying": "🔁",
+    "uploaded": "✅",
+    "failed": "❌",
+    "skipped": "⏭️",
+}
+
+
+class FileUpload:
+    """
+    A file of an upload batch, whose state is updated by the upload pipeline: the bytes sent are updated from the
+    threads sending the requests, the rest from the event loop of the script run.
+    """
+    def __init__(self, name: str, source: BinaryIO | None, metadata: Dict[str, Any], owns_source: bool = False):
+        self.name = name
+        self.source = source
+        self.offset = source.tell() if source is not None else 0
+        self.owns_source = owns_source
+        self.metadata = metadata
+        self.status = "queued"
+        self.reason: str | None = None
+        self.attempts = 0
+        self.bytes_sent = 0
+        self.total_bytes = 0
+        self.mime_type: str | None = None
+        self.sha256: str | None = None
+        self.size = 0
+        # whether the file replaces a file with the same name, whose chunks are deleted once the file is uploaded
+        self.replace = False
+        # the error deleting the chunks of the replaced copy, the file itself being uploaded
+        self.cleanup_error: str | None = None
+
+    def hash(self):
+        """Hash the source with SHA-256, unless it was already hashed while spooling it."""
+        if self.sha256 is None:
+            self.sha256, self.size = hash_upload(self.source)
+
+    @property
+    def progress(self) -> float:
+        if self.status in ("uploaded", "failed", "skipped"):
+            return 1.0
+        return self.bytes_sent / self.total_bytes if self.total_bytes else 0.0
+
+    def skip(self, reason: str):
+        self.status = "skipped"
+        self.reason = reason
+
+    def release(self):
+        """Close the source once uploaded, when the pipeline owns it, e.g. a file spooled from an archive."""
+        if self.owns_source and self.source is not None:
+            self.source.close()
+        self.source = None
+
+    def describe(self) -> str:
+        description = f"{UPLOAD_STATUS_ICONS[self.status]} {self.name}: {self.status}"
+        if self.replace and self.status != "skipped":
+            description += " (replacing)"
+        if self.status in ("uploading", "retrying"):
+            description += f" {self.progress:.0%}"
+        if self.attempts > 1:
+            description += f" (attempt {self.attempts})"
+        if self.reason:
+            description += f" - {self.reason}"
+        if self.cleanup_error:
+            description += f" - the chunks of the replaced copy were not deleted: {self.cleanup_error}"
+        return description
+
+
+def _check_mime_type(file_upload: FileUpload, mime_type: str, allowed_mime_types: List[str]):
+    """Skip a file if its MIME type, detected from its head as it is sent to the backend, is not allowed."""
+    file_upload.mime_type = mime_type
+    if file_upload.mime_type not in allowed_mime_types:
+        file_upload.skip(f"its type {file_upload.mime_type} is not allowed")
+
+
+def _preflight(file_uploads: List[FileUpload], allowed_mime_types: List[str]):
+    """
+    Check the MIME type of the files locally, sniffed from their head, before any upload starts: the backend would
+    only reject the files of a type not allowed after receiving them in full.
+    """
+    for file_upload in file_uploads:
+        if file_upload.status == "queued":
+            _check_mime_type(file_upload, sniff_mime_type(file_upload.source), allowed_mime_types)
+
+
+def _render_preflight(file_uploads: List[FileUpload]):
+    rejected = [file_upload for file_upload in file_uploads if file_upload.status == "skipped"]
+    with st.expander(
+        f"Preflight: {len(file_uploads) - len(rejected)} of {len(file_uploads)} files accepted", expanded=bool(rejected)
+    ):
+        st.dataframe(
+            [
+                {
+                    "File": file_upload.name,
+                    "Detected type": file_upload.mime_type or "-",
+                    "Verdict": "✅ accepted" if file_upload.status == "queued" else f"❌ {file_upload.reason}",
+                }
+                for file_upload in file_uploads
+            ],
+            hide_index=True,
+            width="stretch",
+        )
+
+
+def _is_transient_upload_error(e: BaseException) -> bool:
+    """Connection errors, timeouts, 5xx and 429 responses are worth a retry; other errors would fail again."""
+    if isinstance(e, requests.exceptions.HTTPError):
+        return e.response is not None and (e.response.status_code >= 500 or e.response.status_code == 429)
+    return isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def _upload_retrying() -> AsyncRetrying:
+    """Retry the transient failures of an upload with an exponential backoff, up to GRINNING_CAT_UPLOAD_MAX_ATTEMPTS."""
+    return AsyncRetrying(
+        stop=stop_after_attempt(int(get_env("GRINNING_CAT_UPLOAD_MAX_ATTEMPTS"))),
+        wait=wait_exponential(multiplier=1, max=30),
+        retry=retry_if_exception(_is_transient_upload_error),
+        reraise=True,
+    )
+
+
+def _post_file(client: GrinningCatClient, agent_id: str, file_upload: FileUpload):
+    def on_progress(bytes_sent: int, total_bytes: int):
+        file_upload.bytes_sent = bytes_sent
+        file_upload.total_bytes = total_bytes
+
+    # a retry sends the file again from its start
+    file_upload.source.seek(file_upload.offset)
+    with open_upload(file_upload.source) as stream:
+        client.rabbit_hole.post_file_streams(
+            files=[(file_upload.name, stream)],
+            agent_id=agent_id,
+            metadata={file_upload.name: file_upload.metadata},
+            on_progress=on_progress,
+        )
+
 
-from app.utils import build_agents_select, show_overlay_spinner, build_client_configuration, has_access, run_toast
+def _deduplicate(
+    file_upload: FileUpload,
+    listed: Dict[str, int],
+    known: Dict[str, Tuple[int, str]],
+    contents: Dict[str, str],
+    replace_changed: bool,
+):
+    """
+    Skip a hashed file if its content is already in the Knowledge Base, or in an earlier file of the batch.
 
+    Args:
+        file_upload: The file to check.
+        listed: The size of the files in the Knowledge Base, by name.
+        known: The size and the hash of the files uploaded before, by name (see HashStore).
+        contents: The name of the files in the Knowledge Base or in the batch, by hash; updated with the file.
+        replace_changed: Whether a file with the name of a file in the Knowledge Base, but not its content, replaces
+            it, or is skipped.
+    """
+    if file_upload.name in listed:
+        if listed[file_upload.name] == file_upload.size and known.get(file_upload.name) == (
+            file_upload.size, file_upload.sha256
+        ):
+            file_upload.skip("unchanged since its last upload")
+            return
+        if not replace_changed:
+            file_upload.skip(
+                "a file with the same name, but a different or unknown content, is in the Knowledge Base: tick "
+                "Replace changed files to replace it"
+            )
+            return
+        file_upload.replace = True
+    elif (name := contents.get(file_upload.sha256)) is not None:
+        file_upload.skip(f"same content as {name}")
+        return
+
+    contents[file_upload.sha256] = file_upload.name
+
+
+def _file_point_ids(client: GrinningCatClient, agent_id: str, name: str) -> List[str]:
+    """The IDs of the chunks of a file of the Knowledge Base."""
+    query = {"limit": CHUNK_COUNTS_PAGE_SIZE, "with_vectors": "false", "metadata": json.dumps({"source": name})}
+    return [point["id"] for points in iter_point_pages(client, agent_id, "declarative", query) for point in points]
+
+
+def _delete_file_points(client: GrinningCatClient, agent_id: str, point_ids: List[str]):
+    for point_id in point_ids:
+        client.memory.delete_memory_point("declarative", agent_id, point_id)
+
+
+async def _iterate(file_uploads: List[FileUpload]) -> AsyncIterator[FileUpload]:
+    for file_upload in file_uploads:
+        yield file_upload
+
+
+async def _run_upload_pipeline(
+    agent_id: str, file_uploads: AsyncIterator[FileUpload], total: int, replace_changed: bool = False
+) -> List[FileUpload]:
+    """
+    Upload the files concurrently, up to GRINNING_CAT_UPLOAD_CONCURRENCY at a time, with one request each, so that a
+    slow or failing file does not hold back the others. Transient failures are retried with an exponential backoff, up
+    to GRINNING_CAT_UPLOAD_MAX_ATTEMPTS attempts; the files still queued while the backend is unavailable are skipped.
+    The progress of each file is rendered while the uploads run.
+
+    Each file is hashed before its upload, and skipped if its content is already in the Knowledge Base (see
+    _deduplicate); the hash of each uploaded file is then saved to the hash store.
+
+    The files are only pulled from `file_uploads` when there is room for their upload, so that producing them, e.g.
+    extracting them from an archive, never runs ahead of the uploads.
+
+    Args:
+        agent_id: The agent to upload the files to.
+        file_uploads: The files to upload; the files already skipped are only reported.
+        total: The number of files, for the overall progress.
+        replace_changed: Whether the files with the name of a file in the Knowledge Base, but not its content, replace
+            it, or are skipped.
+
+    Returns:
+        The files pulled from `file_uploads`, with their final state.
+    """
+    configuration = build_client_configuration()
+    semaphore = asyncio.Semaphore(int(get_env("GRINNING_CAT_UPLOAD_CONCURRENCY")))
+    processed: List[FileUpload] = []
+
+    hash_store = get_hash_store()
+    listed = {file.name: file.size for file in get_uploaded_files(agent_id).files}
+    known = await asyncio.to_thread(hash_store.get, agent_id)
+    # the files in the Knowledge Base whose content is known, i.e. unchanged since their upload from here
+    contents = {sha256: name for name, (size, sha256) in known.items() if listed.get(name) == size}
+
+    async def upload(file_upload: FileUpload):
+        # runs holding a slot of the semaphore
+        try:
+            if get_circuit_breaker().state == CircuitBreaker.OPEN:
+                file_upload.skip("the backend is unavailable")
+                return
+
+            # the chunks of the replaced copy are only deleted once the new one is uploaded, so that a failed upload
+            # keeps it; the file itself is overwritten by the upload
+            replaced = []
+            if file_upload.replace:
+                replaced = await run_call(
+                    lambda client: _file_point_ids(client, agent_id, file_upload.name), configuration
+                )
+
+            async for attempt in _upload_retrying():
+                with attempt:
+                    file_upload.attempts += 1
+                    file_upload.status = "uploading" if file_upload.attempts == 1 else "retrying"
+                    file_upload.bytes_sent = 0
+                    await run_call(lambda client: _post_file(client, agent_id, file_upload), configuration)
+            await asyncio.to_thread(
+                hash_store.put, agent_id, file_upload.name, file_upload.size, file_upload.sha256
+            )
+            if replaced:
+                # the file is uploaded whatever the outcome, a failure only leaves the stale chunks behind
+                try:
+                    await run_call(lambda client: _delete_file_points(client, agent_id, replaced), configuration)
+                except Exception as e:
+                    file_upload.cleanup_error = str(e)
+            file_upload.status = "uploaded"
+        except Exception as e:
+            file_upload.status = "failed"
+            file_upload.reason = str(e)
+        finally:
+            file_upload.release()
+            semaphore.release()
 
-def _upload_files(agent_id: str, cookie_me: Dict | None):
+    async def feed():
+        tasks = []
+        try:
+            while True:
+                await semaphore.acquire()
+                if (file_upload := await anext(file_uploads, None)) is None:
+                    semaphore.release()
+                    break
+
+                processed.append(file_upload)
+                if file_upload.status == "queued":
+                    await asyncio.to_thread(file_upload.hash)
+                    _deduplicate(file_upload, listed, known, contents, replace_changed)
+                if file_upload.status != "queued":
+                    file_upload.release()
+                    semaphore.release()
+                    continue
+                tasks.append(asyncio.create_task(upload(file_upload)))
+        finally:
+            await asyncio.gather(*tasks)
+
+    overall_progress = st.progress(0.0)
+    rows_container = st.container(height=UPLOAD_ROWS_HEIGHT) if total > UPLOAD_ROWS_VISIBLE else st.container()
+    rows = []
+    rendered: List[str] = []
+
+    def render():
+        for i, file_upload in enumerate(processed):
+            if i == len(rows):
+                with rows_container:
+                    rows.append(st.empty())
+                rendered.append("")
+            # only the rows whose state changed are sent to the browser again
+            if rendered[i] != (description := file_upload.describe()):
+                rows[i].progress(file_upload.progress, text=description)
+                rendered[i] = description
+
+        finished = sum(file_upload.status in ("uploaded", "failed", "skipped") for file_upload in processed)
+        overall_progress.progress(
+            min(sum(file_upload.progress for file_upload in processed) / max(total, 1), 1.0),
+            text=f"{finished} of {total} files processed",
+        )
+
+    uploads = asyncio.ensure_future(feed())
+    while not uploads.done():
+        render()
+        await asyncio.wait([uploads], timeout=UPLOAD_PROGRESS_INTERVAL)
+    render()
+    uploads.result()  # propagate the errors of the producer
+
+    return processed
+
+
+def _render_upload_summary(file_uploads: List[FileUpload]):
+    by_status = {
+        status: [file_upload for file_upload in file_uploads if file_upload.status == status]
+        for status in ("uploaded", "failed", "skipped")
+    }
+    st.write(
+        f"**Uploaded**: {len(by_status['uploaded'])} - **Failed**: {len(by_status['failed'])} - "
+        f"**Skipped**: {len(by_status['skipped'])}"
+    )
+    for status in ("failed", "skipped"):
+        if by_status[status]:
+            with st.expander(f"{UPLOAD_STATUS_ICONS[status]} {status.capitalize()} files", expanded=True):
+                for file_upload in by_status[status]:
+                    st.write(f"**{file_upload.name}**: {file_upload.reason}")
+    if not_cleaned := [file_upload for file_upload in by_status["uploaded"] if file_upload.cleanup_error]:
+        with st.expander("⚠️ Uploaded files whose replaced chunks were not deleted", expanded=True):
+            for file_upload in not_cleaned:
+                st.write(f"**{file_upload.name}**: {file_upload.cleanup_error}")
+
+    if by_status["failed"]:
+        st.toast(f"{len(by_status['failed'])} of {len(file_uploads)} files failed to upload", icon="❌")
+    else:
+        st.toast(f"Successfully uploaded {len(by_status['uploaded'])} files!", icon="✅")
+
+
+def _reset_files_page():
+    st.session_state["files_page"] = 0
+
+
+def _filter_files(files: List[FileResponse], name_filter: str, sort_by: str, descending: bool) -> List[FileResponse]:
+    """Filter the files by a case-insensitive substring of their name, and sort them."""
+    name_filter = name_filter.strip().lower()
+    if name_filter:
+        files = [file for file in files if name_filter in file.name.lower()]
+    return sorted(files, key=FILES_SORT_KEYS[sort_by], reverse=descending)
+
+
+def _is_older(file: FileResponse, threshold: datetime) -> bool:
+    try:
+        last_modified = datetime.fromisoformat(file.last_modified)
+    except ValueError:
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified < threshold
+
+
+def _match_files(
+    files: List[FileResponse], pattern: str, older_than_days: int, larger_than_kb: int
+) -> List[FileResponse]:
+    """
+    Match the files to select for a bulk delete: by a case-insensitive glob pattern of their name, e.g. "*.pdf", and
+    optionally by being modified more than some days ago, or being larger than some KB.
+    """
+    pattern = pattern.strip().lower() or "*"
+    threshold = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    return [
+        file for file in files
+        if fnmatch.fnmatchcase(file.name.lower(), pattern)
+        and (not older_than_days or _is_older(file, threshold))
+        and (not larger_than_kb or file.size > larger_than_kb * 1024)
+    ]
+
+
+def _toggle_selected_file(agent_id: str, name: str):
+    selected = st.session_state.setdefault(f"files_selected_{agent_id}", set())
+    if st.session_state[f"select_{agent_id}_{name}"]:
+        selected.add(name)
+    else:
+        selected.discard(name)
+
+
+async def _delete_files(agent_id: str, names: List[str]) -> Dict[str, str]:
+    """
+    Delete files of the Knowledge Base concurrently, up to GRINNING_CAT_BULK_DELETE_CONCURRENCY at a time, rendering the
+    progress of the deletes.
+
+    Returns:
+        The error of each file that failed to be deleted, by name.
+    """
+    configuration = build_client_configuration()
+    semaphore = asyncio.Semaphore(int(get_env("GRINNING_CAT_BULK_DELETE_CONCURRENCY")))
+    progress = st.progress(0.0, text=f"0 of {len(names)} files deleted")
+    failures: Dict[str, str] = {}
+    processed = 0
+
+    async def delete(name: str):
+        nonlocal processed
+
+        async with semaphore:
+            try:
+                await run_call(lambda client: client.file_manager.delete_file(agent_id, name), configuration)
+            except Exception as e:
+                failures[name] = str(e)
+            finally:
+                processed += 1
+                progress.progress(
+                    processed / len(names), text=f"{processed - len(failures)} of {len(names)} files deleted"
+                )
+
+    await asyncio.gather(*(delete(name) for name in names))
+    return failures
+
+
+async def _render_bulk_delete(agent_id: str, files: List[FileResponse], listed_files: List[FileResponse]):
+    """
+    Render the selection of the files to delete at once, by filters among the listed files or by hand in the list, and
+    their deletion after a single confirmation. The listing and the chunk counts are invalidated once, at the end.
+    """
+    # the selection belongs to the agent: files with the same names under another agent are not selected
+    selected = st.session_state.setdefault(f"files_selected_{agent_id}", set())
+    selected.intersection_update(file.name for file in files)
+
+    with st.expander("Bulk delete", expanded=bool(selected)):
+        col1, col2, col3 = st.columns([0.5, 0.25, 0.25])
+        with col1:
+            pattern = st.text_input("Name pattern", key="bulk_pattern", placeholder="*.pdf")
+        with col2:
+            older_than_days = st.number_input("Older than (days)", min_value=0, step=1, key="bulk_older_than")
+        with col3:
+            larger_than_kb = st.number_input("Larger than (KB)", min_value=0, step=1, key="bulk_larger_than")
+
+        matching = _match_files(listed_files, pattern, older_than_days, larger_than_kb)
+        st.write(f"**Matching files**: {len(matching)} - **Selected files**: {len(selected)}")
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("Select matching files", disabled=not matching):
+                selected.update(file.name for file in matching)
+                st.rerun()
+        with col2:
+            if st.button("Clear selection", disabled=not selected):
+                selected.clear()
+                st.rerun()
+        with col3:
+            if st.button("🗑️ Delete selected files", type="primary", disabled=not selected):
+                st.session_state[f"files_bulk_delete_{agent_id}"] = True
+
+    if not selected or not st.session_state.get(f"files_bulk_delete_{agent_id}"):
+        return
+
+    st.warning(f"⚠️ Are you sure you want to permanently delete {len(selected)} files?")
+    col1, col2 = st.columns(2)
+    with col1:
+        confirmed = st.button(f"Yes, Delete {len(selected)} Files", type="primary")
+    with col2:
+        if st.button("Cancel", key="cancel_bulk_delete"):
+            st.session_state.pop(f"files_bulk_delete_{agent_id}", None)
+            st.rerun()
+    if not confirmed:
+        return
+
+    to_delete = sorted(selected)
+    try:
+        failures = await _delete_files(agent_id, to_delete)
+        deleted = [name for name in to_delete if name not in failures]
+        await asyncio.to_thread(get_hash_store().delete_files, agent_id, deleted)
+    finally:
+        invalidate_uploaded_files(agent_id)
+
+    st.session_state.pop(f"files_bulk_delete_{agent_id}", None)
+    st.session_state[f"files_selected_{agent_id}"] = set(failures)
+    if failures:
+        st.session_state[f"files_bulk_delete_failures_{agent_id}"] = failures
+        st.session_state["toast"] = {
+            "message": f"{len(failures)} of {len(to_delete)} files failed to be deleted", "icon": "❌",
+        }
+    else:
+        st.session_state["toast"] = {"message": f"{len(deleted)} files deleted successfully!", "icon": "✅"}
+    st.rerun()
+
+
+async def _upload_files(agent_id: str, cookie_me: Dict | None):
     def add_file_pair():
         st.session_state["file_metadata_pairs"].append({"file": None, "metadata": "{}"})
 
@@ -20,11 +565,10 @@ def _upload_files(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have permission to upload files.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
     st.header("Upload Files")
 
-    allowed_file_types = client.rabbit_hole.get_allowed_mime_types(agent_id)
-    st.markdown(f"""**Allowed file types**: {', '.join(allowed_file_types.allowed)}""")
+    allowed_mime_types = get_allowed_mime_types(agent_id)
+    st.markdown(f"""**Allowed file types**: {', '.join(allowed_mime_types)}""")
 
     st.session_state["file_metadata_pairs"] = st.session_state.get(
         "file_metadata_pairs", [{"file": None, "metadata": "{}"}],
@@ -65,13 +609,15 @@ def _upload_files(agent_id: str, cookie_me: Dict | None):
                         st.session_state["remove_index"] = i
                         st.rerun()
 
+        replace_changed = st.checkbox(
+            "Replace changed files",
+            help="Replace the files with the same name of a file in the Knowledge Base but a different content",
+        )
         if not st.form_submit_button("📤 Upload Files"):
             return
 
-        file_paths = []
-        metadata_dict = {}
+        file_uploads = {}
         has_errors = False
-        temp_files = []  # Keep track of temporary files for cleanup
 
         for i, pair in enumerate(st.session_state["file_metadata_pairs"]):
             if not pair["file"]:
@@ -83,47 +629,140 @@ def _upload_files(agent_id: str, cookie_me: Dict | None):
                 # Validate JSON metadata
                 metadata = json.loads(pair["metadata"])
 
-                # Save uploaded file to temporary location
-                uploaded_file = pair["file"]
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False,
-                    suffix=f"_{uploaded_file.name}"
-                )
-                temp_file.write(uploaded_file.getbuffer())
-                temp_file.close()
-
-                # Add to our lists
-                file_paths.append(temp_file.name)
-                temp_files.append(temp_file.name)  # For cleanup
-                metadata_dict[uploaded_file.name] = metadata
+                file_upload = FileUpload(pair["file"].name, pair["file"], metadata)
+                if file_upload.name in file_uploads:
+                    # the backend stores the files by name: the last one would overwrite the others
+                    file_upload.skip(f"File {i + 1} has the same name of another file")
+                    file_uploads[f"{file_upload.name}#{i}"] = file_upload
+                else:
+                    file_uploads[file_upload.name] = file_upload
             except json.JSONDecodeError:
                 st.error(f"Invalid JSON format in metadata for File {i + 1}")
                 has_errors = True
 
-        if has_errors or not file_paths:
+        if has_errors or not file_uploads:
             return
 
-        try:
-            spinner_container = show_overlay_spinner(f"Loading files to RAG...")
+        _preflight(list(file_uploads.values()), allowed_mime_types)
+        _render_preflight(list(file_uploads.values()))
 
-            client.rabbit_hole.post_files(
-                file_paths=file_paths,
-                agent_id=agent_id,
-                metadata=metadata_dict,
+        try:
+            processed = await _run_upload_pipeline(
+                agent_id, _iterate(list(file_uploads.values())), len(file_uploads), replace_changed
             )
-            st.toast(f"Successfully uploaded {len(file_paths)} files!", icon="✅")
-            # Clear the files after successful upload
+            _render_upload_summary(processed)
+            # Clear the files after the upload
             st.session_state["file_metadata_pairs"] = [{"file": None, "metadata": "{}"}]
         except Exception as e:
             st.toast(f"Error uploading files: {e}", icon="❌")
         finally:
-            spinner_container.empty()  # Remove the spinner
-            # Clean up temporary files
-            for temp_file_path in temp_files:
-                try:
-                    os.unlink(temp_file_path)
-                except OSError:
-                    pass  # Ignore cleanup errors
+            invalidate_uploaded_files(agent_id)
+
+
+async def _archive_file_uploads(
+    reader: ArchiveReader,
+    manifest: Dict[str, Dict[str, Any]],
+    metadata: Dict[str, Any],
+    allowed_mime_types: List[str],
+) -> AsyncIterator[FileUpload]:
+    """
+    Extract the files of an archive one at a time, spooling and hashing each one (see spool) only when its MIME type,
+    sniffed from its head, is allowed. Extraction runs in a thread, so that the progress of the uploads keeps being rendered.
+    """
+    def next_file_upload() -> FileUpload | None:
+        if (entry := next(files, None)) is None:
+            return None
+
+        path, stream = entry
+        name = os.path.basename(path)
+        if name in names:
+            # the backend stores the files by name: the last one would overwrite the others
+            file_upload = FileUpload(name, None, {})
+            file_upload.skip(f"{path} has the same name of another file of the archive")
+            return file_upload
+        names.add(name)
+
+        file_upload = FileUpload(name, None, metadata | manifest.get(path, {}))
+        head = stream.read(MIME_SNIFF_SIZE)
+        _check_mime_type(file_upload, detect_mime_type(head), allowed_mime_types)
+        if file_upload.status == "skipped":
+            return file_upload
+
+        # the file is hashed while spooling it, rather than read once more
+        digest = hashlib.sha256()
+        file_upload.source = spool(stream, head, digest)
+        file_upload.owns_source = True
+        file_upload.sha256 = digest.hexdigest()
+        file_upload.size = file_upload.source.seek(0, io.SEEK_END)
+        file_upload.source.seek(0)
+        return file_upload
+
+    files = reader.files()
+    names = set()
+    while (file_upload := await asyncio.to_thread(next_file_upload)) is not None:
+        yield file_upload
+
+
+async def _upload_archive(agent_id: str, cookie_me: Dict | None):
+    run_toast()
+
+    if not has_access("UPLOAD", "WRITE", cookie_me):
+        st.error("You do not have permission to upload files.")
+        return
+
+    st.header("Upload Archive")
+
+    allowed_mime_types = get_allowed_mime_types(agent_id)
+    st.markdown(f"""**Allowed file types**: {', '.join(allowed_mime_types)}""")
+    st.info(
+        "Upload a ZIP or tar archive (optionally compressed) of documents: each file of an allowed type is uploaded "
+        "to the Knowledge Base. Metadata can be set per file with a `manifest.json` (an object mapping the path of each "
+        "file to its metadata) or a `manifest.csv` (a `file` column with the path, and a column per metadata key) at "
+        "the root of the archive."
+    )
+
+    with st.form("upload_archive_form", clear_on_submit=True, enter_to_submit=False):
+        archive = st.file_uploader("Archive", type=ARCHIVE_FILE_TYPES)
+        metadata = st.text_area(
+            "Metadata (JSON format)",
+            value="{}",
+            height=150,
+            help="Enter metadata as JSON for all the files; the metadata of the manifest take precedence",
+        )
+        replace_changed = st.checkbox(
+            "Replace changed files",
+            help="Replace the files with the same name of a file in the Knowledge Base but a different content",
+        )
+
+        if not st.form_submit_button("📤 Upload Archive"):
+            return
+
+        if not archive:
+            st.error("Please select an archive")
+            return
+
+        try:
+            metadata_dict = json.loads(metadata)
+        except json.JSONDecodeError:
+            st.error("Invalid JSON format in metadata")
+            return
+
+        try:
+            with ArchiveReader(archive) as reader:
+                manifest = reader.read_manifest()
+                processed = await _run_upload_pipeline(
+                    agent_id,
+                    _archive_file_uploads(reader, manifest, metadata_dict, allowed_mime_types),
+                    reader.count_files(),
+                    replace_changed,
+                )
+            _render_upload_summary(processed)
+        except ValueError as e:
+            st.error(str(e))
+        except Exception as e:
+            st.toast(f"Error uploading archive: {e}", icon="❌")
+        finally:
+            invalidate_uploaded_files(agent_id)
 
 
 def _upload_url(agent_id: str, cookie_me: Dict | None):
@@ -133,7 +772,7 @@ def _upload_url(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have permission to upload files.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Upload from URL")
 
     with st.form("upload_url_form", clear_on_submit=True, enter_to_submit=False):
@@ -167,79 +806,231 @@ def _upload_url(agent_id: str, cookie_me: Dict | None):
             st.toast(f"Error uploading URL: {e}", icon="❌")
         finally:
             spinner_container.empty()
+            invalidate_uploaded_files(agent_id)
+
+
+def _collect_urls(
+    urls_text: str, sitemap: BinaryIO | None, metadata: Dict[str, Any]
+) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, str]], int]:
+    """
+    Collect the URLs of a sitemap and of a list (see parse_url_list), normalized and deduplicated: the metadata of the
+    list override the shared ones, and the ones of the duplicates of a URL are merged.
+
+    Returns:
+        The metadata of each URL, by normalized URL, the result rows of the invalid URLs, and the number of duplicates.
 
+    Raises:
+        ValueError: If the sitemap or the metadata of the list are malformed.
+    """
+    entries = [(url, {}) for url in read_sitemap(sitemap)] if sitemap else []
+    entries += [(url, overrides) for _, url, overrides in parse_url_list(urls_text)]
 
-def _list_files(agent_id: str, cookie_me: Dict | None):
-    def download_file(file_name):
+    urls: Dict[str, Dict[str, Any]] = {}
+    invalid = []
+    duplicates = 0
+    for url, overrides in entries:
         try:
-            response = client.file_manager.get_file(agent_id, file_name)
-            return response.content
-        except Exception as ex:
-            st.toast(f"Error downloading file: {ex}", icon="❌")
-            return None
+            normalized = normalize_url(url)
+        except ValueError as e:
+            invalid.append({"URL": url, "Result": "❌ invalid", "Details": str(e)})
+            continue
+
+        if normalized in urls:
+            duplicates += 1
+            urls[normalized].update(overrides)
+        else:
+            urls[normalized] = metadata | overrides
+
+    return urls, invalid, duplicates
+
+
+async def _submit_urls(agent_id: str, urls: Dict[str, Dict[str, Any]]) -> List[Dict[str, str]]:
+    """
+    Submit the URLs to the Knowledge Base, up to GRINNING_CAT_UPLOAD_CONCURRENCY at a time and at most
+    GRINNING_CAT_WEB_INGEST_RATE per second, retrying the transient failures as the file uploads do.
+
+    Returns:
+        The result row of each URL, in the same order.
+    """
+    configuration = build_client_configuration()
+    semaphore = asyncio.Semaphore(int(get_env("GRINNING_CAT_UPLOAD_CONCURRENCY")))
+    rate_limiter = RateLimiter(float(get_env("GRINNING_CAT_WEB_INGEST_RATE")))
+    progress = st.progress(0.0, text=f"0 of {len(urls)} URLs submitted")
+    submitted = 0
+
+    async def submit(url: str, metadata: Dict[str, Any]) -> Dict[str, str]:
+        nonlocal submitted
+
+        async with semaphore:
+            try:
+                if get_circuit_breaker().state == CircuitBreaker.OPEN:
+                    return {"URL": url, "Result": "⏭️ skipped", "Details": "the backend is unavailable"}
+
+                async for attempt in _upload_retrying():
+                    with attempt:
+                        await rate_limiter.wait()
+                        response = await run_call(
+                            lambda client: client.rabbit_hole.post_web(url, agent_id, metadata=metadata), configuration
+                        )
+                return {"URL": url, "Result": "✅ accepted", "Details": response.info}
+            except Exception as e:
+                return {"URL": url, "Result": "❌ failed", "Details": str(e)}
+            finally:
+                submitted += 1
+                progress.progress(submitted / len(urls), text=f"{submitted} of {len(urls)} URLs submitted")
 
+    return list(await asyncio.gather(*(submit(url, metadata) for url, metadata in urls.items())))
+
+
+async def _upload_urls(agent_id: str, cookie_me: Dict | None):
+    run_toast()
+
+    if not has_access("UPLOAD", "WRITE", cookie_me):
+        st.error("You do not have permission to upload files.")
+        return
+
+    st.header("Bulk Upload from URLs")
+    st.info(
+        "Paste a list of URLs, one per line, and/or upload a `sitemap.xml` (optionally gzipped): the URLs are "
+        "normalized, deduplicated and submitted concurrently, at most "
+        f"{get_env('GRINNING_CAT_WEB_INGEST_RATE')} per second. A URL of the list can be followed by a JSON object "
+        "with its own metadata, overriding the shared ones, e.g. `https://example.com/page {\"lang\": \"en\"}`."
+    )
+
+    with st.form("upload_urls_form", clear_on_submit=True, enter_to_submit=False):
+        urls_text = st.text_area(
+            "URLs",
+            height=200,
+            placeholder="https://example.com\nhttps://example.com/about {\"section\": \"about\"}",
+            help="One URL per line, optionally followed by a JSON object with its metadata",
+        )
+        sitemap = st.file_uploader("Sitemap", type=SITEMAP_FILE_TYPES)
+        metadata = st.text_area(
+            "Metadata (JSON format)",
+            value="{}",
+            help="Enter metadata as JSON for all the URLs; the metadata of each URL take precedence",
+        )
+
+        if not st.form_submit_button("🌐 Upload URLs"):
+            return
+
+        try:
+            urls, invalid, duplicates = _collect_urls(urls_text, sitemap, json.loads(metadata))
+        except json.JSONDecodeError:
+            st.error("Invalid JSON format in metadata")
+            return
+        except ValueError as e:
+            st.error(str(e))
+            return
+
+        if not urls and not invalid:
+            st.error("Please enter some URLs or select a sitemap")
+            return
+
+        if duplicates:
+            st.caption(f"{duplicates} duplicate URLs merged")
+
+        try:
+            results = invalid + await _submit_urls(agent_id, urls)
+        except Exception as e:
+            st.toast(f"Error uploading URLs: {e}", icon="❌")
+            return
+        finally:
+            invalidate_uploaded_files(agent_id)
+
+        accepted = sum(result["Result"] == "✅ accepted" for result in results)
+        st.write(f"**Accepted**: {accepted} - **Not accepted**: {len(results) - accepted}")
+        st.dataframe(results, hide_index=True, width="stretch")
+        if accepted == len(results):
+            st.toast(f"{accepted} URLs are being ingested!", icon="✅")
+        else:
+            st.toast(f"{len(results) - accepted} of {len(results)} URLs were not accepted", icon="❌")
+
+
+async def _list_files(agent_id: str, cookie_me: Dict | None):
     run_toast()
 
     if not has_access("MEMORY", "READ", cookie_me):
         st.error("You do not have permission to view uploaded files.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Uploaded Files")
 
     try:
-        files = client.file_manager.get_file_manager_attributes(agent_id)
+        files = get_uploaded_files(agent_id)
 
         # print the total size and number of files
         st.write(f"**Total files uploaded**: {len(files.files)}")
         st.write(f"**Total size of uploaded files**: {files.size} bytes")
 
-        for file in files.files:
-            col1, col2, col3 = st.columns([0.8, 0.1, 0.1])
+        col1, col2, col3, col4 = st.columns([0.4, 0.25, 0.2, 0.15])
+        with col1:
+            name_filter = st.text_input("Filter by name", key="files_filter", on_change=_reset_files_page)
+        with col2:
+            sort_by = st.selectbox("Sort by", FILES_SORT_KEYS, key="files_sort_by", on_change=_reset_files_page)
+        with col3:
+            order = st.selectbox("Order", ["Ascending", "Descending"], key="files_order", on_change=_reset_files_page)
+        with col4:
+            files_per_page = st.selectbox(
+                "Files per page", FILES_PER_PAGE_OPTIONS, key="files_per_page", on_change=_reset_files_page
+            )
+
+        listed_files = _filter_files(files.files, name_filter, sort_by, order == "Descending")
+        if not listed_files:
+            st.info("No files found matching your filter")
 
-            with col1:
-                chunks = client.memory.get_memory_points(
-                    agent_id=agent_id,
-                    collection="declarative",
-                    metadata={"source": file.name},
-                )
+        can_delete = has_access("MEMORY", "DELETE", cookie_me)
+        if can_delete:
+            await _render_bulk_delete(agent_id, files.files, listed_files)
 
-                with st.expander(f"{file.name} ({file.size} bytes)"):
-                    st.write(f"**Name**: {file.name}")
-                    st.write(f"**Size**: {file.size}")
-                    st.write(f"**Last modified**: {file.last_modified}")
-                    st.write(f"**Chunks**: {len(chunks.points)}")
+        if failures := st.session_state.pop(f"files_bulk_delete_failures_{agent_id}", None):
+            with st.expander(f"❌ {len(failures)} files failed to be deleted", expanded=True):
+                for name, error in failures.items():
+                    st.write(f"**{name}**: {error}")
 
-            with col2:
-                # Use a regular button instead of download_button
-                if st.button("Download", key=f"download_{file.name}"):
-                    # Only fetch the file content when button is clicked
-                    file_content = download_file(file.name)
-                    if file_content:
-                        # Store in session state to trigger download
-                        st.session_state[f"download_content_{file.name}"] = file_content
-                        st.toast("Download started!", icon="✅")
-                        st.rerun()
+        paginated_files, current_page, total_pages = paginate_items(listed_files, "files", files_per_page)
+        selected = st.session_state.get(f"files_selected_{agent_id}", set())
+
+        for file in paginated_files:
+            col0, col1, col2, col3 = st.columns([0.04, 0.76, 0.1, 0.1])
 
-                # Check if we have content ready to download
-                if f"download_content_{file.name}" in st.session_state:
-                    # Create the actual download button with the fetched content
-                    st.download_button(
-                        label="Click to save",
-                        data=st.session_state[f"download_content_{file.name}"],
-                        file_name=file.name,
-                        key=f"save_{file.name}"
+            with col0:
+                if can_delete:
+                    # the selection spans the pages, while the checkboxes only live as long as their page is shown
+                    st.session_state[f"select_{agent_id}_{file.name}"] = file.name in selected
+                    st.checkbox(
+                        f"Select {file.name}",
+                        key=f"select_{agent_id}_{file.name}",
+                        label_visibility="collapsed",
+                        on_change=_toggle_selected_file,
+                        args=(agent_id, file.name),
                     )
-                    # Clear the session state after download
-                    st.session_state.pop(f"download_content_{file.name}", None)
+
+            with col1:
+                # the content of the expander only runs when it is open, so the chunks are only counted on demand
+                expander = st.expander(f"{file.name} ({file.size} bytes)", key=f"details_{file.name}", on_change="rerun")
+                if expander.open:
+                    with expander:
+                        st.write(f"**Name**: {file.name}")
+                        st.write(f"**Size**: {file.size}")
+                        st.write(f"**Last modified**: {file.last_modified}")
+                        st.write(f"**Chunks**: {get_chunk_counts(agent_id).get(file.name, 0)}")
+
+            with col2:
+                render_download_button(agent_id, file.name, key=f"download_{file.name}")
 
             with col3:
-                if has_access("MEMORY", "DELETE", cookie_me):
+                if can_delete:
                     if st.button("Delete", key=f"delete_{file.name}", help="Permanently delete this file"):
                         st.session_state["file_to_delete"] = file
                 else:
                     st.button("Delete", key=f"delete_{file.name}", disabled=True, help="You do not have permission to delete files")
 
+        # Pagination controls for the files
+        if total_pages > 1:
+            render_pagination_controls("files", current_page, total_pages)
+
         # Delete confirmation
         if not (file := st.session_state.get("file_to_delete")):
             return
@@ -258,6 +1049,7 @@ def _list_files(agent_id: str, cookie_me: Dict | None):
                     spinner_container = show_overlay_spinner(f"Deleting file {file.name}...")
 
                     client.file_manager.delete_file(agent_id, file.name)
+                    get_hash_store().delete(agent_id, file.name)
                     st.toast(f"File {file.name} deleted successfully!", icon="✅")
                     st.session_state.pop("file_to_delete", None)
                     time.sleep(1)  # Wait for a moment before rerunning
@@ -265,6 +1057,7 @@ def _list_files(agent_id: str, cookie_me: Dict | None):
                     st.error(f"Error deleting admin: {e}", icon="❌")
                 finally:
                     spinner_container.empty()
+                    invalidate_uploaded_files(agent_id)
 
                 st.rerun()
         with col2:
@@ -275,7 +1068,7 @@ def _list_files(agent_id: str, cookie_me: Dict | None):
         st.toast(f"Error fetching files: {e}", icon="❌")
 
 
-def rabbit_hole_management(cookie_me: Dict | None):
+async def rabbit_hole_management(cookie_me: Dict | None):
     st.title("Knowledge Base Management")
 
     st.info("**Disclaimer**: If you want to store the files of the Knowledge Base to a specific file manager, please select one in the **File Managers** section.")
@@ -294,10 +1087,18 @@ def rabbit_hole_management(cookie_me: Dict | None):
             "page": "upload_files",
             "permission": has_access("UPLOAD", "WRITE", cookie_me),
         },
+        "Upload Archive": {
+            "page": "upload_archive",
+            "permission": has_access("UPLOAD", "WRITE", cookie_me),
+        },
         "Upload from URL": {
             "page": "upload_url",
             "permission": has_access("UPLOAD", "WRITE", cookie_me),
         },
+        "Bulk Upload from URLs": {
+            "page": "upload_urls",
+            "permission": has_access("UPLOAD", "WRITE", cookie_me),
+        },
         "View Uploaded Files": {
             "page": "list_files",
             "permission": has_access("MEMORY", "READ", cookie_me),
@@ -316,12 +1117,20 @@ def rabbit_hole_management(cookie_me: Dict | None):
     choice = st.selectbox("Menu", choices)
 
     if menu_options[choice]["page"] == "upload_files":
-        _upload_files(agent_id, cookie_me)
+        await _upload_files(agent_id, cookie_me)
+        return
+
+    if menu_options[choice]["page"] == "upload_archive":
+        await _upload_archive(agent_id, cookie_me)
         return
 
     if menu_options[choice]["page"] == "upload_url":
         _upload_url(agent_id, cookie_me)
         return
 
+    if menu_options[choice]["page"] == "upload_urls":
+        await _upload_urls(agent_id, cookie_me)
+        return
+
     if menu_options[choice]["page"] == "list_files":
-        _list_files(agent_id, cookie_me)
+        await _list_files(agent_id, cookie_me)
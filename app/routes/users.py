@@ -1,11 +1,12 @@
 import json
 import time
 from typing import Dict, List
+import requests
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 
+from app.concurrency import gather_reads, run_sync
 from app.constants import DEFAULT_SYSTEM_KEY
-from app.utils import build_agents_select, show_overlay_spinner, build_client_configuration, run_toast, has_access
+from app.utils import build_agents_select, show_overlay_spinner, get_client, run_toast, has_access
 
 
 def _sanitize_selected_permissions(permissions: Dict[str, List[str]]) -> Dict[str, List[str]]:
@@ -45,7 +46,7 @@ def _create_user(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have permission to create users.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     # Initialize form key in session state if not present
     st.session_state["user_form_key"] = st.session_state.get("user_form_key", 0)
@@ -126,7 +127,7 @@ def _list_users(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have permission to view users.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("List All Users")
 
     try:
@@ -200,7 +201,7 @@ def _get_user(agent_id: str, user_id: str, cookie_me: Dict | None):
         st.error("You do not have permission to view user details.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header(f"User Details for ID: {user_id}")
 
     try:
@@ -216,13 +217,19 @@ def _update_user(agent_id: str, user_id: str, cookie_me: Dict | None):
         st.error("You do not have permission to update users.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header(f"Update User ID: {user_id}")
 
     try:
-        user_data = client.users.get_user(user_id, agent_id)
-    except Exception:
-        st.error(f"User with ID `{user_id}` not found")
+        user_data, available_permissions = run_sync(gather_reads(
+            lambda c: c.users.get_user(user_id, agent_id),
+            lambda c: c.auth.get_available_permissions(),
+        ))
+    except Exception as e:
+        if isinstance(e, requests.exceptions.HTTPError) and e.response is not None and e.response.status_code == 404:
+            st.error(f"User with ID `{user_id}` not found")
+        else:
+            st.error(f"Error fetching user `{user_id}`: {e}")
         return
 
     with st.form("update_user_form", enter_to_submit=False):
@@ -239,7 +246,7 @@ def _update_user(agent_id: str, user_id: str, cookie_me: Dict | None):
         st.subheader("Permissions")
 
         current_permissions = user_data.permissions
-        available_permissions = _sanitize_retrieved_permissions(client.auth.get_available_permissions(), agent_id)
+        available_permissions = _sanitize_retrieved_permissions(available_permissions, agent_id)
 
         selected_permissions = {}
         for res, perms in available_permissions.items():
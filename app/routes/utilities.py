@@ -2,9 +2,18 @@ import json
 import time
 from typing import Dict
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 
-from app.utils import show_overlay_spinner, build_client_configuration, has_access, run_toast, cache_cookie_me
+from app.hash_store import get_hash_store
+from app.utils import (
+    show_overlay_spinner,
+    get_client,
+    has_access,
+    run_toast,
+    cache_cookie_me,
+    invalidate_cached_reads,
+    get_agents_catalogue,
+    invalidate_agents_catalogue,
+)
 
 
 def _factory_reset(cookie_me: Dict | None):
@@ -14,7 +23,7 @@ def _factory_reset(cookie_me: Dict | None):
         st.error("You do not have permission to perform a factory reset.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Factory Reset")
 
     st.warning("""
@@ -30,6 +39,8 @@ def _factory_reset(cookie_me: Dict | None):
     spinner_container = show_overlay_spinner("Performing factory reset...")
     try:
         result = client.utils.post_factory_reset()
+        invalidate_cached_reads()
+        get_hash_store().delete()
 
         if result.deleted_settings and result.deleted_plugin_folders and result.deleted_memories:
             st.toast("Factory reset completed successfully!", icon="✅")
@@ -58,11 +69,11 @@ def _list_agents(cookie_me: Dict | None):
         st.error("You do not have permission to view agents.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Agent Management")
 
     try:
-        agents = client.utils.get_agents()
+        agents = get_agents_catalogue().agents
 
         if not agents:
             st.info("No agents found")
@@ -153,6 +164,7 @@ def _list_agents(cookie_me: Dict | None):
                     try:
                         with st.spinner(f"Cloning agent {agent}..."):
                             result = client.utils.post_agent_clone(agent_id=agent, new_agent_id=new_agent_id)
+                        invalidate_agents_catalogue()
                         if result.cloned:
                             st.toast(f"Agent {agent} cloned successfully!", icon="✅")
                             st.session_state.pop("agent_to_clone", None)
@@ -182,6 +194,8 @@ def _list_agents(cookie_me: Dict | None):
                     try:
                         with st.spinner(f"Resetting agent {agent}..."):
                             result = client.utils.post_agent_reset(agent_id=agent)
+                        invalidate_cached_reads(agent)
+                        get_hash_store().delete(agent)
                         if result.deleted_settings:
                             st.toast(f"Agent {agent} reset successfully!", icon="✅")
                             st.session_state.pop("agent_to_reset", None)
@@ -209,6 +223,9 @@ def _list_agents(cookie_me: Dict | None):
                     try:
                         with st.spinner(f"Destroying agent {agent}..."):
                             result = client.utils.post_agent_destroy(agent_id=agent)
+                        invalidate_cached_reads(agent)
+                        get_hash_store().delete(agent)
+                        invalidate_agents_catalogue()
                         if result.deleted_settings and result.deleted_memories:
                             st.toast(f"Agent {agent} destroyed successfully!", icon="✅")
                             st.session_state.pop("agent_to_destroy", None)
@@ -236,7 +253,7 @@ def _create_agent(cookie_me: Dict | None):
         st.error("You do not have permission to create agents.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Create New Agent")
 
     with st.form("create_agent_form", clear_on_submit=True, enter_to_submit=False):
@@ -263,6 +280,7 @@ def _create_agent(cookie_me: Dict | None):
         try:
             spinner_container = show_overlay_spinner(f"Creating agent {agent_id}...")
             result = client.utils.post_agent_create(agent_id=agent_id, metadata=metadata)
+            invalidate_agents_catalogue()
             if result.created:
                 st.toast(f"Agent {agent_id} created successfully!", icon="✅")
                 if cookie_me:
@@ -283,7 +301,7 @@ def _update_agent(agent_id: str, metadata: Dict, cookie_me: Dict | None):
         st.error("You do not have permission to update agents.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header(f"Update Agent ID: {agent_id}")
 
     with st.form("update_agent_form", enter_to_submit=False):
@@ -315,6 +333,7 @@ def _update_agent(agent_id: str, metadata: Dict, cookie_me: Dict | None):
         except Exception as e:
             st.session_state["toast"] = {"message": f"Error updating agent `{agent_id}`: {e}", "icon": "❌"}
         finally:
+            invalidate_agents_catalogue()
             spinner_container.empty()
             time.sleep(1)
             st.rerun()
@@ -1,14 +1,15 @@
 import json
 from typing import Dict
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient
 
 from app.utils import (
+    cached_read,
+    invalidate_cached_reads,
     get_factory_settings,
     build_agents_select,
     run_toast,
     show_overlay_spinner,
-    build_client_configuration,
+    get_client,
     render_json_form,
     has_access,
 )
@@ -21,11 +22,15 @@ def _list_vector_databases(agent_id: str, cookie_me: Dict | None):
         st.error("You do not have access to view vector databases for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     st.header("Vector Databases")
 
     try:
-        settings = client.vector_database.get_vector_databases_settings(agent_id)
+        settings = cached_read(
+            agent_id,
+            "vector_database",
+            lambda: client.vector_database.get_vector_databases_settings(agent_id),
+        )
 
         st.write("### Available Vector Databases")
         if not settings.settings:
@@ -64,7 +69,7 @@ def _edit_vector_database(agent_id: str, vector_database_name: str, is_selected:
         st.error("You do not have access to edit vector databases for this agent.")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
 
     st.subheader(f"Editing: **{vector_database_name}**")
     try:
@@ -97,6 +102,7 @@ def _edit_vector_database(agent_id: str, vector_database_name: str, is_selected:
                 except Exception as e:
                     st.session_state["toast"] = {"message": f"Error updating vector database: {e}", "icon": "❌"}
                 finally:
+                    invalidate_cached_reads(agent_id, "vector_database")
                     spinner_container.empty()
 
                 st.rerun()
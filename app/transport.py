@@ -0,0 +1,280 @@
+import threading
+import time
+from typing import Dict
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import RetryCallState, wait_exponential
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from app.env import get_env
+
+
+class PoolStats:
+    """Thread-safe counters of the shared connection pool."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def record(self, hit: bool, wait_time: float):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self.wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            requests_count = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / requests_count if requests_count else 0.0,
+                "total_wait_time": self.wait_time,
+                "avg_wait_time": self.wait_time / requests_count if requests_count else 0.0,
+                "max_wait_time": self.max_wait_time,
+            }
+
+
+_pool_stats = PoolStats()
+
+
+class _CountingPoolMixin:
+    """
+    Connection pool recording whether a request reused a live connection (hit) or had to open a new one (miss), and
+    how long it waited for a free connection. Connections idle for longer than the idle timeout are closed on checkout.
+    """
+    idle_timeout: float = 0
+
+    def _get_conn(self, timeout: float | None = None):
+        started_at = time.perf_counter()
+        conn = super()._get_conn(timeout)
+        wait_time = time.perf_counter() - started_at
+
+        last_used = getattr(conn, "_grinning_cat_last_used", None)
+        if (
+            getattr(conn, "sock", None) is not None
+            and self.idle_timeout
+            and last_used is not None
+            and time.monotonic() - last_used > self.idle_timeout
+        ):
+            conn.close()
+
+        _pool_stats.record(getattr(conn, "sock", None) is not None, wait_time)
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._grinning_cat_last_used = time.monotonic()
+        super()._put_conn(conn)
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class BackendUnavailableError(requests.exceptions.ConnectionError):
+    """Raised without reaching the network while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker shared by all the requests to the backend.
+
+    - closed: requests flow; after `failure_threshold` consecutive failures the breaker opens.
+    - open: requests fail immediately with BackendUnavailableError until the backoff delay expires. The delay grows
+      exponentially with the number of consecutive openings.
+    - half_open: a single probe request is let through; its success closes the breaker, its failure opens it again. A
+      probe without a result after `probe_timeout` seconds counts as failed.
+
+    Each change of state starts a new generation: the result of a request started in a previous generation is ignored,
+    so that e.g. a slow request failing after the backend recovered does not open the breaker again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, backoff_base: float, backoff_max: float, probe_timeout: float):
+        self._lock = threading.Lock()
+        self._failure_threshold = failure_threshold
+        self._wait = wait_exponential(multiplier=backoff_base, max=backoff_max)
+        self._probe_timeout = probe_timeout
+        self._state = self.CLOSED
+        self._generation = 0
+        self._failures = 0
+        self._openings = 0
+        self._retry_at = 0.0
+        self._probe_deadline = 0.0
+
+    def _set_state(self, state: str):
+        self._state = state
+        self._generation += 1
+
+    def _open(self):
+        self._openings += 1
+        retry_state = RetryCallState(None, None, (), {})
+        retry_state.attempt_number = self._openings
+
+        self._set_state(self.OPEN)
+        self._retry_at = time.monotonic() + self._wait(retry_state)
+
+    def _expire_probe(self):
+        if self._state == self.HALF_OPEN and time.monotonic() >= self._probe_deadline:
+            self._open()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._expire_probe()
+            if self._state == self.OPEN and time.monotonic() >= self._retry_at:
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds before the next probe is allowed, when open."""
+        with self._lock:
+            self._expire_probe()
+            return max(0.0, self._retry_at - time.monotonic()) if self._state == self.OPEN else 0.0
+
+    def before_request(self) -> int:
+        """
+        Let a request through, or reject it.
+
+        Returns:
+            The generation the request starts in, to pass to record_success or record_failure.
+
+        Raises:
+            BackendUnavailableError: If the breaker is open, or its probe is in flight.
+        """
+        with self._lock:
+            self._expire_probe()
+            if self._state == self.CLOSED:
+                return self._generation
+
+            if self._state == self.OPEN and time.monotonic() >= self._retry_at:
+                self._set_state(self.HALF_OPEN)  # this request is the probe
+                self._probe_deadline = time.monotonic() + self._probe_timeout
+                return self._generation
+
+            retry_in = max(0.0, self._retry_at - time.monotonic())
+            raise BackendUnavailableError(f"Grinning Cat backend unavailable, retrying in {retry_in:.0f}s")
+
+    def record_success(self, generation: int):
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            if self._state != self.CLOSED:
+                self._set_state(self.CLOSED)
+            self._failures = 0
+            self._openings = 0
+
+    def record_failure(self, generation: int):
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._failures += 1
+            if self._state != self.HALF_OPEN and self._failures < self._failure_threshold:
+                return
+
+            self._open()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter backed by connection pools that record their usage and close idle connections, guarded by the circuit
+    breaker: connection errors, timeouts and 5xx responses count as failures.
+    """
+    def __init__(
+        self, pool_connections: int, pool_maxsize: int, idle_timeout: float, connect_timeout: float, read_timeout: float
+    ):
+        self._idle_timeout = idle_timeout
+        self._timeout = (connect_timeout, read_timeout)
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+
+    def send(self, request, timeout=None, **kwargs):
+        circuit_breaker = get_circuit_breaker()
+        generation = circuit_breaker.before_request()
+
+        try:
+            # the SDK sets no timeout: never wait for an unreachable or hanging backend longer than the default timeouts
+            response = super().send(request, timeout=timeout or self._timeout, **kwargs)
+        except requests.exceptions.RequestException:
+            circuit_breaker.record_failure(generation)
+            raise
+
+        if response.status_code >= 500:
+            circuit_breaker.record_failure(generation)
+        else:
+            circuit_breaker.record_success(generation)
+        return response
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+        pool_classes = {
+            "http": type("HTTPConnectionPool", (_CountingHTTPConnectionPool,), {"idle_timeout": self._idle_timeout}),
+            "https": type("HTTPSConnectionPool", (_CountingHTTPSConnectionPool,), {"idle_timeout": self._idle_timeout}),
+        }
+        self.poolmanager.pool_classes_by_scheme = pool_classes
+
+
+_adapter: PooledHTTPAdapter | None = None
+_circuit_breaker: CircuitBreaker | None = None
+_lock = threading.Lock()
+
+
+def get_http_adapter() -> PooledHTTPAdapter:
+    """
+    Get the process-wide HTTP adapter shared by all the sessions, so that the TCP and TLS connections to the backend
+    are opened once and then reused by every admin.
+
+    Returns:
+        The shared adapter, configured by the GRINNING_CAT_HTTP_POOL_* environment variables.
+    """
+    global _adapter
+
+    if _adapter is None:
+        with _lock:
+            if _adapter is None:
+                _adapter = PooledHTTPAdapter(
+                    pool_connections=int(get_env("GRINNING_CAT_HTTP_POOL_SIZE")),
+                    pool_maxsize=int(get_env("GRINNING_CAT_HTTP_POOL_MAXSIZE")),
+                    idle_timeout=float(get_env("GRINNING_CAT_HTTP_POOL_IDLE_TIMEOUT")),
+                    connect_timeout=float(get_env("GRINNING_CAT_HTTP_CONNECT_TIMEOUT")),
+                    read_timeout=float(get_env("GRINNING_CAT_HTTP_READ_TIMEOUT")),
+                )
+    return _adapter
+
+
+def get_pool_stats() -> Dict[str, float]:
+    """Get a snapshot of the counters of the shared connection pool."""
+    return _pool_stats.snapshot()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide circuit breaker guarding the requests to the backend."""
+    global _circuit_breaker
+
+    if _circuit_breaker is None:
+        with _lock:
+            if _circuit_breaker is None:
+                _circuit_breaker = CircuitBreaker(
+                    failure_threshold=int(get_env("GRINNING_CAT_BREAKER_FAILURE_THRESHOLD")),
+                    backoff_base=float(get_env("GRINNING_CAT_BREAKER_BACKOFF_BASE")),
+                    backoff_max=float(get_env("GRINNING_CAT_BREAKER_BACKOFF_MAX")),
+                    # the probe has timed out by then, unless it is still streaming a response
+                    probe_timeout=float(get_env("GRINNING_CAT_HTTP_CONNECT_TIMEOUT"))
+                    + float(get_env("GRINNING_CAT_HTTP_READ_TIMEOUT")),
+                )
+    return _circuit_breaker
@@ -0,0 +1,385 @@
+import contextlib
+import csv
+import gzip
+import hashlib
+import io
+import itertools
+import json
+import os
+import tarfile
+import tempfile
+import zipfile
+from urllib.parse import urlsplit, urlunsplit
+from xml.etree import ElementTree
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Tuple
+import magic
+from grinning_cat_python_sdk.endpoints import RabbitHoleEndpoint
+from grinning_cat_python_sdk.models.api.rabbit_holes import UploadSingleFileResponse
+from grinning_cat_python_sdk.utils import deserialize
+from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+
+from app.env import get_env
+
+# Bytes sniffed at the head of a file to detect its MIME type, as the SDK does
+MIME_SNIFF_SIZE = 2048
+# Bytes copied at once when spooling a stream
+SPOOL_CHUNK_SIZE = 1024 * 1024
+# Files at the root of an archive with the metadata of its entries, by path
+ARCHIVE_MANIFEST_NAMES = ("manifest.json", "manifest.csv")
+# Ports omitted from the normalized URLs, by scheme
+DEFAULT_PORTS = {"http": 80, "https": 443}
+SITEMAP_NAMESPACE = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+class MemoryViewReader:
+    """
+    Read-only stream over a memoryview, to send an in-memory buffer without copying it: each read only copies the
+    requested chunk. The `len` property, i.e. the bytes left to read, lets MultipartEncoder compute the length of the
+    request body.
+    """
+    def __init__(self, view: memoryview):
+        self._view = view.cast("B")
+        self._position = 0
+
+    @property
+    def len(self) -> int:
+        return len(self._view) - self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: len(self._view)}[whence]
+        self._position = min(max(base + offset, 0), len(self._view))
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._position + size, len(self._view))
+        chunk = self._view[self._position:end].tobytes()
+        self._position = end
+        return chunk
+
+
+class SpooledReader:
+    """
+    Stream over a spooled temporary file, kept in memory up to the spooling threshold and rolled over to disk above
+    it. It does not expose `fileno`, which would roll the file over to disk, so MultipartEncoder reads its `len`.
+    """
+    def __init__(self, spooled: tempfile.SpooledTemporaryFile):
+        self._spooled = spooled
+        self._size = spooled.seek(0, io.SEEK_END)
+        spooled.seek(0)
+
+    @property
+    def len(self) -> int:
+        return self._size - self._spooled.tell()
+
+    def tell(self) -> int:
+        return self._spooled.tell()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._spooled.seek(offset, whence)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._spooled.read(size)
+
+
+def spool(stream: BinaryIO, head: bytes = b"", digest: Any = None) -> tempfile.SpooledTemporaryFile:
+    """
+    Copy a stream to a spooled temporary file, kept in memory up to GRINNING_CAT_UPLOAD_SPOOL_THRESHOLD bytes and rolled
+    over to disk above it. `head` is the beginning of the stream, if already read from it; `digest`, if given, is a
+    hashlib object updated with the content while copying it.
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=int(get_env("GRINNING_CAT_UPLOAD_SPOOL_THRESHOLD")))
+    try:
+        for chunk in itertools.chain([head], iter(lambda: stream.read(SPOOL_CHUNK_SIZE), b"")):
+            if digest is not None:
+                digest.update(chunk)
+            spooled.write(chunk)
+        spooled.seek(0)
+    except BaseException:
+        spooled.close()
+        raise
+    return spooled
+
+
+@contextlib.contextmanager
+def open_upload(source: BinaryIO) -> Iterator[BinaryIO]:
+    """
+    Open a file to upload as a stream for the multipart body of the request.
+
+    In-memory files, like the files uploaded to Streamlit, are read from a memoryview of their buffer, without any
+    copy, and so are the files already spooled (see spool). Other streams are spooled first.
+
+    Args:
+        source: The file to upload, read from its current position.
+
+    Returns:
+        A context manager yielding the stream, and releasing the spooled file, if any, on exit.
+    """
+    if hasattr(source, "getbuffer"):
+        # getvalue shares the buffer of a BytesIO that was never written to, while getbuffer would copy it
+        yield MemoryViewReader(memoryview(source.getvalue())[source.tell():])
+        return
+
+    if isinstance(source, tempfile.SpooledTemporaryFile):
+        yield SpooledReader(source)
+        return
+
+    with spool(source) as spooled:
+        yield SpooledReader(spooled)
+
+
+def hash_upload(source: BinaryIO) -> Tuple[str, int]:
+    """
+    Hash a file to upload with SHA-256, from its current position, leaving it there. In-memory files are hashed from a
+    memoryview of their buffer, without any copy.
+
+    Returns:
+        The hex digest and the size of the file.
+    """
+    position = source.tell()
+    if hasattr(source, "getbuffer"):
+        view = memoryview(source.getvalue())[position:]
+        return hashlib.sha256(view).hexdigest(), len(view)
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        for chunk in iter(lambda: source.read(SPOOL_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    finally:
+        source.seek(position)
+    return digest.hexdigest(), size
+
+
+def detect_mime_type(head: bytes) -> str:
+    """Detect the MIME type of a file from its head, i.e. its first MIME_SNIFF_SIZE bytes."""
+    return magic.from_buffer(head, mime=True)
+
+
+def sniff_mime_type(stream: BinaryIO) -> str:
+    """Detect the MIME type of a stream from its head, leaving the stream at its position."""
+    position = stream.tell()
+    head = stream.read(MIME_SNIFF_SIZE)
+    stream.seek(position)
+    return detect_mime_type(head)
+
+
+class ArchiveReader:
+    """
+    Reader of the files of a ZIP or tar archive, optionally compressed, one at a time and without extracting the
+    archive: only the index of its members is kept in memory.
+
+    The archive may contain a manifest (see ARCHIVE_MANIFEST_NAMES) with the metadata of its files: a JSON object
+    mapping the path of each file to its metadata, or a CSV file with a `file` column holding the path and one column
+    per metadata key.
+    """
+    def __init__(self, source: BinaryIO):
+        source.seek(0)
+        if zipfile.is_zipfile(source):
+            source.seek(0)
+            self._zip: zipfile.ZipFile | None = zipfile.ZipFile(source)
+            self._tar: tarfile.TarFile | None = None
+            return
+
+        source.seek(0)
+        try:
+            self._tar = tarfile.open(fileobj=source, mode="r:*")
+        except tarfile.TarError as e:
+            raise ValueError("The file is not a ZIP or tar archive") from e
+        self._zip = None
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+
+    def _members(self) -> Dict[str, Any]:
+        """The members of the archive which are files, by path."""
+        if self._zip is not None:
+            return {info.filename: info for info in self._zip.infolist() if not info.is_dir()}
+        return {member.name: member for member in self._tar.getmembers() if member.isfile()}
+
+    def _open(self, member: Any) -> BinaryIO:
+        if self._zip is not None:
+            return self._zip.open(member)
+        return self._tar.extractfile(member)
+
+    def count_files(self) -> int:
+        """The number of files of the archive, but the manifest."""
+        return len([path for path in self._members() if path not in ARCHIVE_MANIFEST_NAMES])
+
+    def read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the metadata of the files from the manifest of the archive, if any.
+
+        Returns:
+            The metadata of each file listed in the manifest, by path.
+
+        Raises:
+            ValueError: If the manifest is malformed.
+        """
+        members = self._members()
+        name = next((name for name in ARCHIVE_MANIFEST_NAMES if name in members), None)
+        if name is None:
+            return {}
+
+        with self._open(members[name]) as stream:
+            content = io.TextIOWrapper(stream, encoding="utf-8-sig")
+            if name.endswith(".json"):
+                try:
+                    manifest = json.load(content)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON format in {name}: {e}") from e
+                if not isinstance(manifest, dict) or not all(isinstance(value, dict) for value in manifest.values()):
+                    raise ValueError(f"{name} must map the path of each file to an object of metadata")
+                return manifest
+
+            rows = csv.DictReader(content)
+            if "file" not in (rows.fieldnames or []):
+                raise ValueError(f"{name} must have a `file` column")
+            return {
+                row["file"]: {key: value for key, value in row.items() if key != "file" and value not in (None, "")}
+                for row in rows
+            }
+
+    def files(self) -> Iterator[Tuple[str, BinaryIO]]:
+        """
+        Iterate over the files of the archive, but the manifest, in the order they are stored, which is the cheapest
+        one for compressed tar archives.
+
+        Returns:
+            An iterator of the path and the stream of each file; a stream is only valid until the next iteration.
+        """
+        for path, member in self._members().items():
+            if path in ARCHIVE_MANIFEST_NAMES:
+                continue
+            with self._open(member) as stream:
+                yield path, stream
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL, so that the URLs of the same page compare equal: the scheme and the host are lowercased, the
+    default port and the fragment are dropped, and an empty path becomes "/".
+
+    Raises:
+        ValueError: If the URL is not an absolute HTTP(S) URL.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        raise ValueError(f"{url} is not an absolute HTTP(S) URL")
+
+    netloc = parts.hostname
+    if parts.port is not None and parts.port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{parts.port}"
+    if parts.username:
+        credentials = f"{parts.username}:{parts.password}" if parts.password else parts.username
+        netloc = f"{credentials}@{netloc}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+def parse_url_list(text: str) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+    """
+    Parse a list of URLs, one per line, each one optionally followed by a JSON object with its metadata. Blank lines
+    and lines starting with # are ignored.
+
+    Returns:
+        An iterator of the line number, the URL and the metadata of each line.
+
+    Raises:
+        ValueError: If the metadata of a line is not a JSON object.
+    """
+    for number, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        url, _, metadata = line.partition(" ")
+        overrides: Dict[str, Any] = {}
+        if metadata.strip():
+            try:
+                overrides = json.loads(metadata)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON format in the metadata of line {number}: {e}") from e
+            if not isinstance(overrides, dict):
+                raise ValueError(f"The metadata of line {number} must be a JSON object")
+        yield number, url, overrides
+
+
+def read_sitemap(source: BinaryIO) -> List[str]:
+    """
+    Read the URLs of the pages listed in a sitemap, optionally gzipped, parsing it incrementally.
+
+    Raises:
+        ValueError: If the file is not a sitemap, or is a sitemap index, whose sitemaps must be read one by one.
+    """
+    head = source.read(2)
+    source.seek(-len(head), io.SEEK_CUR)
+    stream = gzip.GzipFile(fileobj=source) if head == b"\x1f\x8b" else source
+
+    urls = []
+    try:
+        for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+            tag = element.tag.removeprefix(SITEMAP_NAMESPACE)
+            if event == "start":
+                if tag == "sitemapindex":
+                    raise ValueError("The file is a sitemap index: upload each of its sitemaps instead")
+                continue
+            if tag == "loc" and element.text:
+                urls.append(element.text.strip())
+            elif tag == "url":
+                element.clear()
+    except (ElementTree.ParseError, gzip.BadGzipFile, EOFError) as e:
+        raise ValueError(f"The file is not a valid sitemap: {e}") from e
+    return urls
+
+
+class StreamingRabbitHoleEndpoint(RabbitHoleEndpoint):
+    """RabbitHoleEndpoint also uploading files from streams, without writing them to disk first."""
+    def post_file_streams(
+        self,
+        files: List[Tuple[str, BinaryIO]],
+        agent_id: str,
+        chat_id: str | None = None,
+        metadata: Dict[str, Any] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> Dict[str, UploadSingleFileResponse]:
+        """
+        Post multiple files to the RabbitHole API, as post_files does, streaming them into the body of the request.
+
+        Args:
+            files: The name and the stream of each file (see open_upload).
+            agent_id: The ID of the agent.
+            chat_id: The ID of the chat (optional).
+            metadata: The metadata to include with the files, by file name.
+            on_progress: Called, from the thread sending the request, with the bytes of the body sent so far and its
+                total length.
+
+        Returns:
+            The response of the RabbitHole API for each file.
+        """
+        fields: List[Tuple[str, Any]] = [
+            ("files", (os.path.basename(name), stream, sniff_mime_type(stream))) for name, stream in files
+        ]
+        if metadata is not None:
+            fields.append(("metadata", json.dumps(metadata)))
+        body = MultipartEncoder(fields=fields)
+        if on_progress is not None:
+            body = MultipartEncoderMonitor(body, lambda monitor: on_progress(monitor.bytes_read, monitor.len))
+
+        endpoint = self.format_url("/batch") if not chat_id else self.format_url(f"/batch/{chat_id}")
+        response = self.get_http_client(agent_id).post(endpoint, data=body, headers={"Content-Type": body.content_type})
+        response.raise_for_status()
+
+        return {key: deserialize(item, UploadSingleFileResponse) for key, item in response.json().items()}
@@ -1,14 +1,29 @@
+import contextlib
+import functools
+import hashlib
 import json
-from typing import Dict, Any, List, Tuple
+from typing import Callable, Dict, Any, FrozenSet, Iterator, List, Tuple, TypeVar
 from grinning_cat_python_sdk.models.api.nested.plugins import PluginSettingsOutput
+from requests_toolbelt.sessions import BaseUrlSession
 from slugify import slugify
 import streamlit as st
-from grinning_cat_python_sdk import GrinningCatClient, Configuration
+from grinning_cat_python_sdk import GrinningCatClient, Configuration, HttpClient
+from grinning_cat_python_sdk.models.api.admins import AgentOutput
 from grinning_cat_python_sdk.models.api.factories import FactoryObjectSettingOutput
+from grinning_cat_python_sdk.models.api.file_managers import FileManagerAttributes
 from streamlit_js_eval import set_cookie
 
+from app.cache import get_cache
 from app.constants import DEFAULT_SYSTEM_KEY
 from app.env import get_env, get_env_bool
+from app.metrics import SDK_NAMESPACES, InstrumentedEndpoint
+from app.transport import get_http_adapter
+from app.uploads import StreamingRabbitHoleEndpoint, spool
+
+T = TypeVar("T")
+
+# Points read per request when scanning a memory collection to count its chunks
+CHUNK_COUNTS_PAGE_SIZE = 1000
 
 
 def get_settings(
@@ -63,16 +78,39 @@ def get_factory_settings(
     return values, types
 
 
+class AgentsCatalogue:
+    """The agents of the backend, with their slugs computed once."""
+    def __init__(self, agents: List[AgentOutput]):
+        self.agents = agents
+        self.slugs = {agent.agent_id: slugify(agent.agent_id) for agent in agents}
+
+
+def get_agents_catalogue() -> AgentsCatalogue:
+    """
+    Get the agents of the backend, read through the cache (see cached_read). The catalogue is invalidated by
+    invalidate_agents_catalogue whenever agents are created, cloned, updated or destroyed.
+    """
+    return cached_read(DEFAULT_SYSTEM_KEY, "agents", lambda: AgentsCatalogue(get_client().utils.get_agents()))
+
+
+def invalidate_agents_catalogue():
+    invalidate_cached_reads(DEFAULT_SYSTEM_KEY, "agents")
+
+
+@functools.lru_cache(maxsize=1024)
+def _slugify_agent(agent_id: str) -> str:
+    return slugify(agent_id)
+
+
 def build_agents_options_select(cookie_me: Dict | None, excluded_agents: List[str] | None = None) -> Dict[str, str]:
     if cookie_me:  # login by credentials
-        agents = [agent["agent_name"] for agent in cookie_me.get("agents", [])]
+        slugs = {agent["agent_name"]: _slugify_agent(agent["agent_name"]) for agent in cookie_me.get("agents", [])}
     else:  # login by API key
-        client = GrinningCatClient(build_client_configuration())
-        agents = [agent.agent_id for agent in client.utils.get_agents()]
+        slugs = get_agents_catalogue().slugs
 
-    return {
-        agent: slugify(agent) for agent in agents if agent not in (excluded_agents or [])
-    }
+    if not excluded_agents:
+        return dict(slugs)
+    return {agent: slug for agent, slug in slugs.items() if agent not in excluded_agents}
 
 
 def build_agents_select(k: str, cookie_me: Dict | None, force_system_agent: bool = False):
@@ -112,7 +150,7 @@ def build_users_select(k: str, agent_id: str, cookie_me: Dict | None):
         st.session_state["user_id"] = agent_match.get("user", {}).get("id")
         return
 
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     users = client.users.get_users(agent_id)
 
     # Navigation
@@ -127,7 +165,7 @@ def build_users_select(k: str, agent_id: str, cookie_me: Dict | None):
 
 
 def build_conversations_select(k: str, agent_id: str, user_id: str):
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     conversations = client.conversation.get_conversations(agent_id, user_id)
 
     if not conversations:
@@ -215,6 +253,100 @@ def build_client_configuration():
     )
 
 
+class KeepAliveHttpClient(HttpClient):
+    """HTTP client reusing one session, plugged into the shared pool of keep-alive connections, for all the requests."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session: BaseUrlSession | None = None
+
+    def get_client(
+        self, agent_id: str | None = None, user_id: str | None = None, chat_id: str | None = None
+    ) -> BaseUrlSession:
+        # the middlewares only ever set the scoping headers: a call without a user or a chat must not inherit them from
+        # a previous call, the client being reused for the whole session
+        self.headers = {}
+        return super().get_client(agent_id, user_id, chat_id)
+
+    def get_base_session(self) -> BaseUrlSession:
+        if self._session is None:
+            self._session = BaseUrlSession(base_url=self.get_http_uri())
+            self._session.mount("http://", get_http_adapter())
+            self._session.mount("https://", get_http_adapter())
+        self._session.headers = self.headers
+
+        return self._session
+
+    def close(self):
+        # the connections belong to the shared pool: closing the session would close them for every other session
+        self._session = None
+
+
+class PooledGrinningCatClient(GrinningCatClient):
+    """
+    GrinningCatClient whose HTTP requests go through a long-lived KeepAliveHttpClient, and whose endpoints record the
+    latency of their calls.
+    """
+    def __init__(self, configuration: Configuration):
+        super().__init__(configuration)
+        self._keep_alive_http_client = KeepAliveHttpClient(
+            host=configuration.host,
+            port=configuration.port,
+            apikey=configuration.auth_key,
+            is_https=configuration.secure_connection,
+        )
+
+    def add_token(self, token: str) -> "PooledGrinningCatClient":
+        super().add_token(token)
+        self._keep_alive_http_client.set_token(token)
+        return self
+
+    @property
+    def http_client(self) -> KeepAliveHttpClient:
+        return self._keep_alive_http_client
+
+    @property
+    def rabbit_hole(self) -> StreamingRabbitHoleEndpoint:
+        return StreamingRabbitHoleEndpoint(self)
+
+    def __getattribute__(self, name: str) -> Any:
+        attribute = super().__getattribute__(name)
+        if name in SDK_NAMESPACES:
+            return InstrumentedEndpoint(name, attribute)
+        return attribute
+
+    def close(self):
+        self._keep_alive_http_client.close()
+
+
+def get_client() -> GrinningCatClient:
+    """
+    Get the client of the current session for the configured backend.
+
+    Clients are kept in a registry keyed by (host, port, token, secure connection), so that every call of a page render
+    reuses the same client and its keep-alive connections. Clients bound to a previous token are dropped.
+
+    Returns:
+        The long-lived client for the current configuration.
+    """
+    configuration = build_client_configuration()
+    key = (configuration.host, configuration.port, configuration.auth_key, configuration.secure_connection)
+
+    registry = st.session_state.setdefault("clients", {})
+    if key not in registry:
+        # the token has changed (e.g. login, logout, expiration): the previous clients are no longer usable
+        drop_clients()
+        registry = st.session_state.setdefault("clients", {})
+        registry[key] = PooledGrinningCatClient(configuration)
+
+    return registry[key]
+
+
+def drop_clients():
+    """Close and remove all the clients of the current session."""
+    for client in st.session_state.pop("clients", {}).values():
+        client.close()
+
+
 def render_json_form(data: Dict, types: Dict, prefix: str = "") -> Dict:
     """Recursively render form fields for JSON data."""
     def infer_type() -> str:
@@ -261,6 +393,102 @@ def render_json_form(data: Dict, types: Dict, prefix: str = "") -> Dict:
     return result
 
 
+def render_pagination_controls(section_key: str, current_page: int, total_pages: int):
+    """Render pagination controls for a section."""
+    def go_to_page(page: int):
+        # callbacks run before the script, so that the page input can be kept in sync with the page
+        st.session_state[f"{section_key}_page"] = page
+        st.session_state[f"{section_key}_page_input"] = page + 1
+
+    def on_page_input():
+        st.session_state[f"{section_key}_page"] = st.session_state[f"{section_key}_page_input"] - 1
+
+    col0, col1, col2, col3, col4, col5 = st.columns([0.15, 0.08, 0.09, 0.23, 0.15, 0.3])
+
+    with col1:
+        st.button(
+            "← Previous",
+            key=f"{section_key}_prev",
+            disabled=current_page == 0,
+            on_click=go_to_page,
+            args=(current_page - 1,),
+        )
+
+    with col2:
+        st.markdown(
+            f"<div style='text-align: center; margin-top: 0.5em;'>Page {current_page + 1} of {total_pages}</div>",
+            unsafe_allow_html=True
+        )
+
+    with col3:
+        if st.session_state.get(f"{section_key}_page_input") != current_page + 1:
+            st.session_state[f"{section_key}_page_input"] = current_page + 1
+        st.number_input(
+            "Go to page",
+            min_value=1,
+            max_value=total_pages,
+            step=1,
+            key=f"{section_key}_page_input",
+            on_change=on_page_input,
+            label_visibility="collapsed"
+        )
+
+    with col4:
+        st.button(
+            "Next →",
+            key=f"{section_key}_next",
+            disabled=current_page >= total_pages - 1,
+            on_click=go_to_page,
+            args=(current_page + 1,),
+        )
+
+
+def paginate_items(items: List, section_key: str, items_per_page: int):
+    """Paginate a list of items and return the current page items."""
+    # Initialize session state for pagination
+    if f"{section_key}_page" not in st.session_state:
+        st.session_state[f"{section_key}_page"] = 0
+
+    total_items = len(items)
+    total_pages = (total_items - 1) // items_per_page + 1 if total_items > 0 else 1
+    current_page = st.session_state[f"{section_key}_page"]
+
+    # Go back to the last page when the items shrank, e.g. after filtering them
+    if current_page >= total_pages:
+        current_page = st.session_state[f"{section_key}_page"] = total_pages - 1
+
+    # Calculate pagination range
+    start_idx = current_page * items_per_page
+    end_idx = min(start_idx + items_per_page, total_items)
+    paginated_items = items[start_idx:end_idx]
+
+    return paginated_items, current_page, total_pages
+
+
+def _get_permission_index(cookie_me: Dict) -> Dict[str, Dict[str, FrozenSet[str]]]:
+    """
+    Get the roles of the logged-in user by agent and resource, built once per `me` payload and kept in the session
+    state along with the payload it was built from. Equal sets of roles are shared, as they repeat across resources
+    and agents.
+    """
+    cached = st.session_state.get("permission_index")
+    if cached is not None and cached[0] is cookie_me:
+        return cached[1]
+
+    index = {}
+    role_sets = {}
+    for agent in cookie_me.get("agents", []):
+        if (agent_name := agent.get("agent_name")) in index:
+            continue  # the first match wins
+        index[agent_name] = {
+            resource: role_sets.setdefault(frozenset(roles), frozenset(roles))
+            for resource, roles in agent.get("user", {}).get("permissions", {}).items()
+        }
+
+    st.session_state["permission_index"] = (cookie_me, index)
+    return index
+
+
 def has_access(resource: str, required_role: str | None, cookie_me: Dict | None, only_admin: bool | None = False) -> bool:
     """Check if the logged-in user has the required role."""
     if not cookie_me: # logged by API key
@@ -273,20 +501,218 @@ def has_access(resource: str, required_role: str | None, cookie_me: Dict | None,
     if only_admin and agent_id != DEFAULT_SYSTEM_KEY:
         return False
 
-    try:
-        # in cookie_me.agents find the one with agent_id
-        agent_match = next((agent for agent in cookie_me.get("agents", []) if agent.get("agent_name") == agent_id), None)
-        if not agent_match:
-            return False
-
-        user_permissions = agent_match.get("user", {}).get("permissions", {}).get(resource, [])
-        return required_role in user_permissions if required_role else len(user_permissions) > 0
-    except json.JSONDecodeError:
+    agent_permissions = _get_permission_index(cookie_me).get(agent_id)
+    if agent_permissions is None:
         return False
 
+    user_permissions = agent_permissions.get(resource, frozenset())
+    return required_role in user_permissions if required_role else len(user_permissions) > 0
+
+
+def get_auth_scope() -> str:
+    """
+    Get a digest of what the credentials of the current session can see: the API key when logged by API key, the
+    agents and the permissions on them when logged by credentials. Sessions with the same scope get the same view of
+    the backend, so they can share the results of their reads.
+    """
+    if cookie_me := st.session_state.get("me"):
+        view = sorted(
+            (
+                agent.get("agent_name"),
+                sorted((resource, sorted(roles)) for resource, roles in agent.get("user", {}).get("permissions", {}).items()),
+            )
+            for agent in cookie_me.get("agents", [])
+        )
+        material = json.dumps(view)
+    else:
+        material = f"token:{st.session_state.get('token')}"
+
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def cached_read(agent_id: str, kind: str, loader: Callable[[], T], ttl: float | None = None) -> T:
+    """
+    Read through the process-wide cache, for GRINNING_CAT_CACHE_TTL seconds. Entries are scoped by the auth scope of
+    the session (see get_auth_scope), so that results never cross permission boundaries, and are shared between the
+    sessions: callers must not mutate them.
+
+    Args:
+        agent_id: The agent the read refers to.
+        kind: What is read, e.g. the SDK namespace of a factory.
+        loader: Callable performing the read on a cache miss.
+        ttl: Seconds the result is reused, instead of GRINNING_CAT_CACHE_TTL, e.g. for an expensive read.
+
+    Returns:
+        The cached or freshly loaded result.
+    """
+    if ttl is None:
+        ttl = float(get_env("GRINNING_CAT_CACHE_TTL"))
+    return get_cache().get((agent_id, kind, get_auth_scope()), loader, ttl)
+
+
+def invalidate_cached_reads(agent_id: str | None = None, kind: str | None = None):
+    """Invalidate the cached reads of a kind for an agent, of all the kinds for an agent, or all of them."""
+    get_cache().invalidate(*(part for part in (agent_id, kind) if part is not None))
+
+
+def _chunk_counts_kind(collection: str, chat_id: str | None) -> str:
+    return f"chunk_counts/{collection}/{chat_id}" if chat_id else f"chunk_counts/{collection}"
+
+
+def fetch_point_page(
+    client: GrinningCatClient, agent_id: str, collection: str, query: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Fetch a page of the points of a memory collection from the points endpoint, which returns their vectors too, unless
+    `with_vectors` is "false" in the query. A backend ignoring that parameter still sends the vectors: they are then
+    dropped from the page, so that they are never held longer than the decoding of the response.
+
+    Args:
+        client: The client to read the points with.
+        agent_id: The ID of the agent.
+        collection: The name of the collection.
+        query: The query of the points endpoint, e.g. the `limit` of a page, `with_vectors` and a `metadata` filter.
+
+    Returns:
+        The page, with its `points` and the `next_offset` cursor of the next page, if any.
+    """
+    page = client.custom.get_custom(f"/memory/collections/{collection}/points", agent_id, query=query)
+    if str(query.get("with_vectors", "true")).lower() == "false":
+        for point in page.get("points") or []:
+            point.pop("vector", None)
+    return page
+
+
+def iter_point_pages(
+    client: GrinningCatClient, agent_id: str, collection: str, query: Dict[str, Any]
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Iterate over the points of a memory collection, one page at a time, following the cursor of the points endpoint.
+
+    Args:
+        client: The client to read the points with.
+        agent_id: The ID of the agent.
+        collection: The name of the collection.
+        query: The query of the points endpoint (see fetch_point_page).
+
+    Returns:
+        An iterator of the pages of points, as returned by the endpoint.
+    """
+    query = dict(query)
+    while True:
+        page = fetch_point_page(client, agent_id, collection, query)
+        if points := page.get("points"):
+            yield points
+
+        if (next_offset := page.get("next_offset")) is None:
+            return
+        query["offset"] = next_offset
+
+
+def _scan_chunk_counts(agent_id: str, collection: str, chat_id: str | None) -> Dict[str, int]:
+    query: Dict[str, Any] = {"limit": CHUNK_COUNTS_PAGE_SIZE, "with_vectors": "false"}
+    if chat_id:
+        query["metadata"] = json.dumps({"chat_id": chat_id})
+
+    counts: Dict[str, int] = {}
+    for points in iter_point_pages(get_client(), agent_id, collection, query):
+        for point in points:
+            source = ((point.get("payload") or {}).get("metadata") or {}).get("source")
+            if source is not None:
+                counts[source] = counts.get(source, 0) + 1
+    return counts
+
+
+def get_chunk_counts(agent_id: str, collection: str = "declarative", chat_id: str | None = None) -> Dict[str, int]:
+    """
+    Get the number of chunks stored in a memory collection for each source, e.g. the uploaded files. The index is built
+    from one paginated scan of the collection, without the vectors, and read through the cache (see cached_read) for
+    GRINNING_CAT_CHUNK_COUNTS_TTL seconds: the uploads and the deletes invalidate it, while the long time to live only
+    catches up with the files the backend ingests asynchronously after their upload.
+
+    Args:
+        agent_id: The agent owning the collection.
+        collection: The memory collection to scan.
+        chat_id: If given, only the points of this conversation are counted.
+
+    Returns:
+        The number of chunks of each source; sources without chunks are missing.
+    """
+    return cached_read(
+        agent_id,
+        _chunk_counts_kind(collection, chat_id),
+        lambda: _scan_chunk_counts(agent_id, collection, chat_id),
+        ttl=float(get_env("GRINNING_CAT_CHUNK_COUNTS_TTL")),
+    )
+
+
+def invalidate_chunk_counts(agent_id: str, collection: str = "declarative", chat_id: str | None = None):
+    invalidate_cached_reads(agent_id, _chunk_counts_kind(collection, chat_id))
+
+
+def get_uploaded_files(agent_id: str) -> FileManagerAttributes:
+    """
+    Get the files uploaded to the Knowledge Base of an agent, read through the cache (see cached_read). The listing is
+    invalidated by invalidate_uploaded_files whenever files are uploaded or deleted.
+    """
+    return cached_read(agent_id, "files", lambda: get_client().file_manager.get_file_manager_attributes(agent_id))
+
+
+def invalidate_uploaded_files(agent_id: str):
+    invalidate_cached_reads(agent_id, "files")
+    invalidate_chunk_counts(agent_id)
+
+
+def get_allowed_mime_types(agent_id: str) -> List[str]:
+    """
+    Get the MIME types of the files accepted by the Knowledge Base of an agent, read through the cache (see
+    cached_read), which is invalidated when a plugin of the agent, e.g. a file handler, is toggled.
+    """
+    return cached_read(
+        agent_id, "allowed_mime_types", lambda: get_client().rabbit_hole.get_allowed_mime_types(agent_id).allowed
+    )
+
+
+def download_file(configuration: Configuration, agent_id: str, file_name: str, chat_id: str | None = None) -> bytes:
+    """
+    Download a file of the file manager, streaming the response into a spooled temporary file (see spool), so that
+    only a bounded buffer is held in memory during the transfer, and reading it in full once completed.
+
+    Args:
+        configuration: The configuration of the client, built in the script run (see build_client_configuration), as
+            the download may run outside of it.
+        agent_id: The ID of the agent.
+        file_name: The name of the file.
+        chat_id: The ID of the chat the file was uploaded to (optional).
+
+    Returns:
+        The content of the file.
+    """
+    with contextlib.closing(PooledGrinningCatClient(configuration)) as client:
+        with contextlib.closing(client.file_manager.get_file(agent_id, file_name, chat_id=chat_id)) as response:
+            response.raw.decode_content = True
+            with spool(response.raw) as spooled:
+                return spooled.read()
+
+
+def render_download_button(agent_id: str, file_name: str, key: str, chat_id: str | None = None):
+    """
+    Render a button downloading a file of the file manager. The file is only downloaded when the button is clicked, by
+    the request of the browser (see download_file), and never kept in the session state.
+    """
+    configuration = build_client_configuration()
+    st.download_button(
+        "Download",
+        data=lambda: download_file(configuration, agent_id, file_name, chat_id),
+        file_name=file_name,
+        key=key,
+        on_click="ignore",
+    )
+
 
 def clear_auth_cookies():
     """Clear authentication-related cookies."""
+    drop_clients()
     set_cookie("token", "", duration_days=-1)
     set_cookie("me", "", duration_days=-1)
 
@@ -296,12 +722,13 @@ def is_system_agent_selected() -> bool:
 
 
 def cache_cookie_me():
-    client = GrinningCatClient(build_client_configuration())
+    client = get_client()
     res = client.auth.me(st.session_state.get("token"))
     me_data = res.model_dump()
 
     # Store in session state for immediate access
     st.session_state["me"] = me_data
+    st.session_state.pop("permission_index", None)
 
     # Also update cookie for persistence across sessions
     set_cookie(
@@ -0,0 +1,94 @@
+"""
+Download benchmark of the files of the Knowledge Base: a file of growing size is downloaded from the fake backend
+through each download path of the admin UI, recording the wall time and the peak of the memory allocated by the
+download.
+
+Paths:
+    session_state   the content of the response is read at once, as the download parked it in the session state
+    deferred        the response is streamed into a spooled file, read once completed (see app.utils.download_file)
+    spooled         the transfer alone of the deferred path, holding a bounded buffer: Streamlit then needs the bytes
+
+Usage:
+    python -m benchmarks.download
+    python -m benchmarks.download --sizes 1024 --paths deferred spooled
+"""
+import argparse
+import contextlib
+import time
+import tracemalloc
+from typing import Callable, Dict
+from grinning_cat_python_sdk import Configuration
+
+from app.uploads import spool
+from app.utils import PooledGrinningCatClient, download_file
+from benchmarks.fake_backend import DOWNLOAD_FILE_NAME
+from benchmarks.page_render import free_port, start_backend, login
+
+AGENT_ID = "agent-000"
+
+
+def _download_session_state(configuration: Configuration):
+    with contextlib.closing(PooledGrinningCatClient(configuration)) as client:
+        client.file_manager.get_file(AGENT_ID, DOWNLOAD_FILE_NAME).content
+
+
+def _download_deferred(configuration: Configuration):
+    download_file(configuration, AGENT_ID, DOWNLOAD_FILE_NAME)
+
+
+def _download_spooled(configuration: Configuration):
+    with contextlib.closing(PooledGrinningCatClient(configuration)) as client:
+        with contextlib.closing(client.file_manager.get_file(AGENT_ID, DOWNLOAD_FILE_NAME)) as response:
+            response.raw.decode_content = True
+            spool(response.raw).close()
+
+
+PATHS: Dict[str, Callable[[Configuration], None]] = {
+    "session_state": _download_session_state,
+    "deferred": _download_deferred,
+    "spooled": _download_spooled,
+}
+
+
+def benchmark_download(configuration: Configuration, path: str) -> Dict[str, float]:
+    """Download the file through a path. The memory is traced in a download of its own, as tracing slows it down."""
+    started_at = time.perf_counter()
+    PATHS[path](configuration)
+    wall_time = time.perf_counter() - started_at
+
+    tracemalloc.start()
+    try:
+        PATHS[path](configuration)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"wall_time": wall_time, "peak_memory": peak_memory}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the download paths of the Knowledge Base")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1, 16, 128], help="Sizes of the file, in MB")
+    parser.add_argument("--paths", nargs="+", choices=list(PATHS), default=list(PATHS))
+    args = parser.parse_args()
+
+    print(f"{'path':<15}{'size (MB)':>10}{'wall time (s)':>16}{'peak memory (MB)':>18}")
+    for size in args.sizes:
+        # the size of the file is set when the backend starts
+        port = free_port()
+        backend = start_backend(
+            port, ["--agents", "1", "--users", "1", "--files", "0", "--download-size", str(size)]
+        )
+        try:
+            credentials = login(port)
+            configuration = Configuration(host="127.0.0.1", port=port, auth_key=credentials["token"])
+            for path in args.paths:
+                result = benchmark_download(configuration, path)
+                print(f"{path:<15}{size:>10}{result['wall_time']:>16.3f}{result['peak_memory'] / 2 ** 20:>18.1f}")
+        finally:
+            backend.terminate()
+            backend.wait()
+
+
+if __name__ == "__main__":
+    main()
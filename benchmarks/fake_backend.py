@@ -0,0 +1,920 @@
+"""
+Local stand-in of the Grinning Cat backend, implementing the REST and websocket endpoints used by the admin UI on top of
+synthetic data, so that the UI can be benchmarked and load-tested offline.
+
+Usage:
+    python -m benchmarks.fake_backend --port 1865 --agents 50 --users 10000 --files 20000 \
+        --latency "*=5" --latency "/memory/*=80"
+
+Any username and password are accepted, and the issued token grants every permission on every agent. Any API key is
+accepted too.
+"""
+import argparse
+import asyncio
+import fnmatch
+import hashlib
+import json
+import logging
+import mimetypes
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+import tornado.web
+import tornado.websocket
+
+LOGGER = logging.getLogger("fake_backend")
+
+SYSTEM_AGENT = "system"
+COLLECTIONS = ["declarative", "episodic", "procedural"]
+FILE_EXTENSIONS = ["pdf", "txt", "md", "docx", "html", "csv"]
+# File of each agent with the size given by --download-size, for the download benchmark
+DOWNLOAD_FILE_NAME = "download.bin"
+ALLOWED_MIME_TYPES = [
+    "application/pdf",
+    "text/plain",
+    "text/markdown",
+    "text/html",
+    "text/csv",
+    "application/json",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+]
+PERMISSIONS = {
+    resource: ["LIST", "READ", "WRITE", "EDIT", "DELETE"]
+    for resource in [
+        "AGENTIC_WORKFLOW",
+        "AUTH_HANDLER",
+        "CHAT",
+        "CHESHIRE_CAT",
+        "CHUNKER",
+        "CONTEXT_RETRIEVER",
+        "CONVERSATION",
+        "EMBEDDER",
+        "FILE_MANAGER",
+        "LLM",
+        "MEMORY",
+        "PLUGIN",
+        "STATUS",
+        "SYSTEM",
+        "UPLOAD",
+        "USERS",
+        "VECTOR_DATABASE",
+    ]
+}
+# Factories exposing GET /<prefix>/settings, GET and PUT /<prefix>/settings/<name>, with their available configurations
+FACTORIES = {
+    "llm": ["LLMOpenAIConfig", "LLMAnthropicConfig", "LLMOllamaConfig", "LLMGeminiConfig", "LLMDefaultConfig"],
+    "embedder": ["EmbedderOpenAIConfig", "EmbedderOllamaConfig", "EmbedderDumbConfig"],
+    "chunking": ["RecursiveTextChunkerSettings", "SemanticChunkerSettings", "TokenTextChunkerSettings"],
+    "vector_database": ["QdrantConfig", "MilvusConfig"],
+    "auth_handler": ["CoreOnlyAuthConfig", "ApiKeyAuthConfig"],
+    "file_manager": ["LocalFileManagerConfig", "AWSFileManagerConfig", "AzureFileManagerConfig"],
+    "context_retriever": ["DefaultContextRetrieverConfig", "HybridContextRetrieverConfig"],
+    "agentic_workflow": ["CoreAgenticWorkflowConfig", "ReactAgenticWorkflowConfig"],
+}
+SETTINGS_SCHEME = {
+    "title": "Settings",
+    "type": "object",
+    "properties": {
+        "api_key": {"title": "Api Key", "type": "string", "default": ""},
+        "model": {"title": "Model", "type": "string", "default": "default"},
+        "temperature": {"title": "Temperature", "type": "number", "default": 0.7},
+        "max_tokens": {"title": "Max Tokens", "anyOf": [{"type": "integer"}, {"type": "null"}], "default": 1024},
+        "streaming": {"title": "Streaming", "type": "boolean", "default": True},
+    },
+}
+
+
+class DataVolume:
+    """Size of the synthetic data set of each agent."""
+    def __init__(
+        self,
+        agents: int,
+        users: int,
+        files: int,
+        chunks_per_file: int,
+        episodic_points: int,
+        plugins: int,
+        vector_size: int,
+        seed: int,
+        download_size: int = 0,
+    ):
+        self.agents = agents
+        self.users = users
+        self.files = files
+        self.chunks_per_file = chunks_per_file
+        self.episodic_points = episodic_points
+        self.plugins = plugins
+        self.vector_size = vector_size
+        self.seed = seed
+        self.download_size = download_size
+
+
+def _timestamp(rnd: random.Random) -> float:
+    return time.time() - rnd.uniform(0, 365 * 86400)
+
+
+def _point_id(*parts: Any) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, "/".join(str(part) for part in parts)))
+
+
+def _file_chunks(agent_id: str, file: Dict[str, Any], chunks_per_file: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            # as the backend does, every ingestion of a file stores new points
+            "id": _point_id(agent_id, file["name"], file["when"], i),
+            "payload": {
+                "page_content": f"Chunk {i} of {file['name']}. " + "Lorem ipsum dolor sit amet. " * 20,
+                "metadata": {
+                    "source": file["name"],
+                    "hash": hashlib.sha256(file["name"].encode()).hexdigest(),
+                    "when": file["when"],
+                    "chunk_index": i,
+                },
+            },
+        }
+        for i in range(chunks_per_file)
+    ]
+
+
+class FakeAgent:
+    """Synthetic data of an agent, generated on first access from a seed derived from the agent id."""
+    def __init__(self, agent_id: str, metadata: Dict[str, Any], volume: DataVolume):
+        self.agent_id = agent_id
+        self.metadata = metadata
+        self._volume = volume
+        self._rnd = random.Random(f"{volume.seed}:{agent_id}")
+
+        self._users: Dict[str, Dict[str, Any]] | None = None
+        self._files: Dict[str, Dict[str, Any]] | None = None
+        self._points: Dict[str, Dict[str, Dict[str, Any]]] | None = None
+        self.web_sources: List[str] = []
+        self.plugins_active = {f"plugin_{i:03d}" for i in range(0, volume.plugins, 2)}
+        self.plugin_settings: Dict[str, Dict[str, Any]] = {}
+        self.factory_selected = {prefix: names[0] for prefix, names in FACTORIES.items()}
+        self.factory_values: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.conversations: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    @property
+    def users(self) -> Dict[str, Dict[str, Any]]:
+        if self._users is None:
+            self._users = {}
+            resources = list(PERMISSIONS)
+            for i in range(self._volume.users):
+                user_id = _point_id(self.agent_id, "user", i)
+                granted = self._rnd.sample(resources, self._rnd.randint(1, len(resources)))
+                created_at = _timestamp(self._rnd)
+                self._users[user_id] = {
+                    "id": user_id,
+                    "username": f"user-{i:05d}",
+                    "permissions": {resource: self._rnd.sample(PERMISSIONS[resource], 2) for resource in granted},
+                    "metadata": {"team": f"team-{i % 20}"},
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+        return self._users
+
+    @property
+    def files(self) -> Dict[str, Dict[str, Any]]:
+        if self._files is None:
+            self._files = {}
+            for i in range(self._volume.files):
+                self.add_file(
+                    f"document-{i:05d}.{FILE_EXTENSIONS[i % len(FILE_EXTENSIONS)]}",
+                    int(self._rnd.lognormvariate(11, 1.5)),
+                    _timestamp(self._rnd),
+                )
+            if self._volume.download_size:
+                self.add_file(DOWNLOAD_FILE_NAME, self._volume.download_size)
+        return self._files
+
+    @property
+    def points(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if self._points is None:
+            self._points = {collection: {} for collection in COLLECTIONS}
+            for file in self.files.values():
+                for point in _file_chunks(self.agent_id, file, self._volume.chunks_per_file):
+                    self._points["declarative"][point["id"]] = point
+            for i in range(self._volume.episodic_points):
+                point_id = _point_id(self.agent_id, "episodic", i)
+                self._points["episodic"][point_id] = {
+                    "id": point_id,
+                    "payload": {
+                        "page_content": f"Episodic memory {i}",
+                        "metadata": {
+                            "source": f"user-{i % max(1, self._volume.users):05d}",
+                            "chat_id": f"chat-{i % 50:02d}",
+                            "when": _timestamp(self._rnd),
+                        },
+                    },
+                }
+        return self._points
+
+    def add_file(self, name: str, size: int, when: float | None = None):
+        when = when or time.time()
+        file = {
+            "path": f"{self.agent_id}/{name}",
+            "name": name,
+            "size": size,
+            "last_modified": datetime.fromtimestamp(when, timezone.utc).isoformat(),
+            "when": when,
+        }
+        if self._files is None:  # the synthetic files are not generated yet: they will be, then this one is added
+            self.files[name] = file
+        else:
+            self._files[name] = file
+
+        if self._points is not None:
+            for point in _file_chunks(self.agent_id, file, self._volume.chunks_per_file):
+                self._points["declarative"][point["id"]] = point
+
+    def delete_file(self, name: str) -> bool:
+        if self.files.pop(name, None) is None:
+            return False
+        self.delete_points("declarative", {"source": name})
+        return True
+
+    def delete_points(self, collection: str, metadata: Dict[str, Any]) -> int:
+        points = self.points.setdefault(collection, {})
+        matching = [point_id for point_id, point in points.items() if _matches(point, metadata)]
+        for point_id in matching:
+            del points[point_id]
+        return len(matching)
+
+    def vector(self, point_id: str) -> List[float]:
+        rnd = random.Random(point_id)
+        return [round(rnd.uniform(-1, 1), 6) for _ in range(self._volume.vector_size)]
+
+
+def _matches(point: Dict[str, Any], metadata: Dict[str, Any] | None) -> bool:
+    if not metadata:
+        return True
+    point_metadata = (point.get("payload") or {}).get("metadata", {})
+    return all(point_metadata.get(key) == value for key, value in metadata.items())
+
+
+class FakeStore:
+    """All the agents served by the fake backend."""
+    def __init__(self, volume: DataVolume):
+        self.volume = volume
+        self.agents: Dict[str, FakeAgent] = {}
+        self.add_agent(SYSTEM_AGENT, {"name": "System"})
+        for i in range(volume.agents):
+            self.add_agent(f"agent-{i:03d}", {"name": f"Agent {i:03d}", "description": f"Synthetic agent number {i}"})
+
+        self.plugins = [
+            {
+                "id": f"plugin_{i:03d}",
+                "name": f"Plugin {i:03d}",
+                "description": f"Synthetic plugin number {i}",
+                "author_name": "Fake Backend",
+                "version": f"1.{i % 10}.0",
+                "tags": ["benchmark", f"group-{i % 5}"],
+            }
+            for i in range(volume.plugins)
+        ]
+
+    def add_agent(self, agent_id: str, metadata: Dict[str, Any] | None = None) -> FakeAgent:
+        self.agents[agent_id] = FakeAgent(agent_id, metadata or {}, self.volume)
+        return self.agents[agent_id]
+
+
+class LatencyInjector:
+    """Delay of the responses, by glob pattern of "<path>" or "<METHOD> <path>"; the last matching rule wins."""
+    def __init__(self, rules: List[str], jitter: float):
+        self._rules: List[Tuple[str, float]] = []
+        for rule in rules:
+            pattern, _, milliseconds = rule.rpartition("=")
+            if not pattern:
+                raise ValueError(f"Invalid latency rule {rule!r}: expected <pattern>=<milliseconds>")
+            self._rules.append((pattern, float(milliseconds) / 1000))
+        self._jitter = jitter
+
+    def delay(self, method: str, path: str) -> float:
+        delay = 0.0
+        for pattern, seconds in self._rules:
+            if fnmatch.fnmatchcase(path, pattern) or fnmatch.fnmatchcase(f"{method} {path}", pattern):
+                delay = seconds
+        if delay and self._jitter:
+            delay *= random.uniform(1 - self._jitter, 1 + self._jitter)
+        return delay
+
+
+class BaseHandler(tornado.web.RequestHandler):
+    requires_auth = True
+
+    def initialize(self, store: FakeStore, latency: LatencyInjector):
+        self.store = store
+        self.latency = latency
+
+    async def prepare(self):
+        if delay := self.latency.delay(self.request.method, self.request.path):
+            await asyncio.sleep(delay)
+
+        if self.requires_auth and not self.request.headers.get("Authorization", "").startswith("Bearer "):
+            raise tornado.web.HTTPError(401, reason="Missing credentials")
+
+    def write_error(self, status_code: int, **kwargs):
+        self.write_json({"detail": self._reason}, status_code)
+
+    def write_json(self, data: Any, status_code: int = 200):
+        self.set_status(status_code)
+        self.set_header("Content-Type", "application/json")
+        self.finish(json.dumps(data))
+
+    @property
+    def agent(self) -> FakeAgent:
+        agent_id = self.request.headers.get("X-Agent-ID", SYSTEM_AGENT)
+        if (agent := self.store.agents.get(agent_id)) is None:
+            raise tornado.web.HTTPError(404, reason=f"Agent {agent_id} not found")
+        return agent
+
+    @property
+    def body(self) -> Dict[str, Any]:
+        return json.loads(self.request.body) if self.request.body else {}
+
+
+class HealthHandler(BaseHandler):
+    requires_auth = False
+
+    def get(self, _probe: str):
+        self.write_json({"status": "Grinning Cat is alive", "version": "fake"})
+
+
+class TokenHandler(BaseHandler):
+    requires_auth = False
+
+    def post(self):
+        username = self.body.get("username")
+        if not username:
+            raise tornado.web.HTTPError(403, reason="Invalid credentials")
+        self.write_json({"access_token": f"fake-{username}", "token_type": "bearer"})
+
+
+class PermissionsHandler(BaseHandler):
+    def get(self):
+        self.write_json(PERMISSIONS)
+
+
+class MeHandler(BaseHandler):
+    def get(self):
+        token = self.request.headers["Authorization"].removeprefix("Bearer ")
+        username = token.removeprefix("fake-")
+        user = {"id": _point_id("me", username), "username": username, "permissions": PERMISSIONS}
+        agents = [{"agent_name": agent_id, "user": user} for agent_id in self.store.agents]
+        self.write_json({"success": True, "agents": agents, "auto_selected": False})
+
+
+class AgentsHandler(BaseHandler):
+    def get(self):
+        self.write_json([
+            {"agent_id": agent.agent_id, "metadata": agent.metadata}
+            for agent in self.store.agents.values()
+            if agent.agent_id != SYSTEM_AGENT
+        ])
+
+    def put(self):
+        self.agent.metadata = self.body.get("metadata", {})
+        self.write_json({"updated": True})
+
+
+class AgentActionHandler(BaseHandler):
+    def post(self, action: str):
+        body = self.body
+        if action == "create":
+            if body["agent_id"] in self.store.agents:
+                raise tornado.web.HTTPError(400, reason=f"Agent {body['agent_id']} already exists")
+            self.store.add_agent(body["agent_id"], body.get("metadata"))
+            self.write_json({"created": True})
+            return
+
+        agent = self.agent
+        if action == "clone":
+            self.store.add_agent(body["agent_id"], dict(agent.metadata))
+            self.write_json({"cloned": True})
+            return
+
+        if action == "destroy":
+            self.store.agents.pop(agent.agent_id, None)
+        else:  # reset
+            self.store.add_agent(agent.agent_id, agent.metadata)
+        self.write_json({"deleted_settings": True, "deleted_memories": True, "deleted_plugin_folders": True})
+
+
+class FactoryResetHandler(BaseHandler):
+    def post(self):
+        self.write_json({"deleted_settings": True, "deleted_memories": True, "deleted_plugin_folders": True})
+
+
+class UsersHandler(BaseHandler):
+    def get(self):
+        self.write_json(list(self.agent.users.values()))
+
+    def post(self):
+        body = self.body
+        if any(user["username"] == body["username"] for user in self.agent.users.values()):
+            raise tornado.web.HTTPError(409, reason=f"User {body['username']} already exists")
+
+        now = time.time()
+        user = {
+            "id": str(uuid.uuid4()),
+            "username": body["username"],
+            "permissions": body.get("permissions") or {},
+            "metadata": body.get("metadata"),
+            "created_at": now,
+            "updated_at": now,
+        }
+        self.agent.users[user["id"]] = user
+        self.write_json(user)
+
+
+class UserHandler(BaseHandler):
+    def _user(self, user_id: str) -> Dict[str, Any]:
+        if (user := self.agent.users.get(user_id)) is None:
+            raise tornado.web.HTTPError(404, reason=f"User {user_id} not found")
+        return user
+
+    def get(self, user_id: str):
+        self.write_json(self._user(user_id))
+
+    def put(self, user_id: str):
+        user = self._user(user_id)
+        user.update({key: value for key, value in self.body.items() if key != "password"})
+        user["updated_at"] = time.time()
+        self.write_json(user)
+
+    def delete(self, user_id: str):
+        self.write_json(self.agent.users.pop(self._user(user_id)["id"]))
+
+
+class CollectionsHandler(BaseHandler):
+    def get(self):
+        self.write_json({
+            "collections": [
+                {"name": name, "vectors_count": len(points)} for name, points in self.agent.points.items()
+            ]
+        })
+
+    def delete(self):
+        deleted = {name: True for name in self.agent.points}
+        for points in self.agent.points.values():
+            points.clear()
+        self.write_json({"deleted": deleted})
+
+
+class CollectionHandler(BaseHandler):
+    def post(self, collection: str):
+        self.agent.points.setdefault(collection, {})
+        self.write_json({"name": collection, "vectors_count": 0})
+
+    def delete(self, collection: str):
+        self.agent.points.get(collection, {}).clear()
+        self.write_json({"deleted": {collection: True}})
+
+
+class PointsHandler(BaseHandler):
+    def get(self, collection: str):
+        limit = int(self.get_query_argument("limit", "100"))
+        offset = int(self.get_query_argument("offset", None) or 0)
+        metadata = json.loads(self.get_query_argument("metadata", "{}"))
+        with_vectors = self.get_query_argument("with_vectors", "true").lower() != "false"
+
+        points = [point for point in self.agent.points.get(collection, {}).values() if _matches(point, metadata)]
+        page = points[offset:offset + limit]
+        self.write_json({
+            "points": [
+                {**point, "vector": self.agent.vector(point["id"]) if with_vectors else None} for point in page
+            ],
+            "next_offset": offset + limit if offset + limit < len(points) else None,
+        })
+
+    def post(self, collection: str):
+        body = self.body
+        point_id = str(uuid.uuid4())
+        self.agent.points.setdefault(collection, {})[point_id] = {
+            "id": point_id,
+            "payload": {"page_content": body["content"], "metadata": body.get("metadata", {})},
+        }
+        self.write_json({**body, "id": point_id, "vector": self.agent.vector(point_id)})
+
+    def delete(self, collection: str):
+        self.agent.delete_points(collection, self.body)
+        self.write_json({"deleted": {"operation_id": int(time.time()), "status": "completed"}})
+
+
+class PointHandler(BaseHandler):
+    def put(self, collection: str, point_id: str):
+        # as the backend does, only the existing points are edited
+        if point_id not in self.agent.points.get(collection, {}):
+            raise tornado.web.HTTPError(404, reason=f"Point {point_id} not found")
+        body = self.body
+        self.agent.points[collection][point_id] = {
+            "id": point_id,
+            "payload": {"page_content": body["content"], "metadata": body.get("metadata", {})},
+        }
+        self.write_json({**body, "id": point_id, "vector": self.agent.vector(point_id)})
+
+    def delete(self, collection: str, point_id: str):
+        if self.agent.points.get(collection, {}).pop(point_id, None) is None:
+            raise tornado.web.HTTPError(404, reason=f"Point {point_id} not found")
+        self.write_json({"deleted": point_id})
+
+
+class RecallHandler(BaseHandler):
+    def get(self):
+        text = self.get_query_argument("text", "")
+        k = int(self.get_query_argument("k", "10"))
+        self.write_json({
+            "query": {"text": text, "vector": self.agent.vector(text)},
+            "vectors": {
+                "embedder": self.agent.factory_selected["embedder"],
+                "collections": {
+                    name: [
+                        {**point, "score": 0.9, "vector": self.agent.vector(point["id"])}
+                        for point in list(points.values())[:k]
+                    ]
+                    for name, points in self.agent.points.items()
+                },
+            },
+        })
+
+
+class FileManagerHandler(BaseHandler):
+    def get(self):
+        files = [
+            {key: file[key] for key in ("path", "name", "size", "last_modified")} for file in self.agent.files.values()
+        ]
+        self.write_json({"files": files, "size": sum(file["size"] for file in files)})
+
+
+class FilesHandler(BaseHandler):
+    def delete(self):
+        for name in list(self.agent.files):
+            self.agent.delete_file(name)
+        self.write_json({"deleted": True})
+
+
+class FileHandler(BaseHandler):
+    async def get(self, name: str):
+        if (file := self.agent.files.get(name)) is None:
+            raise tornado.web.HTTPError(404, reason=f"File {name} not found")
+
+        self.set_header("Content-Type", mimetypes.guess_type(name)[0] or "application/octet-stream")
+        self.set_header("Content-Length", str(file["size"]))
+        block = (f"{name} " * 8192).encode()[:65536]
+        remaining = file["size"]
+        while remaining > 0:
+            self.write(block[:remaining])
+            remaining -= len(block)
+            await self.flush()
+        self.finish()
+
+    def delete(self, name: str):
+        self.write_json({"deleted": self.agent.delete_file(name)})
+
+
+class UploadHandler(BaseHandler):
+    def post(self, batch: str | None = None, _chat_id: str | None = None):
+        uploaded = {}
+        for file in self.request.files.get("file", []) + self.request.files.get("files", []):
+            self.agent.add_file(file.filename, len(file.body))
+            uploaded[file.filename] = {
+                "filename": file.filename,
+                "content_type": file.content_type,
+                "info": "File is being ingested asynchronously",
+            }
+
+        if not uploaded:
+            raise tornado.web.HTTPError(400, reason="No file uploaded")
+        self.write_json(uploaded if batch else next(iter(uploaded.values())))
+
+
+class WebHandler(BaseHandler):
+    def get(self):
+        self.write_json(self.agent.web_sources)
+
+    def post(self, _chat_id: str | None = None):
+        url = self.body["url"]
+        self.agent.web_sources.append(url)
+        self.agent.add_file(url, 0)
+        self.write_json({"url": url, "info": "URL is being ingested asynchronously"})
+
+
+class AllowedMimeTypesHandler(BaseHandler):
+    def get(self):
+        self.write_json({"allowed": ALLOWED_MIME_TYPES})
+
+
+class PluginsHandler(BaseHandler):
+    def get(self, scope: str | None = None):
+        query = self.get_query_argument("query", None)
+        plugins = [
+            plugin for plugin in self.store.plugins if not query or query.lower() in plugin["name"].lower()
+        ]
+        if scope is None:  # agent view: the installed plugins, flagged as active or not for the agent
+            installed = [
+                {**plugin, "local_info": {"active": plugin["id"] in self.agent.plugins_active}} for plugin in plugins
+            ]
+        else:
+            installed = [{**plugin, "local_info": {"active": True}} for plugin in plugins]
+
+        registry = [
+            {**plugin, "id": f"registry_{plugin['id']}", "url": f"https://example.com/{plugin['id']}"}
+            for plugin in plugins
+        ]
+        self.write_json({"filters": {"query": query}, "installed": installed, "registry": registry})
+
+
+class PluginToggleHandler(BaseHandler):
+    def put(self, _system: str | None, plugin_id: str):
+        self.agent.plugins_active ^= {plugin_id}
+        self.write_json({"info": f"Plugin {plugin_id} toggled"})
+
+
+class PluginsSettingsHandler(BaseHandler):
+    def get(self, _system: str | None = None):
+        self.write_json({
+            "settings": [self._settings(plugin["id"]) for plugin in self.store.plugins]
+        })
+
+    def _settings(self, plugin_id: str) -> Dict[str, Any]:
+        return {
+            "name": plugin_id,
+            "value": self.agent.plugin_settings.get(plugin_id, {}),
+            "scheme": {
+                "title": plugin_id,
+                "type": "object",
+                "properties": {
+                    "enabled": {"default": True, "title": "Enabled", "type": "boolean"},
+                    "threshold": {"default": 0.5, "title": "Threshold", "type": "number"},
+                },
+            },
+        }
+
+
+class PluginSettingsHandler(PluginsSettingsHandler):
+    def get(self, _system: str | None, plugin_id: str):
+        self.write_json(self._settings(plugin_id))
+
+    def put(self, _system: str | None, plugin_id: str):
+        self.agent.plugin_settings[plugin_id] = self.body
+        self.write_json(self._settings(plugin_id))
+
+    def post(self, _system: str | None, plugin_id: str):
+        self.agent.plugin_settings.pop(plugin_id, None)
+        self.write_json(self._settings(plugin_id))
+
+
+class PluginDetailsHandler(BaseHandler):
+    def get(self, plugin_id: str):
+        plugin = next((plugin for plugin in self.store.plugins if plugin["id"] == plugin_id), None)
+        if plugin is None:
+            raise tornado.web.HTTPError(404, reason=f"Plugin {plugin_id} not found")
+        self.write_json({"data": plugin})
+
+
+class PluginInstallHandler(BaseHandler):
+    def post(self, source: str):
+        if source == "registry":
+            url = self.body["url"]
+            self.write_json({"info": "Plugin is being installed", "url": url})
+            return
+
+        file = self.request.files["file"][0]
+        self.write_json({"info": "Plugin is being installed", "filename": file.filename, "content_type": file.content_type})
+
+
+class CorePluginsHandler(BaseHandler):
+    def get(self, untoggling: str | None = None):
+        core_plugins = [plugin["id"] for plugin in self.store.plugins[:5]]
+        self.write_json(core_plugins[:2] if untoggling else core_plugins)
+
+
+class PluginUninstallHandler(BaseHandler):
+    def delete(self, plugin_id: str):
+        self.store.plugins = [plugin for plugin in self.store.plugins if plugin["id"] != plugin_id]
+        self.write_json({"deleted": plugin_id})
+
+
+class FactorySettingsHandler(BaseHandler):
+    def _settings(self, prefix: str, name: str) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "value": self.agent.factory_values.get((prefix, name), {}),
+            "scheme": SETTINGS_SCHEME,
+        }
+
+    def get(self, prefix: str, name: str | None = None):
+        if name is not None:
+            self.write_json(self._settings(prefix, name))
+            return
+
+        self.write_json({
+            "settings": [self._settings(prefix, name) for name in FACTORIES[prefix]],
+            "selected_configuration": self.agent.factory_selected[prefix],
+        })
+
+    def put(self, prefix: str, name: str):
+        self.agent.factory_values[(prefix, name)] = self.body
+        self.agent.factory_selected[prefix] = name
+        self.write_json(self._settings(prefix, name))
+
+
+class ConversationsHandler(BaseHandler):
+    def get(self):
+        user_id = self.request.headers.get("X-User-ID", "")
+        self.write_json([
+            conversation for (owner, _), conversation in self.agent.conversations.items() if owner == user_id
+        ])
+
+
+class ConversationHandler(BaseHandler):
+    def _conversation(self, chat_id: str) -> Dict[str, Any]:
+        key = (self.request.headers.get("X-User-ID", ""), chat_id)
+        if (conversation := self.agent.conversations.get(key)) is None:
+            raise tornado.web.HTTPError(404, reason=f"Conversation {chat_id} not found")
+        return conversation
+
+    def get(self, chat_id: str, history: str | None = None):
+        conversation = self._conversation(chat_id)
+        if history:
+            self.write_json({"history": conversation["history"]})
+        else:
+            self.write_json({key: value for key, value in conversation.items() if key != "history"})
+
+    def put(self, chat_id: str, _history: str | None = None):
+        conversation = self._conversation(chat_id)
+        conversation.update(self.body)
+        conversation["updated_at"] = time.time()
+        self.write_json({"changed": True})
+
+    def delete(self, chat_id: str, _history: str | None = None):
+        self.agent.conversations.pop((self.request.headers.get("X-User-ID", ""), chat_id), None)
+        self.write_json({"deleted": True})
+
+
+def _reply(agent: FakeAgent, user_id: str, chat_id: str, text: str) -> Dict[str, Any]:
+    """Answer a message, recording it in the conversation history."""
+    now = time.time()
+    answer = f"You said: {text}"
+    conversation = agent.conversations.setdefault((user_id, chat_id), {
+        "chat_id": chat_id,
+        "name": text[:30],
+        "num_messages": 0,
+        "metadata": {},
+        "created_at": now,
+        "updated_at": now,
+        "history": [],
+    })
+    conversation["history"] += [
+        {"who": "user", "when": now, "content": {"text": text}},
+        {"who": "assistant", "when": now, "content": {"text": answer}},
+    ]
+    conversation["num_messages"] = len(conversation["history"])
+    conversation["updated_at"] = now
+
+    return {
+        "agent_id": agent.agent_id,
+        "user_id": user_id,
+        "chat_id": chat_id,
+        "message": {"text": answer, "type": "chat", "why": {"input": text}},
+    }
+
+
+class MessageHandler(BaseHandler):
+    def post(self):
+        user_id = self.request.headers.get("X-User-ID", "user")
+        chat_id = self.request.headers.get("X-Chat-ID") or str(uuid.uuid4())
+        self.write_json(_reply(self.agent, user_id, chat_id, self.body.get("text", "")))
+
+
+class ChatSocketHandler(tornado.websocket.WebSocketHandler):
+    def initialize(self, store: FakeStore, latency: LatencyInjector):
+        self.store = store
+        self.latency = latency
+
+    async def on_message(self, message: str):
+        if message in ("ping", "pong"):
+            return
+
+        agent_id, _, chat_id = self.path_args[0].partition("/")
+        if (agent := self.store.agents.get(agent_id)) is None:
+            self.close(code=1008, reason=f"Agent {agent_id} not found")
+            return
+
+        text = json.loads(message).get("text", "")
+        reply = _reply(agent, self.get_query_argument("user_id", "user"), chat_id or str(uuid.uuid4()), text)
+        tokens = reply["message"]["text"].split(" ")
+        delay = self.latency.delay("WS", self.request.path)
+        for token in tokens:  # stream the answer token by token, spreading the latency over the tokens
+            await asyncio.sleep(delay / len(tokens))
+            await self.write_message(json.dumps({"type": "chat_token", "content": f"{token} "}))
+        await self.write_message(json.dumps({"type": "chat", "content": json.dumps(reply)}))
+
+
+def make_app(store: FakeStore, latency: LatencyInjector) -> tornado.web.Application:
+    factories = "|".join(FACTORIES)
+    kwargs = {"store": store, "latency": latency}
+    routes = [
+        (r"/health/(liveness|readiness)", HealthHandler),
+        (r"/auth/token", TokenHandler),
+        (r"/auth/available-permissions", PermissionsHandler),
+        (r"/me", MeHandler),
+        (r"/utils/agents/?", AgentsHandler),
+        (r"/utils/agents/(create|reset|destroy|clone)/?", AgentActionHandler),
+        (r"/utils/factory/reset/?", FactoryResetHandler),
+        (r"/users/?", UsersHandler),
+        (r"/users/([^/]+)", UserHandler),
+        (r"/memory/collections/?", CollectionsHandler),
+        (r"/memory/collections/([^/]+)", CollectionHandler),
+        (r"/memory/collections/([^/]+)/points", PointsHandler),
+        (r"/memory/collections/([^/]+)/points/([^/]+)", PointHandler),
+        (r"/memory/recall", RecallHandler),
+        (rf"/({factories})/settings(?:/([^/]+))?", FactorySettingsHandler),
+        (r"/file_manager/?", FileManagerHandler),
+        (r"/file_manager/files/?", FilesHandler),
+        (r"/file_manager/files/(.+)", FileHandler),
+        (r"/rabbithole/allowed-mimetypes", AllowedMimeTypesHandler),
+        (r"/rabbithole/web/?", WebHandler),
+        (r"/rabbithole/web/([^/]+)", WebHandler),
+        (r"/rabbithole/(batch)(?:/([^/]+))?", UploadHandler),
+        (r"/rabbithole/memory", UploadHandler),
+        (r"/rabbithole/?", UploadHandler),
+        (r"/rabbithole/()([^/]+)", UploadHandler),
+        (r"/plugins/?", PluginsHandler),
+        (r"/plugins/(installed)", PluginsHandler),
+        (r"/plugins/(system/)?toggle/([^/]+)", PluginToggleHandler),
+        (r"/plugins/(system/)?settings/?", PluginsSettingsHandler),
+        (r"/plugins/(system/)?settings/([^/]+)", PluginSettingsHandler),
+        (r"/plugins/system/details/([^/]+)", PluginDetailsHandler),
+        (r"/plugins/install/(upload|registry)", PluginInstallHandler),
+        (r"/plugins/uninstall/([^/]+)", PluginUninstallHandler),
+        (r"/admins/core_plugins(?:/(untoggling))?", CorePluginsHandler),
+        (r"/conversations/?", ConversationsHandler),
+        (r"/conversations/([^/]+)(?:/(history))?", ConversationHandler),
+        (r"/message", MessageHandler),
+        (r"/ws/(.+)", ChatSocketHandler),
+    ]
+    return tornado.web.Application([(pattern, handler, kwargs) for pattern, handler in routes])
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local stand-in of the Grinning Cat backend, for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1865)
+    parser.add_argument("--agents", type=int, default=50, help="Number of agents, besides the system one")
+    parser.add_argument("--users", type=int, default=10000, help="Number of users of each agent")
+    parser.add_argument("--files", type=int, default=20000, help="Number of files of each agent")
+    parser.add_argument("--chunks-per-file", type=int, default=3, help="Declarative memory points of each file")
+    parser.add_argument("--episodic-points", type=int, default=1000, help="Episodic memory points of each agent")
+    parser.add_argument("--plugins", type=int, default=30, help="Number of installed plugins")
+    parser.add_argument("--vector-size", type=int, default=384, help="Dimension of the synthetic embeddings")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the synthetic data")
+    parser.add_argument(
+        "--latency",
+        action="append",
+        default=[],
+        metavar="PATTERN=MS",
+        help=(
+            'Delay, in milliseconds, of the requests whose path (or "<METHOD> <path>") matches the glob pattern, '
+            'e.g. "*=5", "/memory/*=80", "POST /rabbithole/*=500", "/ws/*=2000". Repeatable: the last match wins.'
+        ),
+    )
+    parser.add_argument("--jitter", type=float, default=0.0, help="Relative random variation of the delays, e.g. 0.2")
+    parser.add_argument("--max-body-size", type=int, default=1024, help="Maximum size of the uploads, in MB")
+    parser.add_argument(
+        "--download-size", type=int, default=0, help=f"Size of the file {DOWNLOAD_FILE_NAME} of each agent, in MB"
+    )
+    parser.add_argument("--access-log", action="store_true", help="Log every request")
+    return parser.parse_args()
+
+
+async def main():
+    args = _parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    logging.getLogger("tornado.access").setLevel(logging.INFO if args.access_log else logging.WARNING)
+
+    volume = DataVolume(
+        agents=args.agents,
+        users=args.users,
+        files=args.files,
+        chunks_per_file=args.chunks_per_file,
+        episodic_points=args.episodic_points,
+        plugins=args.plugins,
+        vector_size=args.vector_size,
+        seed=args.seed,
+        download_size=args.download_size * 1024 * 1024,
+    )
+    app = make_app(FakeStore(volume), LatencyInjector(args.latency, args.jitter))
+    app.listen(args.port, address=args.host, max_body_size=args.max_body_size * 1024 * 1024)
+
+    LOGGER.info(
+        "Fake Grinning Cat backend listening on http://%s:%d with %d agents, %d users, %d files per agent",
+        args.host, args.port, args.agents, args.users, args.files,
+    )
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
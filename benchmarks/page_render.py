@@ -0,0 +1,247 @@
+"""
+Page-render benchmark of the admin UI: every page of app/main.py is run headlessly with Streamlit's AppTest against the
+fake backend, recording the wall time of the script run, the SDK calls, the reruns and the peak of the allocated memory.
+
+The results are compared with the baselines in benchmarks/baselines/page_render.json, and the run fails when a page
+exceeds its budget: more SDK calls or reruns than the baseline, or a wall time or memory peak beyond the tolerance.
+
+Usage:
+    python -m benchmarks.page_render              # compare with the baselines
+    python -m benchmarks.page_render --update     # record new baselines
+    python -m benchmarks.page_render --pages users plugins --runs 5
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+import requests
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from app.metrics import get_metrics_recorder
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(ROOT_PATH, "app", "main.py")
+BASELINES_PATH = os.path.join(ROOT_PATH, "benchmarks", "baselines", "page_render.json")
+
+# Views of the admin UI: the page of the sidebar, the agent it is rendered for (the admin pages are only available to
+# the system agent) and the entry of the "Menu" select box of the page to pick, if any
+PAGES = {
+    "welcome": {"page": None, "agent": "agent-000"},
+    "chat": {"page": "chat", "agent": "agent-000"},
+    "memory": {"page": "memory", "agent": "agent-000", "menu": "List Memory Collections"},
+    "memory_history": {"page": "memory", "agent": "agent-000", "menu": "View Conversation History"},
+    "rag": {"page": "rag", "agent": "agent-000", "menu": "View Uploaded Files"},
+    "users": {"page": "users", "agent": "agent-000", "menu": "List Users"},
+    "ai_models": {"page": "ai_models", "agent": "agent-000"},
+    "agentic_workflows": {"page": "agentic_workflows", "agent": "agent-000"},
+    "chunkers": {"page": "chunkers", "agent": "agent-000"},
+    "context_retrievers": {"page": "context_retrievers", "agent": "agent-000"},
+    "vector_databases": {"page": "vector_databases", "agent": "agent-000"},
+    "plugins": {"page": "plugins", "agent": "agent-000", "menu": "Browse Plugins"},
+    "auth_handlers": {"page": "auth_handlers", "agent": "agent-000"},
+    "file_handlers": {"page": "file_handlers", "agent": "agent-000"},
+    "embedders": {"page": "embedders", "agent": "system"},
+    "system": {"page": "system", "agent": "system", "menu": "Agent Management"},
+    "diagnostics": {"page": "diagnostics", "agent": "system"},
+}
+# Absolute increase always allowed, as the relative tolerance alone makes the budgets of the lightest pages too tight
+NOISE_FLOOR = {"wall_time": 0.1, "peak_memory": 2 ** 20}
+# Options of the fake backend: the baselines are only comparable when recorded with the same data volume
+BACKEND_OPTIONS = ["--agents", "50", "--users", "2000", "--files", "2000", "--latency", "*=2"]
+
+
+class RerunCounter:
+    """Count the calls to st.rerun made by the pages, while keeping its behaviour."""
+    def __init__(self):
+        self.count = 0
+        self._rerun = st.rerun
+
+    def __enter__(self) -> "RerunCounter":
+        def rerun(*args, **kwargs):
+            self.count += 1
+            return self._rerun(*args, **kwargs)
+
+        st.rerun = rerun
+        return self
+
+    def __exit__(self, *exc_info):
+        st.rerun = self._rerun
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_backend(port: int, options: List[str]) -> subprocess.Popen:
+    """Run the fake backend in a process of its own, so that its allocations are not measured."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.fake_backend", "--port", str(port), *options],
+        cwd=ROOT_PATH,
+    )
+    for _ in range(100):
+        try:
+            requests.get(f"http://127.0.0.1:{port}/health/liveness", timeout=1).raise_for_status()
+            return process
+        except requests.exceptions.RequestException:
+            time.sleep(0.1)
+
+    process.kill()
+    raise RuntimeError("The fake backend did not start")
+
+
+def login(port: int) -> Dict[str, Any]:
+    token = requests.post(
+        f"http://127.0.0.1:{port}/auth/token", json={"username": "admin", "password": "admin"}
+    ).json()["access_token"]
+    me = requests.get(f"http://127.0.0.1:{port}/me", headers={"Authorization": f"Bearer {token}"}).json()
+    return {"token": token, "me": me}
+
+
+def _run_page(name: str, credentials: Dict[str, Any], trace_memory: bool) -> Dict[str, Any]:
+    """Run a view from a fresh session: the script run opening its page and, if any, the one picking its menu entry."""
+    page = PAGES[name]
+    app_test = AppTest.from_file(MAIN_PATH, default_timeout=120)
+    app_test.session_state["token"] = credentials["token"]
+    app_test.session_state["me"] = credentials["me"]
+    app_test.session_state["agent_id"] = page["agent"]
+    app_test.session_state["selected_page"] = page["page"]
+
+    sdk_calls = get_metrics_recorder().total_calls()
+    if trace_memory:
+        tracemalloc.start()
+    with RerunCounter() as reruns:
+        started_at = time.perf_counter()
+        app_test.run()
+        if menu := page.get("menu"):
+            next(select_box for select_box in app_test.selectbox if select_box.label == "Menu").select(menu).run()
+        wall_time = time.perf_counter() - started_at
+    peak_memory = 0
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "wall_time": wall_time,
+        "sdk_calls": get_metrics_recorder().total_calls() - sdk_calls,
+        "reruns": reruns.count,
+        "peak_memory": peak_memory,
+        "errors": [exception.message for exception in app_test.exception],
+    }
+
+
+def benchmark_page(page: str, credentials: Dict[str, Any], runs: int) -> Dict[str, Any]:
+    """
+    Render a view once to warm up the caches of the backend and of the UI, then `runs` times to measure it; the memory
+    is traced in a run of its own, as tracing slows the script down.
+    """
+    _run_page(page, credentials, trace_memory=False)
+    results = [_run_page(page, credentials, trace_memory=False) for _ in range(runs)]
+    traced = _run_page(page, credentials, trace_memory=True)
+
+    return {
+        "wall_time": round(statistics.median(result["wall_time"] for result in results), 4),
+        "sdk_calls": max(result["sdk_calls"] for result in results),
+        "reruns": max(result["reruns"] for result in results),
+        "peak_memory": traced["peak_memory"],
+        "errors": sorted({error for result in results + [traced] for error in result["errors"]}),
+    }
+
+
+def check_budgets(
+    results: Dict[str, Dict[str, Any]], baselines: Dict[str, Dict[str, Any]], tolerance: float
+) -> List[str]:
+    """
+    Compare the results with the baselines. SDK calls and reruns are deterministic, so any increase is a regression;
+    wall time and memory are noisy, so they regress only beyond the tolerance and the noise floor.
+    """
+    regressions = []
+    for page, result in results.items():
+        if result["errors"]:
+            regressions.append(f"{page}: raised {'; '.join(result['errors'])}")
+
+        if (baseline := baselines.get(page)) is None:
+            continue
+
+        for metric in ("sdk_calls", "reruns"):
+            if result[metric] > baseline[metric]:
+                regressions.append(f"{page}: {metric} {result[metric]} > {baseline[metric]}")
+        for metric in ("wall_time", "peak_memory"):
+            if result[metric] > max(baseline[metric] * (1 + tolerance), baseline[metric] + NOISE_FLOOR[metric]):
+                regressions.append(
+                    f"{page}: {metric} {result[metric]} > {baseline[metric]} (+{tolerance:.0%} tolerance)"
+                )
+    return regressions
+
+
+def _print_results(results: Dict[str, Dict[str, Any]], baselines: Dict[str, Dict[str, Any]]):
+    print(f"{'page':<20}{'wall time (s)':>16}{'SDK calls':>12}{'reruns':>8}{'peak memory (MB)':>18}")
+    for page, result in results.items():
+        baseline = baselines.get(page, {})
+        print(
+            f"{page:<20}"
+            f"{result['wall_time']:>9.3f} ({baseline.get('wall_time', float('nan')):.3f})"
+            f"{result['sdk_calls']:>5} ({baseline.get('sdk_calls', '-'):>3})"
+            f"{result['reruns']:>3} ({baseline.get('reruns', '-')})"
+            f"{result['peak_memory'] / 2 ** 20:>11.1f} ({baseline.get('peak_memory', float('nan')) / 2 ** 20:.1f})"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the rendering of the pages of the admin UI")
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES))
+    parser.add_argument("--runs", type=int, default=3, help="Measured runs of each page")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed increase of wall time and memory")
+    parser.add_argument("--update", action="store_true", help="Record the results as the new baselines")
+    args = parser.parse_args()
+
+    port = free_port()
+    os.environ["GRINNING_CAT_API_HOST"] = "127.0.0.1"
+    os.environ["GRINNING_CAT_API_PORT"] = str(port)
+
+    baselines = {}
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH) as f:
+            baselines = json.load(f)
+    if baselines.get("backend_options", BACKEND_OPTIONS) != BACKEND_OPTIONS:
+        sys.exit("The baselines were recorded with other options of the fake backend: record them again with --update")
+    page_baselines = baselines.get("pages", {})
+
+    backend = start_backend(port, BACKEND_OPTIONS)
+    try:
+        credentials = login(port)
+        results = {page: benchmark_page(page, credentials, args.runs) for page in args.pages}
+    finally:
+        backend.terminate()
+        backend.wait()
+
+    _print_results(results, page_baselines)
+
+    if args.update:
+        page_baselines.update({
+            page: {key: value for key, value in result.items() if key != "errors"} for page, result in results.items()
+        })
+        os.makedirs(os.path.dirname(BASELINES_PATH), exist_ok=True)
+        with open(BASELINES_PATH, "w") as f:
+            json.dump({"backend_options": BACKEND_OPTIONS, "pages": page_baselines}, f, indent=2)
+            f.write("\n")
+        print(f"Baselines recorded in {BASELINES_PATH}")
+        return
+
+    if regressions := check_budgets(results, page_baselines, args.tolerance):
+        print("\nBudget exceeded:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
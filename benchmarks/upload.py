@@ -0,0 +1,105 @@
+"""
+Upload benchmark of the Knowledge Base: files of growing size are uploaded to the fake backend through each upload path
+of the admin UI, recording the wall time and the peak of the memory allocated by the upload, on top of the file itself.
+
+Paths:
+    temp_file   the file is copied to a temporary file, then posted with RabbitHoleEndpoint.post_files
+    stream      the in-memory file is streamed from a memoryview of its buffer (see app.uploads.open_upload)
+    spooled     a file that is not in memory, e.g. the member of an archive, is spooled, then streamed
+
+Usage:
+    python -m benchmarks.upload
+    python -m benchmarks.upload --sizes 1 100 500 --paths stream spooled
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict
+from grinning_cat_python_sdk import Configuration
+
+from app.uploads import open_upload
+from app.utils import PooledGrinningCatClient
+from benchmarks.page_render import free_port, start_backend, login
+
+AGENT_ID = "agent-000"
+BACKEND_OPTIONS = ["--agents", "1", "--users", "1", "--files", "1", "--max-body-size", "2048"]
+
+
+def _upload_temp_file(client: PooledGrinningCatClient, uploaded_file: io.BytesIO, name: str):
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f"_{name}")
+    try:
+        temp_file.write(uploaded_file.getbuffer())
+        temp_file.close()
+        client.rabbit_hole.post_files(file_paths=[temp_file.name], agent_id=AGENT_ID)
+    finally:
+        os.unlink(temp_file.name)
+
+
+def _upload_stream(client: PooledGrinningCatClient, uploaded_file: io.BytesIO, name: str):
+    with open_upload(uploaded_file) as stream:
+        client.rabbit_hole.post_file_streams(files=[(name, stream)], agent_id=AGENT_ID)
+
+
+def _upload_spooled(client: PooledGrinningCatClient, uploaded_file: io.BytesIO, name: str):
+    # a buffered reader hides the buffer of the file, as the members of an archive do
+    with open_upload(io.BufferedReader(io.BytesIO(uploaded_file.getvalue()))) as stream:
+        client.rabbit_hole.post_file_streams(files=[(name, stream)], agent_id=AGENT_ID)
+
+
+PATHS: Dict[str, Callable[[PooledGrinningCatClient, io.BytesIO, str], None]] = {
+    "temp_file": _upload_temp_file,
+    "stream": _upload_stream,
+    "spooled": _upload_spooled,
+}
+
+
+def benchmark_upload(client: PooledGrinningCatClient, path: str, size: int) -> Dict[str, float]:
+    """
+    Upload a file of `size` bytes, held in memory as Streamlit holds the uploaded files, through a path. The memory is
+    traced in an upload of its own, as tracing slows the upload down.
+    """
+    uploaded_file = io.BytesIO(os.urandom(size))
+    name = f"benchmark-{size}.bin"
+
+    started_at = time.perf_counter()
+    PATHS[path](client, uploaded_file, name)
+    wall_time = time.perf_counter() - started_at
+
+    tracemalloc.start()
+    try:
+        PATHS[path](client, uploaded_file, name)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"wall_time": wall_time, "peak_memory": peak_memory}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the upload paths of the Knowledge Base")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1, 16, 128], help="Sizes of the files, in MB")
+    parser.add_argument("--paths", nargs="+", choices=list(PATHS), default=list(PATHS))
+    args = parser.parse_args()
+
+    port = free_port()
+    backend = start_backend(port, BACKEND_OPTIONS)
+    try:
+        credentials = login(port)
+        client = PooledGrinningCatClient(Configuration(host="127.0.0.1", port=port, auth_key=credentials["token"]))
+        with contextlib.closing(client):
+            print(f"{'path':<12}{'size (MB)':>10}{'wall time (s)':>16}{'peak memory (MB)':>18}")
+            for size in args.sizes:
+                for path in args.paths:
+                    result = benchmark_upload(client, path, size * 2 ** 20)
+                    print(f"{path:<12}{size:>10}{result['wall_time']:>16.3f}{result['peak_memory'] / 2 ** 20:>18.1f}")
+    finally:
+        backend.terminate()
+        backend.wait()
+
+
+if __name__ == "__main__":
+    main()
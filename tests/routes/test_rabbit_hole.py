@@ -0,0 +1,22 @@
+from datetime import datetime, timedelta, timezone
+
+from grinning_cat_python_sdk.models.api.file_managers import FileResponse
+
+from app.routes.rabbit_hole import _match_files
+
+
+def _file(name: str, size: int, days_ago: int = 0) -> FileResponse:
+    last_modified = (datetime.now(timezone.utc) - timedelta(days=days_ago)).isoformat()
+    return FileResponse(path=f"agent/{name}", name=name, size=size, last_modified=last_modified)
+
+
+FILES = [_file("empty.pdf", 0, days_ago=40), _file("small.pdf", 512), _file("large.PDF", 4096, days_ago=40)]
+
+
+def test_empty_files_match_without_a_size_filter():
+    assert [file.name for file in _match_files(FILES, "*.pdf", 0, 0)] == ["empty.pdf", "small.pdf", "large.PDF"]
+    assert [file.name for file in _match_files(FILES, "", 30, 0)] == ["empty.pdf", "large.PDF"]
+
+
+def test_size_filter_matches_larger_files_only():
+    assert [file.name for file in _match_files(FILES, "*.pdf", 0, 1)] == ["large.PDF"]
@@ -0,0 +1,18 @@
+from app import cache
+from app.cache import SWEEP_MIN_ENTRIES, TTLCache
+
+
+def test_expired_entries_are_swept_on_write(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    ttl_cache = TTLCache()
+
+    for i in range(SWEEP_MIN_ENTRIES - 1):
+        ttl_cache.get(("agent", "kind", f"scope-{i}"), lambda: i, ttl=30)
+    now[0] += 60
+
+    assert ttl_cache.get(("agent", "kind", "fresh"), lambda: "value", ttl=30) == "value"
+    assert len(ttl_cache) == 1
+
+    # the live entries survive the sweep
+    assert ttl_cache.get(("agent", "kind", "fresh"), lambda: "reloaded", ttl=30) == "value"
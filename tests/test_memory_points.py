@@ -0,0 +1,92 @@
+import io
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+
+from app.memory_points import _points_table, cluster_duplicates, points_schema, read_point_batches, upsert_points
+
+POINTS = [
+    {"id": "p1", "payload": {"page_content": "first", "metadata": {"source": "a.pdf"}}, "vector": [0.1, 0.2, 0.3]},
+    {"id": "p2", "payload": {"page_content": "second", "metadata": {}}, "vector": None},
+    {"id": "p3", "payload": {"page_content": "third", "metadata": {"source": "b.pdf"}}, "vector": [0.4, 0.5, 0.6]},
+]
+
+
+def _export(points) -> io.BytesIO:
+    destination = io.BytesIO()
+    schema = points_schema(3)
+    with pq.ParquetWriter(destination, schema) as writer:
+        writer.write_table(_points_table(points, schema))
+    destination.seek(0)
+    return destination
+
+
+def test_export_round_trips_points_without_a_vector():
+    table = pq.read_table(_export(POINTS))
+
+    assert table.column("id").to_pylist() == ["p1", "p2", "p3"]
+    assert table.column("has_vector").to_pylist() == [True, False, True]
+    assert table.column("vector").to_pylist()[1] == [0.0, 0.0, 0.0]
+    assert json.loads(table.column("metadata").to_pylist()[0]) == {"source": "a.pdf"}
+
+
+def test_import_reads_the_export():
+    batches = list(read_point_batches(_export(POINTS), "points.parquet", batch_size=2, dimension=3))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [point["id"] for batch in batches for point in batch] == ["p1", "p2", "p3"]
+    assert batches[0][1] == {"id": "p2", "content": "second", "metadata": {}}
+
+
+def test_import_reports_the_line_of_an_invalid_point():
+    source = io.BytesIO(b'{"id": "p1", "content": "first"}\n\n{"id": "p2", "content": \n')
+
+    with pytest.raises(ValueError, match="line 3"):
+        list(read_point_batches(source, "points.jsonl", batch_size=10, dimension=None))
+
+
+class _MemoryEndpoint:
+    """Points API editing only the existing points, and creating the other ones with IDs of its own."""
+    def __init__(self):
+        self.created = []
+        self.edited = []
+
+    def post_memory_point(self, collection, agent_id, user_id, memory_point):
+        self.created.append(memory_point.metadata)
+        return SimpleNamespace(id=f"new-{len(self.created)}")
+
+    def put_memory_point(self, collection, agent_id, user_id, memory_point, point_id):
+        self.edited.append((point_id, memory_point.metadata))
+
+
+def test_upsert_creates_the_new_points_and_edits_the_existing_ones():
+    client = SimpleNamespace(memory=_MemoryEndpoint())
+    point_ids = {"p1": "p1"}
+    points = [
+        {"id": "p1", "content": "first", "metadata": {}},
+        {"id": "p2", "content": "second", "metadata": {"source": "a.pdf"}},
+    ]
+
+    upsert_points(client, "agent", "declarative", points, point_ids)
+    assert client.memory.edited == [("p1", {})]
+    assert client.memory.created == [{"source": "a.pdf", "imported_id": "p2"}]
+    assert point_ids == {"p1": "p1", "p2": "new-1"}
+
+    # importing the points again, e.g. resuming an import, edits the created point instead of duplicating it
+    upsert_points(client, "agent", "declarative", points[1:], point_ids)
+    assert len(client.memory.created) == 1
+    assert client.memory.edited[-1] == ("new-1", {"source": "a.pdf", "imported_id": "p2"})
+
+
+def test_duplicates_are_clustered_across_tiles():
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((10, 8)).astype(np.float32)
+    # a chain of duplicates spanning three tiles, and a pair within a tile
+    vectors[3] = vectors[0] * 2
+    vectors[7] = vectors[3] + 1e-4
+    vectors[5] = vectors[4]
+
+    assert cluster_duplicates(vectors, 0.99, block_size=3) == [[0, 3, 7], [4, 5]]
@@ -0,0 +1,46 @@
+import pytest
+
+from app import transport
+from app.transport import BackendUnavailableError, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(transport.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _open_breaker() -> CircuitBreaker:
+    circuit_breaker = CircuitBreaker(failure_threshold=1, backoff_base=1, backoff_max=60, probe_timeout=10)
+    circuit_breaker.record_failure(circuit_breaker.before_request())
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+    return circuit_breaker
+
+
+def test_hanging_probe_opens_the_breaker_again(clock):
+    circuit_breaker = _open_breaker()
+
+    clock[0] += 2
+    circuit_breaker.before_request()  # the probe, never completing
+    with pytest.raises(BackendUnavailableError):
+        circuit_breaker.before_request()
+
+    clock[0] += 10
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+    clock[0] += 60
+    circuit_breaker.record_success(circuit_breaker.before_request())
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_results_of_requests_started_in_a_previous_state_are_ignored(clock):
+    circuit_breaker = CircuitBreaker(failure_threshold=1, backoff_base=1, backoff_max=60, probe_timeout=10)
+    slow_request = circuit_breaker.before_request()
+    circuit_breaker.record_failure(circuit_breaker.before_request())
+
+    clock[0] += 2
+    circuit_breaker.record_success(circuit_breaker.before_request())
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+    circuit_breaker.record_failure(slow_request)
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
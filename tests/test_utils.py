@@ -0,0 +1,48 @@
+from app.utils import KeepAliveHttpClient, fetch_point_page, iter_point_pages
+
+
+def test_client_does_not_leak_the_scope_of_a_previous_call():
+    http_client = KeepAliveHttpClient(host="localhost", port=1865, apikey="key")
+
+    session = http_client.get_client("agent-1", "user-1", "chat-1")
+    assert session.headers["X-User-ID"] == "user-1"
+    assert session.headers["X-Chat-ID"] == "chat-1"
+
+    session = http_client.get_client("agent-2")
+    assert session.headers["X-Agent-ID"] == "agent-2"
+    assert "X-User-ID" not in session.headers
+    assert "X-Chat-ID" not in session.headers
+    assert session.headers["Authorization"] == "Bearer key"
+
+
+class _PointsEndpoint:
+    """Points endpoint ignoring `with_vectors`, as a backend not supporting it does."""
+    def __init__(self, pages):
+        self.pages = pages
+        self.queries = []
+
+    def get_custom(self, url, agent_id, query=None):
+        self.queries.append(dict(query))
+        page = self.pages[query.get("offset", 0)]
+        return {"points": [dict(point) for point in page["points"]], "next_offset": page["next_offset"]}
+
+
+class _Client:
+    def __init__(self, pages):
+        self.custom = _PointsEndpoint(pages)
+
+
+def test_point_pages_drop_the_vectors_sent_although_not_requested():
+    pages = {
+        0: {"points": [{"id": "p1", "payload": {}, "vector": [0.1, 0.2]}], "next_offset": 1},
+        1: {"points": [{"id": "p2", "payload": {}, "vector": [0.3, 0.4]}], "next_offset": None},
+    }
+    client = _Client(pages)
+
+    point_pages = iter_point_pages(client, "agent", "declarative", {"with_vectors": "false"})
+    points = [point for page in point_pages for point in page]
+    assert points == [{"id": "p1", "payload": {}}, {"id": "p2", "payload": {}}]
+    assert [query.get("offset") for query in client.custom.queries] == [None, 1]
+
+    page = fetch_point_page(client, "agent", "declarative", {"with_vectors": "true"})
+    assert page["points"][0]["vector"] == [0.1, 0.2]